@@ -1,8 +1,18 @@
-import difflib
-import re
-from dataclasses import dataclass
+import argparse
+import hashlib
+import json
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from datetime import datetime
 from pathlib import Path
-from typing import Dict
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# str.splitlines()가 줄 경계로 인식하는 문자
+LINE_BOUNDARIES = "\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029"
+
+Opcode = Tuple[str, int, int, int, int]
 
 
 @dataclass
@@ -29,33 +39,50 @@ class TextComparator:
             return f.read()
 
     def get_text_stats(self, text: str) -> TextStats:
+        # 문자 빈도를 한 번에 센 뒤, 서로 다른 문자 종류별로만 분류
+        char_counts = Counter(text)
+        korean = english = numbers = spaces = line_breaks = 0
+        for char, count in char_counts.items():
+            if "가" <= char <= "힣":
+                korean += count
+            elif "a" <= char <= "z" or "A" <= char <= "Z":
+                english += count
+            elif "0" <= char <= "9":
+                numbers += count
+            elif char.isspace():
+                spaces += count
+                if char in LINE_BOUNDARIES:
+                    line_breaks += count
+
+        lines = line_breaks
+        if "\r" in char_counts:
+            lines -= text.count("\r\n")
+        if text and text[-1] not in LINE_BOUNDARIES:
+            lines += 1
+
         return TextStats(
             total_chars=len(text),
-            chars_no_space=len(
-                text.replace(" ", "").replace("\n", "").replace("\t", "")
-            ),
-            korean_chars=len(re.findall("[가-힣]", text)),
-            english_chars=len(re.findall("[a-zA-Z]", text)),
-            numbers=len(re.findall("[0-9]", text)),
-            spaces=len(re.findall("[\s]", text)),
-            lines=len(text.splitlines()),
-            words=len(re.findall(r"\S+", text)),
+            chars_no_space=len(text)
+            - char_counts[" "]
+            - char_counts["\n"]
+            - char_counts["\t"],
+            korean_chars=korean,
+            english_chars=english,
+            numbers=numbers,
+            spaces=spaces,
+            lines=lines,
+            words=len(text.split()),
         )
 
     def compare_files(self) -> Dict:
         stats1 = self.get_text_stats(self.file1_content)
         stats2 = self.get_text_stats(self.file2_content)
 
-        d = difflib.Differ()
-        diff = list(
-            d.compare(self.file1_content.splitlines(), self.file2_content.splitlines())
+        opcodes = diff_lines(
+            self.file1_content.splitlines(), self.file2_content.splitlines()
         )
-
-        changes = {
-            "added": len([line for line in diff if line.startswith("+ ")]),
-            "removed": len([line for line in diff if line.startswith("- ")]),
-            "changed": len([line for line in diff if line.startswith("? ")]),
-        }
+        changes = count_changes(opcodes)
+        largest = largest_changes(opcodes)
 
         return {
             "file1_name": Path(self.file1_path).name,
@@ -63,7 +90,277 @@ class TextComparator:
             "file1_stats": stats1,
             "file2_stats": stats2,
             "changes": changes,
+            "largest_changes": largest,
+        }
+
+
+def _middle_snake(
+    a: Sequence[int], a0: int, a1: int, b: Sequence[int], b0: int, b1: int
+) -> Tuple[int, int, int, int]:
+    """Myers 선형 공간 알고리즘에서 편집 경로 가운데의 snake (x, y, u, v)를 반환
+
+    좌표는 (a0, b0) 기준 상대 좌표이며, (x, y) -> (u, v) 구간은 대각선 일치 구간이다.
+    """
+    n, m = a1 - a0, b1 - b0
+    delta = n - m
+    odd = delta & 1
+    max_d = (n + m + 1) // 2
+    offset = max_d + 1
+    forward = [0] * (2 * offset + 1)
+    backward = [0] * (2 * offset + 1)
+
+    for d in range(max_d + 1):
+        for k in range(-d, d + 1, 2):
+            if k == -d or (k != d and forward[offset + k - 1] < forward[offset + k + 1]):
+                x = forward[offset + k + 1]
+            else:
+                x = forward[offset + k - 1] + 1
+            y = x - k
+            start_x, start_y = x, y
+            while x < n and y < m and a[a0 + x] == b[b0 + y]:
+                x += 1
+                y += 1
+            forward[offset + k] = x
+            c = delta - k
+            if odd and -(d - 1) <= c <= d - 1 and x + backward[offset + c] >= n:
+                return start_x, start_y, x, y
+
+        for c in range(-d, d + 1, 2):
+            if c == -d or (c != d and backward[offset + c - 1] < backward[offset + c + 1]):
+                x = backward[offset + c + 1]
+            else:
+                x = backward[offset + c - 1] + 1
+            y = x - c
+            start_x, start_y = x, y
+            while x < n and y < m and a[a1 - 1 - x] == b[b1 - 1 - y]:
+                x += 1
+                y += 1
+            backward[offset + c] = x
+            k = delta - c
+            if not odd and -d <= k <= d and x + forward[offset + k] >= n:
+                return n - x, m - y, n - start_x, m - start_y
+
+    raise AssertionError("middle snake not found")
+
+
+def _matching_runs(a: Sequence[int], b: Sequence[int]) -> List[Tuple[int, int, int]]:
+    """a, b의 최장 공통 부분열을 (i, j, 길이) 일치 구간 목록으로 반환 (Myers 선형 공간 분할)"""
+    runs: List[Tuple[int, int, int]] = []
+    # 왼쪽 구간부터 처리되도록 스택에 오른쪽 -> 왼쪽 순으로 쌓음
+    stack: List[Tuple[int, ...]] = [(0, len(a), 0, len(b))]
+    while stack:
+        task = stack.pop()
+        if len(task) == 3:
+            runs.append(task)
+            continue
+        a0, a1, b0, b1 = task
+
+        prefix = 0
+        while a0 + prefix < a1 and b0 + prefix < b1 and a[a0 + prefix] == b[b0 + prefix]:
+            prefix += 1
+        if prefix:
+            runs.append((a0, b0, prefix))
+            a0, b0 = a0 + prefix, b0 + prefix
+
+        suffix = 0
+        while a1 - suffix > a0 and b1 - suffix > b0 and a[a1 - suffix - 1] == b[b1 - suffix - 1]:
+            suffix += 1
+        a1, b1 = a1 - suffix, b1 - suffix
+        if suffix:
+            stack.append((a1, b1, suffix))
+
+        # 접두/접미부를 잘라낸 뒤 한쪽이 비면 나머지는 모두 삽입 또는 삭제
+        if a0 == a1 or b0 == b1:
+            continue
+
+        x, y, u, v = _middle_snake(a, a0, a1, b, b0, b1)
+        stack.append((a0 + u, a1, b0 + v, b1))
+        if u > x:
+            stack.append((a0 + x, b0 + y, u - x))
+        stack.append((a0, a0 + x, b0, b0 + y))
+
+    return runs
+
+
+def diff_lines(lines1: Sequence[str], lines2: Sequence[str]) -> List[Opcode]:
+    """두 줄 목록의 최소 편집 스크립트를 SequenceMatcher.get_opcodes() 형식으로 반환
+
+    줄을 정수 ID로 바꿔 비교하고, 상대 문서에 아예 없는 줄은 일치할 수 없으므로 미리
+    제외한 뒤 Myers의 선형 공간 O(ND) 알고리즘을 적용한다.
+    """
+    line_ids: Dict[str, int] = {}
+    ids1 = [line_ids.setdefault(line, len(line_ids)) for line in lines1]
+    ids2 = [line_ids.setdefault(line, len(line_ids)) for line in lines2]
+
+    shared = set(ids1).intersection(ids2)
+    index1 = [i for i, line_id in enumerate(ids1) if line_id in shared]
+    index2 = [j for j, line_id in enumerate(ids2) if line_id in shared]
+
+    # 걸러낸 좌표의 일치 구간을 원래 줄 번호의 연속 구간으로 되돌림
+    blocks: List[List[int]] = []
+    for i, j, length in _matching_runs([ids1[i] for i in index1], [ids2[j] for j in index2]):
+        for t in range(length):
+            orig_i, orig_j = index1[i + t], index2[j + t]
+            last = blocks[-1] if blocks else None
+            if last and last[0] + last[2] == orig_i and last[1] + last[2] == orig_j:
+                last[2] += 1
+            else:
+                blocks.append([orig_i, orig_j, 1])
+    blocks.append([len(ids1), len(ids2), 0])
+
+    opcodes: List[Opcode] = []
+    i = j = 0
+    for block_i, block_j, length in blocks:
+        if i < block_i and j < block_j:
+            opcodes.append(("replace", i, block_i, j, block_j))
+        elif i < block_i:
+            opcodes.append(("delete", i, block_i, j, j))
+        elif j < block_j:
+            opcodes.append(("insert", i, i, j, block_j))
+        if length:
+            opcodes.append(("equal", block_i, block_i + length, block_j, block_j + length))
+        i, j = block_i + length, block_j + length
+    return opcodes
+
+
+def count_changes(opcodes: Sequence[Opcode]) -> Dict[str, int]:
+    """추가/삭제 줄 수와, replace 구간에서 서로 짝지어지는 변경 줄 수를 집계"""
+    changes = {"added": 0, "removed": 0, "changed": 0}
+    for tag, i1, i2, j1, j2 in opcodes:
+        if tag == "equal":
+            continue
+        changes["removed"] += i2 - i1
+        changes["added"] += j2 - j1
+        if tag == "replace":
+            changes["changed"] += min(i2 - i1, j2 - j1)
+    return changes
+
+
+def largest_changes(opcodes: Sequence[Opcode], limit: int = 5) -> List[Dict]:
+    """변경 줄 수가 가장 많은 구간 limit개 (줄 번호는 1부터, 끝 포함)"""
+    regions = [
+        {
+            "tag": tag,
+            "file1_lines": [i1 + 1, i2],
+            "file2_lines": [j1 + 1, j2],
+            "size": (i2 - i1) + (j2 - j1),
+        }
+        for tag, i1, i2, j1, j2 in opcodes
+        if tag != "equal"
+    ]
+    regions.sort(key=lambda region: -region["size"])
+    return regions[:limit]
+
+
+def file_digest(file_path) -> str:
+    sha256 = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            sha256.update(block)
+    return sha256.hexdigest()
+
+
+def find_pairs(raw_dir, processed_dir=None, prefix: str = "processed_") -> List[Tuple[Path, Path]]:
+    """원본 텍스트와 정제 텍스트 쌍 찾기 (processed_<이름> 또는 다른 디렉터리의 같은 이름)"""
+    raw_dir = Path(raw_dir)
+    processed_dir = Path(processed_dir) if processed_dir else raw_dir
+
+    pairs = []
+    for raw_path in sorted(raw_dir.glob("*.txt")):
+        if raw_path.name.startswith(prefix):
+            continue
+        candidates = [processed_dir / f"{prefix}{raw_path.name}"]
+        if processed_dir != raw_dir:
+            candidates.append(processed_dir / raw_path.name)
+        processed_path = next((path for path in candidates if path.exists()), None)
+        if processed_path is not None:
+            pairs.append((raw_path, processed_path))
+    return pairs
+
+
+def _compare_pair(file1_path: str, file2_path: str) -> Dict:
+    comparison = TextComparator(file1_path, file2_path).compare_files()
+    return {
+        "file1_stats": asdict(comparison["file1_stats"]),
+        "file2_stats": asdict(comparison["file2_stats"]),
+        "changes": comparison["changes"],
+        "largest_changes": comparison["largest_changes"],
+    }
+
+
+def compare_corpus(
+    raw_dir,
+    processed_dir=None,
+    report_path="comparison_report.json",
+    cache_path: Optional[str] = "comparison_cache.json",
+    workers: Optional[int] = None,
+    prefix: str = "processed_",
+) -> Dict:
+    """디렉터리의 모든 원본/정제 쌍을 프로세스 풀에서 비교하고 하나의 JSON 보고서로 저장
+
+    파일 통계와 쌍별 비교 결과는 내용 해시를 키로 캐시하므로, 내용이 바뀌지 않은
+    쌍은 다시 읽거나 비교하지 않는다.
+    """
+    cache = {"stats": {}, "pairs": {}}
+    if cache_path and os.path.exists(cache_path):
+        with open(cache_path, "r", encoding="utf-8") as f:
+            cache = json.load(f)
+
+    entries = []
+    to_compare = {}
+    for raw_path, processed_path in find_pairs(raw_dir, processed_dir, prefix):
+        hash1, hash2 = file_digest(raw_path), file_digest(processed_path)
+        entry = {
+            "file1": str(raw_path),
+            "file2": str(processed_path),
+            "file1_hash": hash1,
+            "file2_hash": hash2,
+            "cached": f"{hash1}:{hash2}" in cache["pairs"],
         }
+        entries.append(entry)
+        if not entry["cached"]:
+            to_compare[f"{hash1}:{hash2}"] = (str(raw_path), str(processed_path))
+
+    if to_compare:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                key: executor.submit(_compare_pair, *paths) for key, paths in to_compare.items()
+            }
+            for key, future in futures.items():
+                result = future.result()
+                hash1, hash2 = key.split(":")
+                cache["stats"][hash1] = result["file1_stats"]
+                cache["stats"][hash2] = result["file2_stats"]
+                cache["pairs"][key] = {
+                    "changes": result["changes"],
+                    "largest_changes": result["largest_changes"],
+                }
+
+    totals = {"pairs": len(entries), "cached": 0, "added": 0, "removed": 0, "changed": 0}
+    for entry in entries:
+        pair = cache["pairs"][f"{entry['file1_hash']}:{entry['file2_hash']}"]
+        entry["file1_stats"] = cache["stats"][entry["file1_hash"]]
+        entry["file2_stats"] = cache["stats"][entry["file2_hash"]]
+        entry.update(pair)
+        totals["cached"] += entry["cached"]
+        for key in ("added", "removed", "changed"):
+            totals[key] += pair["changes"][key]
+
+    report = {
+        "generated_at": datetime.now().isoformat(),
+        "totals": totals,
+        "pairs": entries,
+    }
+    with open(report_path, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    if cache_path:
+        with open(cache_path, "w", encoding="utf-8") as f:
+            json.dump(cache, f, ensure_ascii=False)
+
+    print(
+        f"{totals['pairs']}개 쌍 비교 완료 (캐시 사용 {totals['cached']}개). '{report_path}'에 저장되었습니다."
+    )
+    return report
 
 
 def format_simple_comparison(comparison: Dict) -> str:
@@ -88,10 +385,28 @@ def format_simple_comparison(comparison: Dict) -> str:
     return "\n".join(result)
 
 
-if __name__ == "__main__":
-    file1_path = "RAG/재무보고를위한개념체계.txt"
-    file2_path = "RAG/processed_재무보고를위한개념체계.txt"
+def main():
+    parser = argparse.ArgumentParser(description="원본/정제 텍스트 비교")
+    parser.add_argument("file1", nargs="?", default="RAG/재무보고를위한개념체계.txt")
+    parser.add_argument("file2", nargs="?", default="RAG/processed_재무보고를위한개념체계.txt")
+    parser.add_argument("--batch", metavar="RAW_DIR", help="디렉터리의 모든 쌍을 비교")
+    parser.add_argument("--processed-dir", default=None, help="정제 텍스트 디렉터리 (기본: RAW_DIR)")
+    parser.add_argument("--prefix", default="processed_", help="정제 파일명 접두어")
+    parser.add_argument("--report", default="comparison_report.json", help="보고서 경로")
+    parser.add_argument("--cache", default="comparison_cache.json", help="해시 캐시 경로")
+    parser.add_argument("--workers", type=int, default=None, help="프로세스 수")
+    args = parser.parse_args()
+
+    if args.batch:
+        compare_corpus(
+            args.batch, args.processed_dir, args.report, args.cache, args.workers, args.prefix
+        )
+        return
 
-    comparator = TextComparator(file1_path, file2_path)
+    comparator = TextComparator(args.file1, args.file2)
     comparison = comparator.compare_files()
     print(format_simple_comparison(comparison))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,227 @@
+import math
+import re
+import unicodedata
+from array import array
+from collections import Counter
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# 문단번호 (예: "4.26")는 n-gram으로 쪼개지 않고 하나의 용어로 색인
+PARAGRAPH_NUM_PATTERN = re.compile(r"\d+\.\d+")
+TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+
+def _encode_varint(value: int, out: bytearray):
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _decode_varints(data: bytearray, start: int, end: int) -> List[int]:
+    values = []
+    value = shift = 0
+    for pos in range(start, end):
+        byte = data[pos]
+        value |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+        else:
+            values.append(value)
+            value = shift = 0
+    return values
+
+
+def extract_terms(text: str, ngram_sizes: Sequence[int] = (2, 3)) -> List[str]:
+    """형태소 분석기 없이 한국어에 쓸 수 있도록 어절 단위 문자 n-gram을 추출"""
+    text = unicodedata.normalize("NFKC", text).lower()
+    terms = PARAGRAPH_NUM_PATTERN.findall(text)
+
+    for token in TOKEN_PATTERN.findall(text):
+        if len(token) < min(ngram_sizes):
+            terms.append(token)
+            continue
+        for n in ngram_sizes:
+            terms.extend(token[i : i + n] for i in range(len(token) - n + 1))
+    return terms
+
+
+class LexicalIndex:
+    """문자 n-gram 기반 BM25 역색인
+
+    포스팅은 용어별 객체 대신 하나의 bytearray에 (문서번호 차분, 빈도) 쌍을
+    varint로 이어 붙이고, 용어별 시작 위치만 array로 보관한다.
+    """
+
+    def __init__(
+        self,
+        ngram_sizes: Sequence[int] = (2, 3),
+        k1: float = 1.2,
+        b: float = 0.75,
+    ):
+        self.ngram_sizes = tuple(ngram_sizes)
+        self.k1 = k1
+        self.b = b
+        self.doc_keys: List[str] = []
+        self.doc_lengths = array("I")
+        self.term_ids: Dict[str, int] = {}
+        self.doc_freqs = array("I")
+        self.postings = bytearray()
+        self.posting_offsets = array("Q", [0])
+        self.avg_doc_length = 0.0
+
+    @classmethod
+    def from_mapping(cls, content_mapping: Dict[str, str], **kwargs) -> "LexicalIndex":
+        """process_content()가 만든 {문단번호: 내용} 매핑으로 색인 생성"""
+        index = cls(**kwargs)
+        index.build(content_mapping.items())
+        return index
+
+    def build(self, documents: Iterable[Tuple[str, str]]):
+        postings: Dict[str, List[Tuple[int, int]]] = {}
+        for doc_id, (key, text) in enumerate(documents):
+            # 문단번호 자체도 검색되도록 본문 앞에 붙여 색인
+            terms = Counter(extract_terms(f"{key} {text}", self.ngram_sizes))
+            self.doc_keys.append(key)
+            self.doc_lengths.append(sum(terms.values()))
+            for term, tf in terms.items():
+                postings.setdefault(term, []).append((doc_id, tf))
+
+        for term, entries in postings.items():
+            self.term_ids[term] = len(self.doc_freqs)
+            self.doc_freqs.append(len(entries))
+            previous = 0
+            for doc_id, tf in entries:
+                _encode_varint(doc_id - previous, self.postings)
+                _encode_varint(tf, self.postings)
+                previous = doc_id
+            self.posting_offsets.append(len(self.postings))
+
+        total = sum(self.doc_lengths)
+        self.avg_doc_length = total / len(self.doc_lengths) if self.doc_lengths else 0.0
+
+    def _postings(self, term_id: int) -> List[Tuple[int, int]]:
+        values = _decode_varints(
+            self.postings,
+            self.posting_offsets[term_id],
+            self.posting_offsets[term_id + 1],
+        )
+        entries = []
+        doc_id = 0
+        for i in range(0, len(values), 2):
+            doc_id += values[i]
+            entries.append((doc_id, values[i + 1]))
+        return entries
+
+    def search(self, query: str, top_k: int = 10) -> List[Tuple[str, float]]:
+        """BM25 점수 상위 top_k 문단을 (문단번호, 점수)로 반환"""
+        num_docs = len(self.doc_keys)
+        scores: Dict[int, float] = {}
+
+        for term, qtf in Counter(extract_terms(query, self.ngram_sizes)).items():
+            term_id = self.term_ids.get(term)
+            if term_id is None:
+                continue
+            df = self.doc_freqs[term_id]
+            idf = math.log(1 + (num_docs - df + 0.5) / (df + 0.5))
+            for doc_id, tf in self._postings(term_id):
+                norm = self.k1 * (
+                    1 - self.b + self.b * self.doc_lengths[doc_id] / self.avg_doc_length
+                )
+                scores[doc_id] = scores.get(doc_id, 0.0) + qtf * idf * (
+                    tf * (self.k1 + 1) / (tf + norm)
+                )
+
+        ranked = sorted(scores.items(), key=lambda item: -item[1])[:top_k]
+        return [(self.doc_keys[doc_id], score) for doc_id, score in ranked]
+
+    def memory_bytes(self) -> int:
+        return (
+            len(self.postings)
+            + self.posting_offsets.itemsize * len(self.posting_offsets)
+            + self.doc_freqs.itemsize * len(self.doc_freqs)
+            + self.doc_lengths.itemsize * len(self.doc_lengths)
+        )
+
+
+def reciprocal_rank_fusion(
+    rankings: Sequence[Sequence[Tuple[str, float]]], k: int = 60
+) -> List[Tuple[str, float]]:
+    """여러 검색 결과 순위를 RRF 점수(sum 1 / (k + rank))로 결합"""
+    fused: Dict[str, float] = {}
+    for ranking in rankings:
+        for rank, (key, _) in enumerate(ranking, start=1):
+            fused[key] = fused.get(key, 0.0) + 1.0 / (k + rank)
+    return sorted(fused.items(), key=lambda item: -item[1])
+
+
+class HybridRetriever:
+    """BM25 역색인과 dense 벡터 검색을 RRF로 결합하는 검색기"""
+
+    def __init__(
+        self,
+        lexical_index: LexicalIndex,
+        dense_vectors: Optional[Dict[str, np.ndarray]] = None,
+        encoder: Optional[Callable[[str], np.ndarray]] = None,
+        rrf_k: int = 60,
+    ):
+        self.lexical_index = lexical_index
+        self.encoder = encoder
+        self.rrf_k = rrf_k
+        self.dense_keys: List[str] = []
+        self.dense_matrix: Optional[np.ndarray] = None
+        if dense_vectors:
+            self.dense_keys = list(dense_vectors.keys())
+            matrix = np.asarray([dense_vectors[k] for k in self.dense_keys], dtype=np.float32)
+            self.dense_matrix = matrix / np.linalg.norm(matrix, axis=1, keepdims=True)
+
+    def dense_search(self, query: str, top_k: int = 10) -> List[Tuple[str, float]]:
+        query_vector = np.asarray(self.encoder(query), dtype=np.float32)
+        scores = self.dense_matrix @ (query_vector / np.linalg.norm(query_vector))
+        order = np.argsort(-scores)[:top_k]
+        return [(self.dense_keys[i], float(scores[i])) for i in order]
+
+    def search(
+        self, query: str, top_k: int = 10, candidates: int = 50, mode: str = "hybrid"
+    ) -> List[Tuple[str, float]]:
+        """mode: "hybrid" | "lexical" | "dense"
+
+        문단번호만으로 된 질의나 인코더/벡터가 없는 경우에는 쿼리 임베딩 없이
+        역색인만 조회하는 fast path를 사용한다.
+        """
+        stripped = query.strip()
+        if PARAGRAPH_NUM_PATTERN.fullmatch(stripped) and stripped in self.lexical_index.doc_keys:
+            return [(stripped, float("inf"))]
+
+        dense_available = self.encoder is not None and self.dense_matrix is not None
+        if mode == "lexical" or not dense_available:
+            return self.lexical_index.search(query, top_k)
+        if mode == "dense":
+            return self.dense_search(query, top_k)
+
+        lexical = self.lexical_index.search(query, candidates)
+        dense = self.dense_search(query, candidates)
+        return reciprocal_rank_fusion([lexical, dense], k=self.rrf_k)[:top_k]
+
+
+def main():
+    from vectorize import KIFRSVectorizer
+
+    vectorizer = KIFRSVectorizer()
+    content_mapping = vectorizer.process_content(
+        "RAG/processed_재무보고를위한개념체계.txt"
+    )
+    content_vectors = np.load("vectors/content_vectors.npy", allow_pickle=True).item()
+
+    retriever = HybridRetriever(
+        LexicalIndex.from_mapping(content_mapping),
+        dense_vectors=content_vectors,
+        encoder=vectorizer.model.encode,
+    )
+    for query in ["제거", "충실한 표현", "4.26"]:
+        print(query, retriever.search(query, top_k=5))
+
+
+if __name__ == "__main__":
+    main()
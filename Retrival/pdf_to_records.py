@@ -0,0 +1,207 @@
+import argparse
+import json
+import re
+from collections import Counter
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple
+
+import fitz  # PyMuPDF의 모듈명은 'fitz'입니다.
+
+# 문단번호 (예: "1.1", "4.26", "SP1.1", "BC4.3A")
+PARAGRAPH_ID_PATTERN = re.compile(r"^((?:[A-Z]{1,3})?\d+\.\d+[A-Z]?)(?:\s+(.*))?$")
+CHAPTER_PATTERN = re.compile(r"^제\d+장\s+.+")
+PAGE_FOOTER_PATTERN = re.compile(r"^-\s*\d+\s*-$")
+
+# 페이지 위/아래 이 비율 안에 있는 블록은 머리글/바닥글로 간주
+HEADER_FOOTER_MARGIN = 0.06
+# 본문 글자 크기보다 이 배수 이상 크면 제목으로 간주
+HEADING_SIZE_RATIO = 1.1
+BOLD_FLAG = 16
+
+
+@dataclass
+class ParagraphRecord:
+    paragraph_id: str
+    section_path: str
+    page: int
+    text: str
+
+
+@dataclass
+class _OpenParagraph:
+    paragraph_id: str
+    section_path: str
+    page: int
+    lines: List[str] = field(default_factory=list)
+
+    def to_record(self) -> Optional[ParagraphRecord]:
+        text = "\n".join(self.lines).strip()
+        if not text:
+            # 목차처럼 번호만 나열된 경우는 버림
+            return None
+        return ParagraphRecord(self.paragraph_id, self.section_path, self.page, text)
+
+
+def _table_text(table) -> str:
+    rows = table.extract()
+    return "\n".join(
+        " | ".join((cell or "").replace("\n", " ").strip() for cell in row) for row in rows
+    )
+
+
+def _inside(bbox: Tuple[float, ...], area: Tuple[float, ...]) -> bool:
+    x0, y0, x1, y1 = bbox
+    cx, cy = (x0 + x1) / 2, (y0 + y1) / 2
+    return area[0] <= cx <= area[2] and area[1] <= cy <= area[3]
+
+
+class StructuredPDFExtractor:
+    """PyMuPDF 블록/스팬 레이아웃을 이용해 PDF를 한 번만 읽고 문단 단위 레코드를 생성
+
+    머리글/바닥글 제거, 문단번호와 장/절 제목 인식, 표 보존을 추출 단계에서 처리하므로
+    pdf_to_text.py -> preprocessing.py -> process_content()의 중간 파일이 필요 없다.
+    """
+
+    def __init__(self, detect_tables: bool = True):
+        self.detect_tables = detect_tables
+        self._size_counter: Counter = Counter()
+        self._chapter = ""
+        self._section = ""
+        self._current: Optional[_OpenParagraph] = None
+
+    @property
+    def section_path(self) -> str:
+        return " > ".join(part for part in (self._chapter, self._section) if part)
+
+    def _body_size(self) -> float:
+        if not self._size_counter:
+            return 0.0
+        return self._size_counter.most_common(1)[0][0]
+
+    def _page_items(self, page) -> List[Tuple[float, str, object]]:
+        """페이지의 (y 좌표, 종류, 내용) 목록을 읽기 순서대로 반환"""
+        height = page.rect.height
+        top, bottom = height * HEADER_FOOTER_MARGIN, height * (1 - HEADER_FOOTER_MARGIN)
+
+        tables = []
+        if self.detect_tables and hasattr(page, "find_tables"):
+            tables = list(page.find_tables().tables)
+        table_areas = [tuple(table.bbox) for table in tables]
+
+        items = [(table.bbox[1], "table", _table_text(table)) for table in tables]
+        for block in page.get_text("dict", sort=True)["blocks"]:
+            if block.get("type", 0) != 0:
+                continue
+            for line in block["lines"]:
+                spans = [span for span in line["spans"] if span["text"].strip()]
+                if not spans:
+                    continue
+                text = "".join(span["text"] for span in spans).strip()
+                x0, y0, x1, y1 = line["bbox"]
+                if y1 <= top or y0 >= bottom or PAGE_FOOTER_PATTERN.match(text):
+                    continue
+                if any(_inside(line["bbox"], area) for area in table_areas):
+                    continue
+                size = max(span["size"] for span in spans)
+                bold = all(span["flags"] & BOLD_FLAG for span in spans)
+                items.append((y0, "line", (text, round(size, 1), bold)))
+
+        items.sort(key=lambda item: item[0])
+        return items
+
+    def _close_paragraph(self) -> Optional[ParagraphRecord]:
+        record = self._current.to_record() if self._current else None
+        self._current = None
+        return record
+
+    def _is_heading(self, text: str, size: float, bold: bool) -> bool:
+        body_size = self._body_size()
+        larger = body_size and size >= body_size * HEADING_SIZE_RATIO
+        return (larger or bold) and len(text) <= 60 and not text.endswith(".")
+
+    def iter_records(self, pdf_path) -> Iterator[ParagraphRecord]:
+        with fitz.open(pdf_path) as pdf_document:
+            for page_index in range(len(pdf_document)):
+                page = pdf_document.load_page(page_index)
+                items = self._page_items(page)
+                # 제목 판별 전에 페이지 전체의 글자 크기 분포를 먼저 반영
+                for _, kind, content in items:
+                    if kind == "line":
+                        self._size_counter[content[1]] += len(content[0])
+
+                for _, kind, content in items:
+                    if kind == "table":
+                        if self._current:
+                            self._current.lines.append(content)
+                        continue
+
+                    text, size, bold = content
+
+                    if CHAPTER_PATTERN.match(text):
+                        record = self._close_paragraph()
+                        if record:
+                            yield record
+                        self._chapter, self._section = text, ""
+                        continue
+
+                    id_match = PARAGRAPH_ID_PATTERN.match(text)
+                    if id_match:
+                        record = self._close_paragraph()
+                        if record:
+                            yield record
+                        self._current = _OpenParagraph(
+                            id_match.group(1), self.section_path, page_index + 1
+                        )
+                        if id_match.group(2):
+                            self._current.lines.append(id_match.group(2))
+                        continue
+
+                    if self._is_heading(text, size, bold):
+                        record = self._close_paragraph()
+                        if record:
+                            yield record
+                        self._section = text
+                        continue
+
+                    if self._current:
+                        self._current.lines.append(text)
+
+        record = self._close_paragraph()
+        if record:
+            yield record
+
+
+def extract_records(pdf_path, output_jsonl_path, detect_tables: bool = True) -> int:
+    """PDF에서 문단 레코드를 추출해 JSONL로 저장하고 레코드 수를 반환"""
+    count = 0
+    extractor = StructuredPDFExtractor(detect_tables=detect_tables)
+    with open(output_jsonl_path, "w", encoding="utf-8") as f:
+        for record in extractor.iter_records(pdf_path):
+            f.write(json.dumps(asdict(record), ensure_ascii=False) + "\n")
+            count += 1
+
+    print(f"문단 레코드 {count}개 추출 완료. '{output_jsonl_path}'에 저장되었습니다.")
+    return count
+
+
+def main():
+    parser = argparse.ArgumentParser(description="K-IFRS 기준서 PDF -> 문단 JSONL")
+    parser.add_argument("input", help="PDF 파일 또는 PDF가 들어 있는 디렉터리")
+    parser.add_argument("output", help="출력 JSONL 파일 또는 출력 디렉터리")
+    parser.add_argument("--no-tables", action="store_true", help="표 인식 비활성화")
+    args = parser.parse_args()
+
+    if Path(args.input).is_dir():
+        output_dir = Path(args.output)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        for pdf_path in sorted(Path(args.input).glob("*.pdf")):
+            extract_records(
+                pdf_path, output_dir / f"{pdf_path.stem}.jsonl", not args.no_tables
+            )
+    else:
+        extract_records(args.input, args.output, not args.no_tables)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,25 +1,154 @@
+import argparse
+import json
+import os
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple
+
 import fitz  # PyMuPDF의 모듈명은 'fitz'입니다.
 
+# 작업 하나가 처리하는 최대 페이지 수
+PAGES_PER_TASK = 16
+
+
+def _extract_page_range(pdf_path: str, start: int, end: int) -> List[str]:
+    """워커 프로세스에서 문서를 직접 열어 [start, end) 페이지 텍스트를 추출"""
+    with fitz.open(pdf_path) as pdf_document:
+        return [pdf_document.load_page(i).get_text() for i in range(start, end)]
+
+
+def _page_ranges(page_count: int, pages_per_task: int) -> List[Tuple[int, int]]:
+    return [
+        (start, min(start + pages_per_task, page_count))
+        for start in range(0, page_count, pages_per_task)
+    ]
+
+
+def _iter_pages(
+    pdf_path: str,
+    page_count: int,
+    executor: Optional[Executor],
+    pages_per_task: int,
+    max_in_flight: int,
+) -> Iterator[Tuple[int, str]]:
+    """페이지 순서대로 (페이지 번호, 텍스트)를 생성. 동시에 대기하는 작업 수를 제한해 메모리를 일정하게 유지"""
+    ranges = _page_ranges(page_count, pages_per_task)
+
+    if executor is None:
+        for start, end in ranges:
+            yield from enumerate(_extract_page_range(pdf_path, start, end), start)
+        return
+
+    pending = deque()
+    remaining = iter(ranges)
+    for start, end in remaining:
+        pending.append((start, executor.submit(_extract_page_range, pdf_path, start, end)))
+        if len(pending) >= max_in_flight:
+            break
 
-def extract_text_from_pdf(pdf_path, output_txt_path):
-    # PDF 파일 열기
-    pdf_document = fitz.open(pdf_path)
-    all_text = ""
+    while pending:
+        start, future = pending.popleft()
+        next_range = next(remaining, None)
+        if next_range is not None:
+            pending.append(
+                (next_range[0], executor.submit(_extract_page_range, pdf_path, *next_range))
+            )
+        yield from enumerate(future.result(), start)
 
-    # 각 페이지 순회하며 텍스트 추출
-    for page_num in range(len(pdf_document)):
-        page = pdf_document.load_page(page_num)
-        text = page.get_text()
-        all_text += text
 
-    # 추출한 텍스트를 텍스트 파일로 저장
-    with open(output_txt_path, "w", encoding="utf-8") as txt_file:
-        txt_file.write(all_text)
+def extract_text_from_pdf(
+    pdf_path,
+    output_txt_path,
+    executor: Optional[Executor] = None,
+    workers: Optional[int] = None,
+    pages_per_task: int = PAGES_PER_TASK,
+):
+    """PDF 텍스트를 페이지 순서대로 파일에 스트리밍하고 페이지 경계를 사이드카 인덱스로 저장
+
+    사이드카(<output>.pages.json)에는 페이지별 바이트/문자 오프셋이 기록된다.
+    executor를 넘기면 여러 문서가 같은 프로세스 풀을 공유한다.
+    """
+    with fitz.open(pdf_path) as pdf_document:
+        page_count = len(pdf_document)
+
+    workers = workers or os.cpu_count() or 1
+    own_executor = executor is None and workers > 1 and page_count > pages_per_task
+    if own_executor:
+        executor = ProcessPoolExecutor(max_workers=workers)
+
+    pages = []
+    byte_offset = char_offset = 0
+    try:
+        with open(output_txt_path, "wb") as txt_file:
+            for page_num, text in _iter_pages(
+                str(pdf_path), page_count, executor, pages_per_task, workers * 2
+            ):
+                encoded = text.encode("utf-8")
+                txt_file.write(encoded)
+                pages.append(
+                    {
+                        "page": page_num + 1,
+                        "byte_start": byte_offset,
+                        "byte_end": byte_offset + len(encoded),
+                        "char_start": char_offset,
+                        "char_end": char_offset + len(text),
+                    }
+                )
+                byte_offset += len(encoded)
+                char_offset += len(text)
+    finally:
+        if own_executor:
+            executor.shutdown()
+
+    index_path = f"{output_txt_path}.pages.json"
+    with open(index_path, "w", encoding="utf-8") as index_file:
+        json.dump(
+            {"source": str(pdf_path), "page_count": page_count, "pages": pages},
+            index_file,
+            ensure_ascii=False,
+        )
 
     print(f"텍스트 추출 완료. '{output_txt_path}'에 저장되었습니다.")
+    return index_path
+
+
+def extract_directory(
+    input_dir, output_dir, workers: Optional[int] = None, pages_per_task: int = PAGES_PER_TASK
+) -> List[Path]:
+    """디렉터리의 모든 PDF를 하나의 프로세스 풀로 추출 (<stem>.txt)"""
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    pdf_paths = sorted(Path(input_dir).glob("*.pdf"))
+
+    outputs = []
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+        for pdf_path in pdf_paths:
+            output_txt_path = output_dir / f"{pdf_path.stem}.txt"
+            extract_text_from_pdf(
+                pdf_path, output_txt_path, executor=executor, pages_per_task=pages_per_task
+            )
+            outputs.append(output_txt_path)
+    return outputs
+
+
+def main():
+    parser = argparse.ArgumentParser(description="K-IFRS 기준서 PDF 텍스트 추출")
+    parser.add_argument("input", help="PDF 파일 또는 PDF가 들어 있는 디렉터리")
+    parser.add_argument("output", help="출력 텍스트 파일 또는 출력 디렉터리")
+    parser.add_argument("--workers", type=int, default=None, help="프로세스 수")
+    parser.add_argument(
+        "--pages-per-task", type=int, default=PAGES_PER_TASK, help="작업당 페이지 수"
+    )
+    args = parser.parse_args()
 
+    if Path(args.input).is_dir():
+        extract_directory(args.input, args.output, args.workers, args.pages_per_task)
+    else:
+        extract_text_from_pdf(
+            args.input, args.output, workers=args.workers, pages_per_task=args.pages_per_task
+        )
 
-pdf_path = "/Users/junghyeon/Downloads/시행중_K-IFRS_재무보고를_위한_개념체계(2018_개정_2019_타기준서_개정_수정목록_24-1_2020_구성양식_변경_반영).pdf"  # PDF 파일 경로
-output_txt_path = "RAG/재무보고를위한개념체계.txt"
 
-extract_text_from_pdf(pdf_path, output_txt_path)
+if __name__ == "__main__":
+    main()
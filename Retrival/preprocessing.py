@@ -1,25 +1,182 @@
+import argparse
 import re
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Iterable, List, Optional, Sequence, Tuple, Union
 
+# 한 번에 읽는 문자 수
+CHUNK_SIZE = 1 << 20
 
-def clean_text_file(input_path, output_path):
-    # 파일 읽기
-    with open(input_path, "r", encoding="utf-8") as file:
-        text = file.read()
 
-    # '-number-' 형식 제거
-    cleaned_text = re.sub(r"- \d+ -", "", text)
+@dataclass(frozen=True)
+class CleanupRule:
+    """정제 규칙 하나
 
-    # 정제된 텍스트 저장
-    with open(output_path, "w", encoding="utf-8") as file:
-        file.write(cleaned_text)
+    max_match_len은 어떤 위치에서 매치가 시작되는지, 그리고 매치가 어디서 끝나는지를
+    확정하는 데 필요한 최대 문자 수(전/후방 탐색 포함)이다. 시작이나 끝이 버퍼 끝에서
+    이 길이 안쪽인 매치는 다음 청크가 붙을 때까지 보류한다.
 
-    print(f"텍스트 정제 완료. '{output_path}'에 저장되었습니다.")
+    매치 길이 자체에는 상한이 없어도 된다 ({2,} 같은 무제한 반복). 다만 반복이
+    greedy이고, 매치 다음에 오는 문자 하나로 끝 위치가 정해지는 경우에만 안전하다.
+    버퍼 끝에서 max_match_len보다 앞에서 끝난 greedy 매치는 다음 문자가 반복에 맞지
+    않았다는 뜻이므로 뒤에 텍스트가 더 붙어도 늘어나지 않는다. lazy 반복(*?, +?)이나
+    끝을 정하는 데 여러 문자를 미리 봐야 하는 패턴은 max_match_len을 실제 최대 매치
+    길이 이상으로 잡아야 한다.
+    """
+
+    name: str
+    pattern: "re.Pattern"
+    replacement: Union[str, Callable[["re.Match"], str]]
+    max_match_len: int = 64
+
+    def expand(self, match: "re.Match") -> str:
+        if callable(self.replacement):
+            return self.replacement(match)
+        return match.expand(self.replacement)
 
 
-# 파일 경로
-input_path = "RAG/processed_재무보고를위한개념체계.txt"
-output_path = (
-    "../data/RAG/processed_재무보고를위한개념체계.txt"  # 새로운 파일명으로 저장
+# '-number-' 형식 페이지 바닥글 제거
+PAGE_FOOTER_RULE = CleanupRule("page_footer", re.compile(r"- \d+ -"), "", 16)
+# 줄 끝 하이픈으로 나뉜 영단어 결합 (예: "account-\ning" -> "accounting")
+HYPHENATION_RULE = CleanupRule(
+    "hyphenation", re.compile(r"(?<=[A-Za-z])-\n(?=[a-z])"), "", 4
 )
+# 연속 공백/탭을 공백 하나로
+WHITESPACE_RULE = CleanupRule("whitespace", re.compile(r"[ \t]{2,}"), " ", 2)
+# 3줄 이상 연속된 빈 줄을 빈 줄 하나로
+BLANK_LINES_RULE = CleanupRule(
+    "blank_lines", re.compile(r"\n(?:[ \t]{0,16}\n){2,}"), "\n\n", 40
+)
+
+DEFAULT_RULES: Tuple[CleanupRule, ...] = (PAGE_FOOTER_RULE,)
+
+
+class _RuleStage:
+    """규칙 하나를 청크 스트림에 적용하는 단계
+
+    이미 출력한 입력의 끝부분(context)을 앞에 붙여 검색 시작 위치만 옮기므로
+    '^' 와 후방 탐색도 전체 텍스트에 re.sub을 한 번 적용한 것과 같게 동작한다.
+    """
+
+    def __init__(self, rule: CleanupRule):
+        self.rule = rule
+        self._context = ""
+        self._pending = ""
+
+    def feed(self, text: str, final: bool = False) -> str:
+        buffer = self._context + self._pending + text
+        start = len(self._context)
+        # 이 위치 이전에서 시작하고 끝나는 매치는 뒤에 올 텍스트와 무관하게 확정됨
+        limit = len(buffer) if final else len(buffer) - self.rule.max_match_len
+
+        output = []
+        position = start
+        for match in self.rule.pattern.finditer(buffer, start):
+            if not final and match.end() > limit:
+                # 청크 경계에 걸칠 수 있는 매치는 다음 청크와 함께 다시 검사
+                limit = match.start()
+                break
+            output.append(buffer[position : match.start()])
+            output.append(self.rule.expand(match))
+            position = match.end()
+
+        cut = len(buffer) if final else max(position, limit)
+        output.append(buffer[position:cut])
+        self._pending = buffer[cut:]
+        self._context = buffer[max(0, cut - self.rule.max_match_len) : cut]
+        return "".join(output)
+
+
+class StreamingCleaner:
+    """정제 규칙 파이프라인을 고정 크기 청크 단위로 적용하는 스트리밍 정제기"""
+
+    def __init__(self, rules: Sequence[CleanupRule] = DEFAULT_RULES, chunk_size: int = CHUNK_SIZE):
+        self.rules = tuple(rules)
+        self.chunk_size = chunk_size
+
+    def clean_chunks(self, chunks: Iterable[str]) -> Iterable[str]:
+        stages = [_RuleStage(rule) for rule in self.rules]
+
+        def run(text: str, final: bool) -> str:
+            for stage in stages:
+                text = stage.feed(text, final)
+            return text
+
+        for chunk in chunks:
+            cleaned = run(chunk, final=False)
+            if cleaned:
+                yield cleaned
+        tail = run("", final=True)
+        if tail:
+            yield tail
+
+    def clean_text(self, text: str) -> str:
+        chunks = (text[i : i + self.chunk_size] for i in range(0, len(text), self.chunk_size))
+        return "".join(self.clean_chunks(chunks))
+
+    def clean_file(self, input_path, output_path):
+        with open(input_path, "r", encoding="utf-8") as source, open(
+            output_path, "w", encoding="utf-8"
+        ) as target:
+            chunks = iter(lambda: source.read(self.chunk_size), "")
+            for cleaned in self.clean_chunks(chunks):
+                target.write(cleaned)
+
+
+def clean_text_file(input_path, output_path, rules: Sequence[CleanupRule] = DEFAULT_RULES):
+    StreamingCleaner(rules).clean_file(input_path, output_path)
+
+    print(f"텍스트 정제 완료. '{output_path}'에 저장되었습니다.")
+
+
+def clean_files(
+    pairs: Sequence[Tuple[str, str]],
+    rules: Sequence[CleanupRule] = DEFAULT_RULES,
+    workers: Optional[int] = None,
+) -> List[str]:
+    """(입력, 출력) 경로 쌍들을 프로세스 풀에서 병렬로 정제"""
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(clean_text_file, input_path, output_path, rules)
+            for input_path, output_path in pairs
+        ]
+        for future in futures:
+            future.result()
+    return [output_path for _, output_path in pairs]
+
+
+RULES_BY_NAME = {
+    rule.name: rule
+    for rule in (PAGE_FOOTER_RULE, HYPHENATION_RULE, WHITESPACE_RULE, BLANK_LINES_RULE)
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="추출 텍스트 스트리밍 정제")
+    parser.add_argument("inputs", nargs="+", help="정제할 텍스트 파일들")
+    parser.add_argument("--output-dir", default=None, help="출력 디렉터리 (기본: 입력과 같은 위치)")
+    parser.add_argument("--prefix", default="processed_", help="출력 파일명 접두어")
+    parser.add_argument(
+        "--rules",
+        default=",".join(rule.name for rule in DEFAULT_RULES),
+        help=f"적용할 규칙 (쉼표 구분): {', '.join(RULES_BY_NAME)}",
+    )
+    parser.add_argument("--workers", type=int, default=None, help="프로세스 수")
+    args = parser.parse_args()
+
+    rules = [RULES_BY_NAME[name] for name in args.rules.split(",") if name]
+    pairs = []
+    for input_path in map(Path, args.inputs):
+        output_dir = Path(args.output_dir) if args.output_dir else input_path.parent
+        output_dir.mkdir(parents=True, exist_ok=True)
+        pairs.append((str(input_path), str(output_dir / f"{args.prefix}{input_path.name}")))
+
+    if len(pairs) == 1:
+        clean_text_file(*pairs[0], rules)
+    else:
+        clean_files(pairs, rules, args.workers)
+
 
-clean_text_file(input_path, output_path)
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,252 @@
+import json
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# 한 번에 역양자화하는 행 수 (캐시에 들어가는 크기로 유지)
+SCAN_BLOCK_SIZE = 4096
+
+
+def load_vector_matrix(vectors_path: str) -> Tuple[List[str], np.ndarray]:
+    """save_vectors()가 저장한 {문단번호: 벡터} npy를 (키 목록, float32 행렬)로 변환"""
+    vectors = np.load(vectors_path, allow_pickle=True).item()
+    keys = list(vectors.keys())
+    matrix = np.asarray([vectors[k] for k in keys], dtype=np.float32)
+    return keys, matrix
+
+
+def normalize(vectors: np.ndarray) -> np.ndarray:
+    """코사인 유사도를 내적으로 계산할 수 있도록 L2 정규화"""
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return vectors / norms
+
+
+def _top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """점수 상위 k개의 인덱스를 내림차순으로 반환"""
+    k = min(k, scores.shape[0])
+    if k <= 0:
+        return np.empty(0, dtype=np.int64)
+    candidates = np.argpartition(-scores, k - 1)[:k]
+    return candidates[np.argsort(-scores[candidates], kind="stable")]
+
+
+class ScalarQuantizer:
+    """차원별 min/max 기반 int8 스칼라 양자화"""
+
+    def __init__(self):
+        self.offset: Optional[np.ndarray] = None
+        self.scale: Optional[np.ndarray] = None
+
+    def fit(self, vectors: np.ndarray) -> "ScalarQuantizer":
+        low = vectors.min(axis=0)
+        high = vectors.max(axis=0)
+        self.scale = np.maximum(high - low, 1e-12).astype(np.float32) / 255.0
+        # 코드 -128이 low, 127이 high에 대응
+        self.offset = (low + 128.0 * self.scale).astype(np.float32)
+        return self
+
+    def encode(self, vectors: np.ndarray) -> np.ndarray:
+        codes = np.rint((vectors - self.offset) / self.scale)
+        return np.clip(codes, -128, 127).astype(np.int8)
+
+    def decode(self, codes: np.ndarray) -> np.ndarray:
+        return codes.astype(np.float32) * self.scale + self.offset
+
+    def scores(self, codes: np.ndarray, query: np.ndarray) -> np.ndarray:
+        """비대칭 거리 계산: 쿼리는 float32 그대로 두고 코드만 역양자화한 내적"""
+        weighted_query = (query * self.scale).astype(np.float32)
+        bias = float(np.dot(self.offset, query))
+        scores = np.empty(codes.shape[0], dtype=np.float32)
+        for start in range(0, codes.shape[0], SCAN_BLOCK_SIZE):
+            block = codes[start : start + SCAN_BLOCK_SIZE].astype(np.float32)
+            scores[start : start + SCAN_BLOCK_SIZE] = block @ weighted_query + bias
+        return scores
+
+
+class ProductQuantizer:
+    """서브공간별 k-means 코드북을 사용하는 product quantization (코드당 1바이트)"""
+
+    def __init__(
+        self,
+        num_subspaces: int = 48,
+        num_centroids: int = 256,
+        iterations: int = 20,
+        seed: int = 0,
+    ):
+        if num_centroids > 256:
+            raise ValueError("num_centroids must be <= 256 to fit uint8 codes")
+        self.num_subspaces = num_subspaces
+        self.num_centroids = num_centroids
+        self.iterations = iterations
+        self.seed = seed
+        self.codebooks: Optional[np.ndarray] = None  # (m, k, d/m)
+
+    def _split(self, vectors: np.ndarray) -> np.ndarray:
+        n, dim = vectors.shape
+        if dim % self.num_subspaces:
+            raise ValueError(
+                f"Vector dimension {dim} is not divisible by {self.num_subspaces} subspaces"
+            )
+        return vectors.reshape(n, self.num_subspaces, dim // self.num_subspaces)
+
+    def _kmeans(self, data: np.ndarray, k: int, rng: np.random.Generator) -> np.ndarray:
+        centroids = data[rng.choice(data.shape[0], size=k, replace=False)].copy()
+        for _ in range(self.iterations):
+            distances = (
+                (data**2).sum(axis=1, keepdims=True)
+                - 2 * data @ centroids.T
+                + (centroids**2).sum(axis=1)
+            )
+            assignment = distances.argmin(axis=1)
+            for c in range(k):
+                members = data[assignment == c]
+                if len(members):
+                    centroids[c] = members.mean(axis=0)
+                else:
+                    # 빈 클러스터는 임의의 점으로 다시 초기화
+                    centroids[c] = data[rng.integers(data.shape[0])]
+        return centroids
+
+    def fit(self, vectors: np.ndarray) -> "ProductQuantizer":
+        sub_vectors = self._split(vectors)
+        k = min(self.num_centroids, vectors.shape[0])
+        rng = np.random.default_rng(self.seed)
+        self.codebooks = np.stack(
+            [
+                self._kmeans(sub_vectors[:, j, :], k, rng)
+                for j in range(self.num_subspaces)
+            ]
+        ).astype(np.float32)
+        return self
+
+    def encode(self, vectors: np.ndarray) -> np.ndarray:
+        sub_vectors = self._split(vectors)
+        codes = np.empty((vectors.shape[0], self.num_subspaces), dtype=np.uint8)
+        for j in range(self.num_subspaces):
+            codebook = self.codebooks[j]
+            distances = -2 * sub_vectors[:, j, :] @ codebook.T + (codebook**2).sum(
+                axis=1
+            )
+            codes[:, j] = distances.argmin(axis=1)
+        return codes
+
+    def decode(self, codes: np.ndarray) -> np.ndarray:
+        parts = [self.codebooks[j][codes[:, j]] for j in range(self.num_subspaces)]
+        return np.concatenate(parts, axis=1)
+
+    def scores(self, codes: np.ndarray, query: np.ndarray) -> np.ndarray:
+        """비대칭 거리 계산: 쿼리-센트로이드 내적 테이블을 만들고 코드로 조회해 합산"""
+        sub_query = query.reshape(self.num_subspaces, -1)
+        table = np.einsum("mkd,md->mk", self.codebooks, sub_query)
+        scores = np.zeros(codes.shape[0], dtype=np.float32)
+        for j in range(self.num_subspaces):
+            scores += table[j][codes[:, j]]
+        return scores
+
+
+@dataclass
+class QuantizedIndex:
+    """양자화 코드로 후보를 고르고 원본 float32 벡터로 재정렬하는 문단 인덱스"""
+
+    keys: List[str]
+    quantizer: object
+    codes: np.ndarray
+    full_vectors: Optional[np.ndarray] = field(default=None, repr=False)
+
+    @classmethod
+    def build(
+        cls,
+        keys: Sequence[str],
+        vectors: np.ndarray,
+        method: str = "int8",
+        keep_full_precision: bool = True,
+        **quantizer_kwargs,
+    ) -> "QuantizedIndex":
+        vectors = normalize(vectors)
+        if method == "int8":
+            quantizer = ScalarQuantizer().fit(vectors)
+        elif method == "pq":
+            quantizer = ProductQuantizer(**quantizer_kwargs).fit(vectors)
+        else:
+            raise ValueError(f"Unknown quantization method: {method}")
+        return cls(
+            keys=list(keys),
+            quantizer=quantizer,
+            codes=quantizer.encode(vectors),
+            full_vectors=vectors if keep_full_precision else None,
+        )
+
+    def search(
+        self, query: np.ndarray, top_k: int = 10, rerank: Optional[int] = 100
+    ) -> List[Tuple[str, float]]:
+        """상위 rerank개 후보를 양자화 점수로 고른 뒤 원본 벡터로 재정렬"""
+        query = normalize(query)
+        approx = self.quantizer.scores(self.codes, query)
+
+        if not rerank or self.full_vectors is None:
+            idx = _top_k(approx, top_k)
+            return [(self.keys[i], float(approx[i])) for i in idx]
+
+        candidates = _top_k(approx, max(rerank, top_k))
+        exact = self.full_vectors[candidates] @ query
+        order = np.argsort(-exact, kind="stable")[:top_k]
+        return [(self.keys[candidates[i]], float(exact[i])) for i in order]
+
+    def memory_bytes(self) -> Dict[str, int]:
+        return {
+            "codes": int(self.codes.nbytes),
+            "full_vectors": int(self.full_vectors.nbytes)
+            if self.full_vectors is not None
+            else 0,
+        }
+
+
+def exact_search(
+    keys: Sequence[str], vectors: np.ndarray, query: np.ndarray, top_k: int = 10
+) -> List[Tuple[str, float]]:
+    """전체 float32 벡터에 대한 brute-force 코사인 검색 (recall 기준값)"""
+    scores = normalize(vectors) @ normalize(query)
+    return [(keys[i], float(scores[i])) for i in _top_k(scores, top_k)]
+
+
+def recall_at_k(
+    index: QuantizedIndex,
+    vectors: np.ndarray,
+    queries: np.ndarray,
+    k: int = 10,
+    rerank: Optional[int] = 100,
+) -> float:
+    """정확 검색 상위 k개 중 양자화 검색 상위 k개에 포함된 비율의 평균"""
+    hits = 0
+    for query in queries:
+        truth = {key for key, _ in exact_search(index.keys, vectors, query, k)}
+        found = {key for key, _ in index.search(query, top_k=k, rerank=rerank)}
+        hits += len(truth & found)
+    return hits / (len(queries) * min(k, len(index.keys)))
+
+
+def main():
+    keys, vectors = load_vector_matrix("vectors/content_vectors.npy")
+
+    # 저장된 문단 벡터에 잡음을 섞어 쿼리로 사용
+    rng = np.random.default_rng(0)
+    sample = rng.choice(len(keys), size=min(50, len(keys)), replace=False)
+    queries = vectors[sample] + rng.normal(0, 0.05, size=(len(sample), vectors.shape[1]))
+
+    report = {}
+    for method in ("int8", "pq"):
+        index = QuantizedIndex.build(keys, vectors, method=method)
+        report[method] = {
+            "memory_bytes": index.memory_bytes(),
+            "recall@10_no_rerank": recall_at_k(index, vectors, queries, 10, rerank=None),
+            "recall@10_rerank_50": recall_at_k(index, vectors, queries, 10, rerank=50),
+        }
+
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -73,6 +73,18 @@ class KIFRSVectorizer:
 
         return content_mapping
 
+    def process_records(self, records_path: str) -> Dict[str, str]:
+        """pdf_to_records.py가 만든 문단 JSONL을 문단번호-내용 매핑으로 변환"""
+        content_mapping = {}
+        with open(records_path, "r", encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                content_mapping[record["paragraph_id"]] = record["text"]
+
+        return content_mapping
+
     def vectorize_content(
         self, content_mapping: Dict[str, str]
     ) -> Dict[str, np.ndarray]:
@@ -0,0 +1,135 @@
+"""Question loading / debug serialization benchmark.
+
+Compares the previous stdlib path (json.load + Question(**data), json.dumps with
+indent=2) with src.serialization. Run from the repository root:
+
+    python -m benchmarks.bench_serialization --questions 5000
+"""
+import argparse
+import json
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict
+
+from src import serialization
+from src.models import Question
+
+
+def make_question(num: int) -> Dict:
+    return {
+        "id": f"2023_1형_{num}",
+        "question": "다음 중 재무제표의 표시에 관한 설명으로 옳지 않은 것은? " * 3,
+        "options": [f"{i}. 보기 {i}에 대한 설명입니다. " * 4 for i in range(1, 6)],
+        "correct_answer": str(num % 5 + 1),
+        "data": {
+            "table": [["계정", "20X1년", "20X2년"]]
+            + [[f"항목{row}", row * 1000, row * 1100] for row in range(20)]
+        },
+    }
+
+
+def make_debug_entry(num: int) -> Dict:
+    question = make_question(num)
+    return {
+        "question_id": question["id"],
+        "question_text": question["question"],
+        "options": question["options"],
+        "gpt_response": {
+            "selected_answer": "1",
+            "reasoning": [
+                f"{i}번 보기는 기준서 문단에 따라 옳다. " * 3 for i in range(1, 6)
+            ],
+        },
+        "correct_answer": question["correct_answer"],
+        "is_correct": num % 3 == 0,
+        "execution_time": 1.2345,
+    }
+
+
+def timed(func: Callable, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(questions: int, repeat: int) -> Dict[str, Dict[str, float]]:
+    with tempfile.TemporaryDirectory() as tmp:
+        exam_dir = Path(tmp) / "exam"
+        exam_dir.mkdir()
+        for num in range(1, questions + 1):
+            (exam_dir / f"{num}.json").write_text(
+                json.dumps(make_question(num), ensure_ascii=False, indent=2),
+                encoding="utf-8",
+            )
+        bundle = Path(tmp) / "exam.json"
+        bundle.write_text(
+            json.dumps(
+                [make_question(n) for n in range(1, questions + 1)], ensure_ascii=False
+            ),
+            encoding="utf-8",
+        )
+        files = sorted(exam_dir.glob("*.json"))
+
+        def load_stdlib():
+            for path in files:
+                with path.open("r", encoding="utf-8") as f:
+                    Question(**json.load(f))
+
+        def load_fast():
+            for path in files:
+                serialization.load_question(path)
+
+        loading = {
+            "stdlib_per_file": timed(load_stdlib, repeat),
+            "serialization_per_file": timed(load_fast, repeat),
+            "serialization_bundle": timed(
+                lambda: serialization.load_question_list(bundle), repeat
+            ),
+        }
+
+    entries = [make_debug_entry(num) for num in range(questions)]
+    dumping = {
+        "stdlib_indent": timed(
+            lambda: json.dumps(entries, indent=2, ensure_ascii=False, default=str),
+            repeat,
+        ),
+        "stdlib_compact_lines": timed(
+            lambda: [
+                json.dumps(e, ensure_ascii=False, separators=(",", ":"), default=str)
+                for e in entries
+            ],
+            repeat,
+        ),
+        "serialization_lines": timed(
+            lambda: [serialization.dumps_line(e) for e in entries], repeat
+        ),
+    }
+    return {"load_questions": loading, "dump_debug_entries": dumping}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--questions", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", type=Path, default=None)
+    args = parser.parse_args()
+
+    results = run(args.questions, args.repeat)
+    results["backend"] = "orjson" if serialization.orjson is not None else "json"
+    for group, timings in results.items():
+        if not isinstance(timings, dict):
+            continue
+        baseline = next(iter(timings.values()))
+        print(f"{group} ({args.questions} items)")
+        for name, seconds in timings.items():
+            print(f"  {name:<24} {seconds * 1000:9.1f} ms  x{baseline / seconds:5.1f}")
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,324 @@
+"""Benchmark suite for the data / prompt / visualizer / Retrival code paths.
+
+Generates a synthetic corpus (benchmarks/synthetic.py) at the requested scale,
+times each subsystem and writes the timings as JSON so runs can be compared
+over time. Run from the repository root:
+
+    python -m benchmarks.run --questions 10000 --output benchmarks/results/baseline.json
+    python -m benchmarks.run --questions 10000 --compare benchmarks/results/baseline.json
+"""
+import argparse
+import json
+import logging
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import warnings
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from benchmarks import synthetic
+from src.memory_profiler import MemoryProfiler
+
+BENCHMARKS: Dict[str, Callable] = {}
+
+
+def benchmark(name: str):
+    def register(func: Callable) -> Callable:
+        BENCHMARKS[name] = func
+        return func
+
+    return register
+
+
+class Skip(Exception):
+    """필요한 패키지/파일이 없어 측정할 수 없는 벤치마크"""
+
+
+def measure(func: Callable, repeat: int, items: int) -> Dict[str, float]:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    best = min(timings)
+    return {
+        "items": items,
+        "repeat": repeat,
+        "best_s": best,
+        "mean_s": statistics.fmean(timings),
+        "items_per_s": items / best if best else 0.0,
+    }
+
+
+@benchmark("data_loader.load_questions")
+def bench_load_questions(context: Dict, repeat: int) -> Dict:
+    from src.data_loader import DataLoader
+
+    loader = DataLoader(context["data_dir"])
+
+    def run():
+        for exam_name in context["exams"]:
+            loader.load_questions(exam_name)
+
+    return measure(run, repeat, context["questions"])
+
+
+@benchmark("prompts.get_question_prompt")
+def bench_question_prompt(context: Dict, repeat: int) -> Dict:
+    from src.data_loader import DataLoader
+    from src.prompts import Prompts
+
+    loader = DataLoader(context["data_dir"])
+    questions = [
+        question
+        for exam_name in context["exams"]
+        for question in loader.load_questions(exam_name)
+    ]
+
+    def run():
+        for question in questions:
+            Prompts.get_question_prompt(
+                question.question, question.options, question.data
+            )
+
+    return measure(run, repeat, len(questions))
+
+
+def _visualizer_benchmark(method: str):
+    def bench(context: Dict, repeat: int) -> Dict:
+        import matplotlib
+
+        matplotlib.use("Agg")
+        # 설치되지 않은 한글 폰트에 대한 findfont 경고는 측정과 무관
+        logging.getLogger("matplotlib.font_manager").setLevel(logging.ERROR)
+        warnings.filterwarnings("ignore", message="Glyph .* missing from font")
+        from src.visualizer import Visualizer
+
+        results = synthetic.make_exam_results(
+            context["visualizer_questions"], context["exam_count"], context["seed"]
+        )
+        visualizer = Visualizer(context["work_dir"] / "visualizer")
+        return measure(
+            lambda: getattr(visualizer, method)(results),
+            repeat,
+            context["visualizer_questions"],
+        )
+
+    return bench
+
+
+for _method in (
+    "generate_exam_summary",
+    "generate_timing_visualization",
+    "generate_score_visualization",
+    "generate_corrections_table",
+):
+    benchmark(f"visualizer.{_method}")(_visualizer_benchmark(_method))
+
+
+@benchmark("comparison_txt.compare_files")
+def bench_compare_files(context: Dict, repeat: int) -> Dict:
+    from Retrival.comparison_txt import TextComparator
+
+    comparator = TextComparator(
+        str(context["rag_dir"] / "standards.txt"),
+        str(context["rag_dir"] / "processed_standards.txt"),
+    )
+    lines = comparator.file1_content.count("\n") + comparator.file2_content.count("\n")
+    return measure(comparator.compare_files, repeat, lines)
+
+
+@benchmark("vectorize.KIFRSVectorizer.parse")
+def bench_vectorizer_parse(context: Dict, repeat: int) -> Dict:
+    try:
+        from Retrival.vectorize import KIFRSVectorizer
+    except ImportError as e:
+        raise Skip(str(e))
+
+    # 목차/문단 파싱은 임베딩 모델을 쓰지 않으므로 모델을 불러오지 않고 측정
+    vectorizer = KIFRSVectorizer.__new__(KIFRSVectorizer)
+    toc_text = (context["rag_dir"] / "label.txt").read_text(encoding="utf-8")
+    content_path = str(context["rag_dir"] / "processed_standards.txt")
+
+    def run():
+        vectorizer.create_section_mapping(vectorizer.parse_toc(toc_text))
+        vectorizer.process_content(content_path)
+
+    return measure(run, repeat, context["paragraphs"])
+
+
+@benchmark("vectorize.KIFRSVectorizer.vectorize_content")
+def bench_vectorizer_encode(context: Dict, repeat: int) -> Dict:
+    if not context["with_model"]:
+        raise Skip("embedding model benchmark disabled (use --with-model)")
+    try:
+        from Retrival.vectorize import KIFRSVectorizer
+
+        vectorizer = KIFRSVectorizer()
+    except Exception as e:  # 패키지가 없거나 모델을 받을 수 없는 경우
+        raise Skip(str(e))
+
+    content = vectorizer.process_content(
+        str(context["rag_dir"] / "processed_standards.txt")
+    )
+    return measure(lambda: vectorizer.vectorize_content(content), repeat, len(content))
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_suite(
+    questions: int,
+    exams: int = 5,
+    paragraphs: int = 500,
+    visualizer_questions: int = 500,
+    repeat: int = 3,
+    seed: int = 0,
+    only: Optional[List[str]] = None,
+    with_model: bool = False,
+    memory: bool = False,
+) -> Dict:
+    """memory=True이면 벤치마크마다 메모리 단계(src.memory_profiler)를 함께 기록"""
+    profiler = MemoryProfiler(enabled=memory)
+    with tempfile.TemporaryDirectory() as tmp:
+        work_dir = Path(tmp)
+        exam_names = synthetic.generate_exams(work_dir / "data", questions, exams, seed)
+        rag_dir = work_dir / "RAG"
+        rag_dir.mkdir()
+        text = synthetic.generate_standards_text(paragraphs, seed)
+        (rag_dir / "standards.txt").write_text(
+            synthetic.perturb_text(text, seed=seed), encoding="utf-8"
+        )
+        (rag_dir / "processed_standards.txt").write_text(text, encoding="utf-8")
+        (rag_dir / "label.txt").write_text(
+            synthetic.generate_toc(max(1, paragraphs // 40), 10, seed),
+            encoding="utf-8",
+        )
+
+        context = {
+            "work_dir": work_dir,
+            "data_dir": work_dir / "data",
+            "rag_dir": rag_dir,
+            "exams": exam_names,
+            "exam_count": len(exam_names),
+            "questions": questions,
+            "paragraphs": paragraphs,
+            # 히트맵 주석 등 문제 수에 비례해 커지는 그림이 있어 별도 규모로 측정
+            "visualizer_questions": min(questions, visualizer_questions),
+            "seed": seed,
+            "with_model": with_model,
+        }
+
+        results, skipped = {}, {}
+        for name, func in BENCHMARKS.items():
+            if only and not any(name.startswith(prefix) for prefix in only):
+                continue
+            try:
+                with profiler.stage(name):
+                    results[name] = func(context, repeat)
+            except Skip as e:
+                skipped[name] = str(e)
+
+    return {
+        "generated_at": datetime.now().isoformat(),
+        "git_commit": _git_commit(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "params": {
+            "questions": questions,
+            "exams": exams,
+            "paragraphs": paragraphs,
+            "visualizer_questions": min(questions, visualizer_questions),
+            "repeat": repeat,
+            "seed": seed,
+        },
+        "results": results,
+        "skipped": skipped,
+        **({"memory": profiler.summary()} if memory else {}),
+    }
+
+
+def compare(current: Dict, previous: Dict) -> Dict[str, float]:
+    """벤치마크별 이전 실행 대비 시간 비율 (1보다 크면 느려짐)"""
+    ratios = {}
+    for name, result in current["results"].items():
+        before = previous.get("results", {}).get(name)
+        if before and before["best_s"]:
+            ratios[name] = result["best_s"] / before["best_s"]
+    return ratios
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--questions", type=int, default=1000, help="10 ~ 100000")
+    parser.add_argument("--exams", type=int, default=5)
+    parser.add_argument("--paragraphs", type=int, default=500)
+    parser.add_argument("--visualizer-questions", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--only", nargs="+", default=None, help="benchmark name prefixes to run"
+    )
+    parser.add_argument("--with-model", action="store_true")
+    parser.add_argument(
+        "--memory", action="store_true", help="record RSS/tracemalloc per benchmark"
+    )
+    parser.add_argument("--output", type=Path, default=None)
+    parser.add_argument("--compare", type=Path, default=None)
+    args = parser.parse_args(argv)
+
+    report = run_suite(
+        args.questions,
+        args.exams,
+        args.paragraphs,
+        args.visualizer_questions,
+        args.repeat,
+        args.seed,
+        args.only,
+        args.with_model,
+        args.memory,
+    )
+    if args.compare:
+        previous = json.loads(args.compare.read_text(encoding="utf-8"))
+        report["compared_to"] = str(args.compare)
+        report["ratios"] = compare(report, previous)
+
+    for name, result in report["results"].items():
+        line = (
+            f"{name:<46} {result['best_s'] * 1000:10.1f} ms "
+            f"{result['items_per_s']:12.0f} items/s"
+        )
+        if name in report.get("ratios", {}):
+            line += f"  x{report['ratios'][name]:.2f}"
+        print(line)
+    for name, reason in report["skipped"].items():
+        print(f"{name:<46} skipped: {reason}")
+    for name, totals in report.get("memory", {}).get("by_stage", {}).items():
+        print(
+            f"{name:<46} RSS +{totals['rss_growth_mb']:.1f} MB, "
+            f"peak {totals['max_peak_rss_mb']:.1f} MB"
+        )
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(
+            json.dumps(report, indent=2, ensure_ascii=False), encoding="utf-8"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,260 @@
+"""Synthetic exam / standards-text generator for the benchmarks.
+
+Produces data/<exam>/<n>.json question files shaped like the real CPA exams
+(Korean stem, five options, optional table data), exam results for the
+visualizer, and K-IFRS-style table-of-contents / paragraph text for the
+Retrival scripts. Output is deterministic for a given seed.
+
+    python -m benchmarks.synthetic --questions 1000 --exams 5 --output /tmp/synthetic
+"""
+import argparse
+import json
+import random
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from src.models import ExamResult, QuestionResult
+
+SUBJECTS = [
+    "재고자산",
+    "유형자산",
+    "무형자산",
+    "리스",
+    "금융자산",
+    "충당부채",
+    "수익",
+    "법인세",
+    "종업원급여",
+    "사업결합",
+    "현금흐름표",
+    "주당이익",
+]
+STEMS = [
+    "{subject}에 관한 다음 설명 중 옳지 않은 것은?",
+    "{subject}의 회계처리에 관한 설명으로 옳은 것은?",
+    "(주)대한의 20X{year}년 {subject} 관련 자료가 다음과 같을 때, "
+    "20X{year}년 당기순이익에 미치는 영향은 얼마인가?",
+    "다음은 (주)민국의 {subject}에 관한 자료이다. 20X{year}년 말 재무상태표에 "
+    "보고할 금액은 얼마인가? 단, 법인세효과는 고려하지 않는다.",
+]
+CLAUSES = [
+    "{subject}은(는) 최초 인식시점에 원가로 측정한다",
+    "보고기간 말마다 손상징후가 있는지를 검토한다",
+    "공정가치 변동은 기타포괄손익으로 인식한다",
+    "순실현가능가치가 장부금액에 미달하면 평가손실을 인식한다",
+    "관련 현금흐름은 유효이자율로 할인하여 측정한다",
+    "재평가잉여금은 이익잉여금으로 직접 대체할 수 있다",
+    "회계정책의 변경은 소급하여 적용한다",
+    "추정의 변경은 전진적으로 처리한다",
+]
+ACCOUNTS = [
+    "매출액",
+    "매출원가",
+    "감가상각비",
+    "이자비용",
+    "기초재고",
+    "기말재고",
+    "매입액",
+    "충당부채",
+    "이연법인세자산",
+    "리스부채",
+]
+
+
+def make_question(
+    exam_name: str, num: int, rng: random.Random, table_ratio: float = 0.3
+) -> Dict:
+    subject = rng.choice(SUBJECTS)
+    year = rng.randint(1, 9)
+    stem = rng.choice(STEMS).format(subject=subject, year=year)
+    numeric = "얼마" in stem
+
+    if numeric:
+        base = rng.randint(10, 900) * 1000
+        options = [f"₩{base + step * rng.randint(1, 50) * 100:,}" for step in range(5)]
+    else:
+        options = [
+            rng.choice(CLAUSES).format(subject=subject)
+            + rng.choice(["", "는 것이 원칙이다", "며, 예외는 없다"])
+            + "."
+            for _ in range(5)
+        ]
+
+    question = {
+        "id": f"{exam_name}_{num}",
+        "question": stem,
+        "options": options,
+        "correct_answer": str(rng.randint(1, 5)),
+    }
+    if numeric or rng.random() < table_ratio:
+        rows = rng.randint(3, 12)
+        question["data"] = {
+            "table": [["계정", f"20X{year - 1 if year > 1 else 1}년", f"20X{year}년"]]
+            + [
+                [
+                    rng.choice(ACCOUNTS),
+                    rng.randint(1, 999) * 1000,
+                    rng.randint(1, 999) * 1000,
+                ]
+                for _ in range(rows)
+            ]
+        }
+    return question
+
+
+def exam_names(exams: int) -> List[str]:
+    return [f"{2010 + index // 2}_{index % 2 + 1}형" for index in range(exams)]
+
+
+def split_questions(questions: int, exams: int) -> List[int]:
+    """questions개의 문제를 exams개 시험에 고르게 나눈 시험별 문제 수"""
+    exams = max(1, min(exams, questions))
+    return [questions // exams + (index < questions % exams) for index in range(exams)]
+
+
+def generate_exams(
+    output_dir: Path,
+    questions: int,
+    exams: int = 1,
+    seed: int = 0,
+    table_ratio: float = 0.3,
+) -> List[str]:
+    """output_dir/<exam>/<n>.json 형식으로 시험 데이터를 생성하고 시험 이름 목록을 반환"""
+    rng = random.Random(seed)
+    names = exam_names(len(split_questions(questions, exams)))
+    for exam_name, count in zip(names, split_questions(questions, exams)):
+        exam_dir = Path(output_dir) / exam_name
+        exam_dir.mkdir(parents=True, exist_ok=True)
+        for num in range(1, count + 1):
+            (exam_dir / f"{num}.json").write_text(
+                json.dumps(
+                    make_question(exam_name, num, rng, table_ratio),
+                    ensure_ascii=False,
+                    indent=2,
+                ),
+                encoding="utf-8",
+            )
+    return names
+
+
+def make_exam_results(
+    questions: int, exams: int = 1, seed: int = 0, accuracy: float = 0.7
+) -> List[ExamResult]:
+    """Visualizer 입력으로 쓸 가상의 채점 결과"""
+    rng = random.Random(seed)
+    start = datetime(2024, 1, 1, 9, 0)
+    results = []
+    for exam_name, count in zip(exam_names(exams), split_questions(questions, exams)):
+        question_results = []
+        clock = start
+        for num in range(1, count + 1):
+            seconds = rng.lognormvariate(1.5, 0.5)
+            question_results.append(
+                QuestionResult(
+                    question_id=f"{exam_name}_{num}",
+                    start_time=clock,
+                    end_time=clock + timedelta(seconds=seconds),
+                    execution_time=seconds,
+                    selected_answer=str(rng.randint(1, 5)),
+                    is_correct=rng.random() < accuracy,
+                    reasoning=[
+                        f"{i}번 보기는 기준서에 따라 판단한다." for i in range(1, 6)
+                    ],
+                )
+            )
+            clock += timedelta(seconds=seconds)
+        correct = sum(result.is_correct for result in question_results)
+        results.append(
+            ExamResult(
+                exam_name=exam_name,
+                start_time=start,
+                end_time=clock,
+                execution_time=(clock - start).total_seconds(),
+                questions_results=question_results,
+                total_questions=count,
+                correct_answers=correct,
+                accuracy=correct / count if count else 0,
+            )
+        )
+    return results
+
+
+def generate_toc(chapters: int, sections: int, seed: int = 0) -> str:
+    """'제N장 제목' / 'N.M 제목' 형식의 목차 (Retrival/RAG/label.txt와 같은 형식)"""
+    rng = random.Random(seed)
+    lines = []
+    for chapter in range(1, chapters + 1):
+        lines.append(
+            f"제{chapter}장 {rng.choice(SUBJECTS)}의 {rng.choice(['인식', '측정', '표시', '공시'])}"
+        )
+        for section in range(1, sections + 1):
+            lines.append(
+                f"{chapter}.{section} {rng.choice(SUBJECTS)} {rng.choice(['서론', '범위', '정의', '적용'])}"
+            )
+        lines.append("")
+    return "\n".join(lines)
+
+
+def generate_standards_text(
+    paragraphs: int, seed: int = 0, lines_per_paragraph: Tuple[int, int] = (2, 6)
+) -> str:
+    """'N.M' 줄 다음에 본문이 오는 기준서 문단 텍스트 (processed_*.txt와 같은 형식)"""
+    rng = random.Random(seed)
+    chapters = max(1, paragraphs // 40)
+    parts = []
+    for index in range(paragraphs):
+        parts.append(f"{index % chapters + 1}.{index // chapters + 1}")
+        for _ in range(rng.randint(*lines_per_paragraph)):
+            parts.append(rng.choice(CLAUSES).format(subject=rng.choice(SUBJECTS)) + ".")
+    return "\n".join(parts) + "\n"
+
+
+def perturb_text(text: str, change_ratio: float = 0.05, seed: int = 0) -> str:
+    """줄 일부를 바꾸거나 지우거나 끼워 넣은 텍스트 (원본/정제본 비교용)"""
+    rng = random.Random(seed)
+    lines = []
+    for line in text.splitlines():
+        roll = rng.random()
+        if roll < change_ratio / 3:
+            continue
+        if roll < 2 * change_ratio / 3:
+            lines.append(line.replace("한다", "하여야 한다"))
+        elif roll < change_ratio:
+            lines.extend([line, "- " + str(rng.randint(1, 999)) + " -"])
+        else:
+            lines.append(line)
+    return "\n".join(lines) + "\n"
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--questions", type=int, default=1000)
+    parser.add_argument("--exams", type=int, default=5)
+    parser.add_argument("--paragraphs", type=int, default=500)
+    parser.add_argument("--table-ratio", type=float, default=0.3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path, required=True)
+    args = parser.parse_args(argv)
+
+    names = generate_exams(
+        args.output / "data", args.questions, args.exams, args.seed, args.table_ratio
+    )
+    rag_dir = args.output / "RAG"
+    rag_dir.mkdir(parents=True, exist_ok=True)
+    text = generate_standards_text(args.paragraphs, args.seed)
+    (rag_dir / "standards.txt").write_text(
+        perturb_text(text, seed=args.seed), encoding="utf-8"
+    )
+    (rag_dir / "processed_standards.txt").write_text(text, encoding="utf-8")
+    (rag_dir / "label.txt").write_text(
+        generate_toc(max(1, args.paragraphs // 40), 10, args.seed), encoding="utf-8"
+    )
+    print(
+        f"{args.questions} questions in {len(names)} exams, "
+        f"{args.paragraphs} paragraphs -> {args.output}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,42 +1,33 @@
 # main.py
 import logging
-from datetime import datetime
-from logging.handlers import RotatingFileHandler
-from pathlib import Path
 
+from src.config import settings
 from src.data_loader import DataLoader
+from src.dedup import DuplicateIndex
+from src.logging_config import setup_logging as setup_queue_logging
+from src.memory_profiler import memory_stage, profiler
+from src.metrics import MetricsExporter, metrics
 from src.openai_client import OpenAIClient
 from src.processor import Processor
 from src.visualizer import Visualizer
+from src.watcher import DataWatcher, IncrementalEvaluator
+from src.work_queue import Coordinator, WorkQueue, Worker
 
 
 def setup_logging():
-    # Create logs directory if it doesn't exist
-    logs_dir = Path("logs")
-    logs_dir.mkdir(exist_ok=True)
+    # 파일/콘솔 쓰기는 백그라운드 QueueListener 스레드에서 처리
+    # (payload 샘플링과 트레이스 파일 설정은 src.config.Settings 참고)
+    setup_queue_logging()
 
-    # Create timestamp for log file
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    log_file = logs_dir / f"app_{timestamp}.log"
 
-    logger = logging.getLogger()
-    logger.setLevel(logging.DEBUG)
-
-    formatter = logging.Formatter(
-        "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-    )
-
-    # Rotating file handler
-    file_handler = RotatingFileHandler(log_file, maxBytes=10**6, backupCount=5)
-    file_handler.setLevel(logging.DEBUG)
-    file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
-
-    # Console handler
-    console_handler = logging.StreamHandler()
-    console_handler.setLevel(logging.INFO)
-    console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+def build_dedup_index(data_loader: DataLoader):
+    """DEDUP_ENABLED이면 전체 시험의 문제와 과거 debug 파일의 정답을 색인"""
+    if not settings.dedup_enabled:
+        return None
+    index = DuplicateIndex(settings.dedup_threshold)
+    index.build(data_loader)
+    index.load_answers(sorted((settings.output_dir / "debug").glob("*_debug.jsonl*")))
+    return index
 
 
 def process_single_exam(
@@ -46,7 +37,9 @@ def process_single_exam(
 
     data_loader = DataLoader()
     openai_client = OpenAIClient()
-    processor = Processor(data_loader, openai_client)
+    processor = Processor(
+        data_loader, openai_client, dedup_index=build_dedup_index(data_loader)
+    )
     visualizer = Visualizer()
 
     try:
@@ -56,10 +49,11 @@ def process_single_exam(
             results = [result]  # Wrap single result in list for visualizer
 
             # Generate visualizations
-            visualizer.generate_exam_summary(results)
-            visualizer.generate_timing_visualization(results)
-            visualizer.generate_score_visualization(results)
-            visualizer.generate_corrections_table(results)
+            with memory_stage("visualize"):
+                visualizer.generate_exam_summary(results)
+                visualizer.generate_timing_visualization(results)
+                visualizer.generate_score_visualization(results)
+                visualizer.generate_corrections_table(results)
 
             logger.info(f"Processing complete for exam '{exam_name}'")
             logger.info(f"Accuracy: {result.accuracy:.2%}")
@@ -74,7 +68,9 @@ def process_all_exams():
 
     data_loader = DataLoader()
     openai_client = OpenAIClient()
-    processor = Processor(data_loader, openai_client)
+    processor = Processor(
+        data_loader, openai_client, dedup_index=build_dedup_index(data_loader)
+    )
     visualizer = Visualizer()
 
     try:
@@ -82,10 +78,11 @@ def process_all_exams():
         results = processor.process_all_exams()
 
         # Generate visualizations
-        visualizer.generate_exam_summary(results)
-        visualizer.generate_timing_visualization(results)
-        visualizer.generate_score_visualization(results)
-        visualizer.generate_corrections_table(results)
+        with memory_stage("visualize"):
+            visualizer.generate_exam_summary(results)
+            visualizer.generate_timing_visualization(results)
+            visualizer.generate_score_visualization(results)
+            visualizer.generate_corrections_table(results)
 
         logger.info(f"Processing complete for all exams")
         logger.info(f"Total exams processed: {len(results)}")
@@ -94,6 +91,48 @@ def process_all_exams():
         logger.error(f"An error occurred during exam processing: {e}", exc_info=True)
 
 
+def run_coordinator(exams: list = None, wait: bool = True):
+    """시험들을 work unit으로 나눠 큐(settings.work_queue_path)에 넣고, 끝나면 결과를 합침"""
+    logger = logging.getLogger(__name__)
+
+    coordinator = Coordinator(WorkQueue(), DataLoader())
+    coordinator.submit(exams)
+    if not wait:
+        return
+
+    try:
+        coordinator.wait()
+        results = coordinator.merge_results()
+
+        visualizer = Visualizer()
+        with memory_stage("visualize"):
+            visualizer.generate_exam_summary(results)
+            visualizer.generate_timing_visualization(results)
+            visualizer.generate_score_visualization(results)
+            visualizer.generate_corrections_table(results)
+
+        logger.info(f"Merged results for {len(results)} exams")
+        logger.info(f"Output directory: '{visualizer.output_dir}'")
+    except Exception as e:
+        logger.error(f"An error occurred while merging results: {e}", exc_info=True)
+
+
+def run_worker():
+    """큐에서 work unit을 가져와 처리 (서버마다 자체 OPENAI_API_KEY로 실행)"""
+    processor = Processor(DataLoader(), OpenAIClient())
+    Worker(WorkQueue(), processor).run(poll_interval=10)
+
+
+def run_watch(exams: list = None):
+    """data 디렉터리를 감시하며 추가/수정/삭제된 문제 파일만 다시 풀고 요약을 갱신"""
+    data_loader = DataLoader()
+    processor = Processor(data_loader, OpenAIClient())
+    evaluator = IncrementalEvaluator(
+        processor, DataWatcher(data_loader.data_dir, exams), Visualizer()
+    )
+    evaluator.watch()
+
+
 def main():
     setup_logging()
     logger = logging.getLogger(__name__)
@@ -102,12 +141,27 @@ def main():
     # 모든 시험을 처리하려면:
     # process_all_exams()
 
-    # 특정 시험만 처리하려면:
-    process_single_exam(
-        exam_name="2023_1형",
-        start_num=1,  # Optional: 시작 문제 번호
-        end_num=10,  # Optional: 끝 문제 번호
-    )
+    # 여러 서버에 나눠 처리하려면 (WORK_QUEUE_PATH는 모든 서버가 접근할 수 있는 경로):
+    # coordinator 서버에서 run_coordinator(), 각 worker 서버에서 run_worker()
+
+    # 문제 파일을 편집하면서 바뀐 문제만 다시 풀려면:
+    # run_watch(exams=["2023_1형"])
+
+    # 실행 중 지표 (METRICS_ENABLED, METRICS_PORT): /metrics, output/metrics.json
+    exporter = MetricsExporter().start() if metrics.enabled else None
+    try:
+        # 특정 시험만 처리하려면:
+        process_single_exam(
+            exam_name="2023_1형",
+            start_num=1,  # Optional: 시작 문제 번호
+            end_num=10,  # Optional: 끝 문제 번호
+        )
+    finally:
+        if exporter is not None:
+            exporter.stop()
+
+    if profiler.enabled:
+        profiler.write_summary(settings.output_dir / "memory_profile.json")
 
     logger.info("Program completed")
 
@@ -0,0 +1,150 @@
+# src/cascade.py
+import argparse
+import logging
+import math
+import re
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from openai.types.chat import ChatCompletion
+
+from src import serialization
+from src.debug_writer import read_debug_entries
+
+logger = logging.getLogger(__name__)
+
+# 모델별 가격 (USD / 1M tokens, input, output)
+MODEL_PRICES = {
+    "gpt-4o": (2.50, 10.00),
+    "gpt-4o-2024-08-06": (2.50, 10.00),
+    "gpt-4o-mini": (0.15, 0.60),
+    "gpt-4o-mini-2024-07-18": (0.15, 0.60),
+}
+
+# 응답 JSON(스트리밍 중인 부분 포함)에서 selected_answer 값을 찾는 패턴
+ANSWER_PATTERN = re.compile(r'"selected_answer"\s*:\s*"([1-5])"')
+
+
+def answer_confidence(response: ChatCompletion) -> Optional[float]:
+    """selected_answer 값 토큰의 확률 (logprobs=True로 요청한 응답에서만)
+
+    structured output은 스키마 순서대로 selected_answer가 먼저 나오므로 그 앞의
+    토큰은 모두 ASCII이고, 토큰 문자열 길이를 누적해 답 위치의 토큰을 찾는다.
+    """
+    choice = response.choices[0]
+    content = choice.message.content or ""
+    match = ANSWER_PATTERN.search(content)
+    if match is None or choice.logprobs is None or not choice.logprobs.content:
+        return None
+
+    target = match.start(1)
+    offset = 0
+    for token in choice.logprobs.content:
+        end = offset + len(token.token)
+        if offset <= target < end:
+            return math.exp(token.logprob)
+        offset = end
+    return None
+
+
+def request_cost(model: str, usage) -> Optional[float]:
+    """usage(prompt/completion 토큰 수)로 계산한 요청 비용 (USD). 가격을 모르면 None"""
+    prices = MODEL_PRICES.get(model)
+    if prices is None or usage is None:
+        return None
+    input_price, output_price = prices
+    return (
+        usage.prompt_tokens * input_price + usage.completion_tokens * output_price
+    ) / 1e6
+
+
+def tier_report(entries: Iterable[Dict]) -> Dict[str, Dict[str, float]]:
+    """debug 항목의 cascade 기록으로 모델(tier)별 정확도, 지연 시간, 비용을 집계
+
+    answered/accuracy는 그 tier가 최종 답을 낸 문제 기준이고, requests/latency/cost는
+    그 tier로 보낸 모든 요청 기준이다.
+    """
+    report: Dict[str, Dict[str, float]] = {}
+    for entry in entries:
+        attempts = entry.get("cascade")
+        if not attempts:
+            continue
+        for index, attempt in enumerate(attempts):
+            tier = report.setdefault(
+                attempt["model"],
+                {"requests": 0, "answered": 0, "correct": 0, "latency": 0.0, "cost": 0.0},
+            )
+            tier["requests"] += 1
+            tier["latency"] += attempt.get("latency") or 0.0
+            tier["cost"] += attempt.get("cost") or 0.0
+            if index == len(attempts) - 1 and "error" not in attempt:
+                tier["answered"] += 1
+                tier["correct"] += bool(entry.get("is_correct"))
+
+    for tier in report.values():
+        tier["accuracy"] = tier["correct"] / tier["answered"] if tier["answered"] else 0.0
+        tier["mean_latency"] = tier["latency"] / tier["requests"]
+    return report
+
+
+def calibrate_threshold(
+    entries: Iterable[Dict], target_accuracy: float
+) -> Optional[float]:
+    """빠른 모델의 답을 그대로 쓸 최소 confidence
+
+    confidence가 threshold 이상인 문제들에서 빠른 모델의 정확도가 target_accuracy
+    이상이 되는 가장 낮은 threshold를 고른다. (첫 번째 시도의 답과 정답만 쓰므로
+    실제로 escalate된 문제도 보정에 사용된다.) 조건을 만족하는 값이 없으면 None.
+    """
+    samples = []
+    for entry in entries:
+        attempts = entry.get("cascade")
+        if not attempts or attempts[0].get("confidence") is None:
+            continue
+        first = attempts[0]
+        samples.append(
+            (
+                first["confidence"],
+                str(first["selected_answer"]).upper()
+                == str(entry["correct_answer"]).upper(),
+            )
+        )
+
+    samples.sort(key=lambda sample: -sample[0])
+    threshold = None
+    correct = 0
+    for count, (confidence, is_correct) in enumerate(samples, start=1):
+        correct += is_correct
+        # 같은 confidence 묶음의 끝에서만 판정 (threshold는 묶음 전체를 포함)
+        if count < len(samples) and samples[count][0] == confidence:
+            continue
+        if correct / count >= target_accuracy:
+            threshold = confidence
+    logger.info(
+        f"Calibrated cascade threshold {threshold} from {len(samples)} samples "
+        f"(target accuracy {target_accuracy:.2%})"
+    )
+    return threshold
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Report per-tier cascade stats and calibrate the threshold "
+        "from stored debug files"
+    )
+    parser.add_argument("debug_files", type=Path, nargs="+")
+    parser.add_argument("--target-accuracy", type=float, default=0.9)
+    args = parser.parse_args()
+
+    entries: List[Dict] = [
+        entry for path in args.debug_files for entry in read_debug_entries(path)
+    ]
+    report = {
+        "tiers": tier_report(entries),
+        "threshold": calibrate_threshold(entries, args.target_accuracy),
+    }
+    print(serialization.dumps(report, indent=True).decode("utf-8"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+# src/concurrency.py
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+import openai
+
+logger = logging.getLogger(__name__)
+
+
+def classify_error(error: BaseException) -> Optional[str]:
+    """동시성을 줄여야 하는 오류이면 종류를, 아니면 None을 반환"""
+    if isinstance(error, openai.RateLimitError):
+        return "rate_limit"
+    if isinstance(error, openai.APIStatusError) and error.status_code >= 500:
+        return "server_error"
+    if isinstance(error, (openai.APITimeoutError, openai.APIConnectionError)):
+        return "timeout"
+    return None
+
+
+class AIMDController:
+    """지연 시간과 429/5xx 응답으로 동시 요청 수를 조절하는 AIMD 컨트롤러
+
+    성공한 요청의 지연 시간이 기준(관측된 낮은 지연 시간의 이동 평균)의
+    latency_tolerance배 이내이면 한도를 요청 하나당 increase / limit만큼 늘린다
+    (한도만큼 성공하면 +increase). 429/5xx/timeout이나 지연 급증이 생기면 한도를
+    decrease_factor배로 줄이고, 그때 이미 보낸 요청들의 실패로 연달아 줄지 않도록
+    cooldown 동안은 다시 줄이지 않는다.
+    """
+
+    def __init__(
+        self,
+        initial_limit: float = 4,
+        min_limit: float = 1,
+        max_limit: float = 64,
+        increase: float = 1.0,
+        decrease_factor: float = 0.5,
+        latency_tolerance: float = 2.0,
+        baseline_weight: float = 0.05,
+        cooldown: Optional[float] = None,
+    ):
+        self.limit = float(initial_limit)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.increase = increase
+        self.decrease_factor = decrease_factor
+        self.latency_tolerance = latency_tolerance
+        self.baseline_weight = baseline_weight
+        # None이면 기준 지연 시간만큼 (요청 한 번이 끝나는 시간)
+        self.cooldown = cooldown
+        self.baseline_latency: Optional[float] = None
+        self.in_flight = 0
+        self.successes = 0
+        self.errors = 0
+        self.decreases = 0
+        self._last_decrease = 0.0
+        self._condition = threading.Condition()
+
+    def acquire(self):
+        with self._condition:
+            while self.in_flight >= int(self.limit):
+                self._condition.wait()
+            self.in_flight += 1
+
+    def _release(self):
+        self.in_flight -= 1
+        self._condition.notify_all()
+
+    def _decrease(self, reason: str):
+        now = time.monotonic()
+        cooldown = self.cooldown
+        if cooldown is None:
+            cooldown = self.baseline_latency or 0.0
+        if now - self._last_decrease < cooldown:
+            return
+        previous = self.limit
+        self.limit = max(self.min_limit, self.limit * self.decrease_factor)
+        self._last_decrease = now
+        self.decreases += 1
+        logger.info(
+            f"Concurrency limit {previous:.1f} -> {self.limit:.1f} ({reason}, "
+            f"in flight {self.in_flight})"
+        )
+
+    def on_success(self, latency: float):
+        with self._condition:
+            self._release()
+            self.successes += 1
+            baseline = self.baseline_latency
+            if baseline is not None and latency > self.latency_tolerance * baseline:
+                self._decrease(f"latency {latency:.2f}s vs baseline {baseline:.2f}s")
+                return
+
+            # 기준 지연 시간은 지연 급증이 아닌 요청만으로 천천히 갱신
+            if baseline is None:
+                self.baseline_latency = latency
+            else:
+                self.baseline_latency = baseline + self.baseline_weight * (
+                    latency - baseline
+                )
+            previous = int(self.limit)
+            self.limit = min(self.max_limit, self.limit + self.increase / self.limit)
+            if int(self.limit) > previous:
+                logger.debug(f"Concurrency limit increased to {int(self.limit)}")
+
+    def on_error(self, error: BaseException):
+        with self._condition:
+            self._release()
+            self.errors += 1
+            kind = classify_error(error)
+            if kind is not None:
+                self._decrease(kind)
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        """한도 안에서 요청 하나를 실행하고 결과(지연 시간/오류)를 반영"""
+        self.acquire()
+        start = time.perf_counter()
+        try:
+            yield
+        except BaseException as e:
+            self.on_error(e)
+            raise
+        self.on_success(time.perf_counter() - start)
+
+    def stats(self) -> dict:
+        with self._condition:
+            return {
+                "limit": self.limit,
+                "in_flight": self.in_flight,
+                "baseline_latency": self.baseline_latency,
+                "successes": self.successes,
+                "errors": self.errors,
+                "decreases": self.decreases,
+            }
@@ -2,6 +2,7 @@
 from pydantic_settings import BaseSettings
 from pydantic import Field
 from pathlib import Path
+from typing import Literal, Optional
 
 
 class Settings(BaseSettings):
@@ -10,6 +11,84 @@ class Settings(BaseSettings):
     data_dir: Path = Field(Path("data"), alias="DATA_DIR")
     output_dir: Path = Field(Path("output"), alias="OUTPUT_DIR")
 
+    # 프롬프트/추론 같은 큰 payload 로그의 샘플링 설정
+    log_payload_rate_limit: int = Field(5, alias="LOG_PAYLOAD_RATE_LIMIT")
+    log_payload_sample_every: int = Field(100, alias="LOG_PAYLOAD_SAMPLE_EVERY")
+    log_payload_max_chars: int = Field(500, alias="LOG_PAYLOAD_MAX_CHARS")
+    log_trace_payloads: bool = Field(False, alias="LOG_TRACE_PAYLOADS")
+
+    # debug JSONL 압축 방식 (None, "gzip", "zstd")
+    debug_compression: Optional[Literal["gzip", "zstd"]] = Field(
+        None, alias="DEBUG_COMPRESSION"
+    )
+
+    # span 트레이싱 (output/debug/<exam>_trace.json 으로 저장)
+    trace_enabled: bool = Field(False, alias="TRACE_ENABLED")
+
+    # 동시 API 요청 수 (process_all_exams를 프로세스 풀로 돌리면 worker들이 나눠 가짐)
+    max_concurrency: int = Field(1, alias="MAX_CONCURRENCY")
+    # process_all_exams에서 시험을 병렬로 처리할 프로세스 수 (1이면 순차 처리)
+    exam_workers: int = Field(1, alias="EXAM_WORKERS")
+
+    # OpenAI SDK가 공유하는 HTTP 연결 풀 설정
+    http_max_connections: int = Field(100, alias="HTTP_MAX_CONNECTIONS")
+    http_max_keepalive_connections: int = Field(
+        20, alias="HTTP_MAX_KEEPALIVE_CONNECTIONS"
+    )
+    http_keepalive_expiry: float = Field(30.0, alias="HTTP_KEEPALIVE_EXPIRY")
+    http_connect_timeout: float = Field(5.0, alias="HTTP_CONNECT_TIMEOUT")
+    http_read_timeout: float = Field(600.0, alias="HTTP_READ_TIMEOUT")
+    http_proxy: Optional[str] = Field(None, alias="HTTP_PROXY_URL")
+    http2: bool = Field(False, alias="HTTP2")
+    openai_max_retries: int = Field(2, alias="OPENAI_MAX_RETRIES")
+
+    # AIMD 방식으로 동시 요청 수를 자동 조절 (max_concurrency가 상한)
+    adaptive_concurrency: bool = Field(False, alias="ADAPTIVE_CONCURRENCY")
+    adaptive_initial_limit: int = Field(4, alias="ADAPTIVE_INITIAL_LIMIT")
+
+    # 느린 API 호출에 중복 요청(hedge)을 보내는 설정 (기본 꺼짐)
+    hedge_enabled: bool = Field(False, alias="HEDGE_ENABLED")
+    hedge_quantile: float = Field(0.95, alias="HEDGE_QUANTILE")
+    hedge_max_ratio: float = Field(0.05, alias="HEDGE_MAX_RATIO")
+
+    # 모델 cascade: 빠른 모델에 먼저 묻고 confidence가 낮으면 model_name으로 escalate
+    cascade_fast_model: Optional[str] = Field(None, alias="CASCADE_FAST_MODEL")
+    cascade_threshold: float = Field(0.9, alias="CASCADE_THRESHOLD")
+
+    # answer-only 모드: 풀이 없이 답 번호만 스트리밍으로 받음 (정확도 측정용)
+    answer_only: bool = Field(False, alias="ANSWER_ONLY")
+    answer_only_max_tokens: int = Field(16, alias="ANSWER_ONLY_MAX_TOKENS")
+
+    # 단계별 메모리 프로파일 (output/memory_profile.json), top=0이면 tracemalloc 없이 RSS만
+    memory_profile: bool = Field(False, alias="MEMORY_PROFILE")
+    memory_profile_top: int = Field(10, alias="MEMORY_PROFILE_TOP")
+
+    # 시험 간 중복 문제 탐지: 유사도가 threshold 이상이고 보기가 같으면 검증된 답을 재사용
+    dedup_enabled: bool = Field(False, alias="DEDUP_ENABLED")
+    dedup_threshold: float = Field(0.92, alias="DEDUP_THRESHOLD")
+
+    # watch 모드: data 디렉터리를 polling하며 바뀐 문제만 다시 풀기
+    watch_interval: float = Field(1.0, alias="WATCH_INTERVAL")
+    watch_state_path: Path = Field(Path("output/watch_state.json"), alias="WATCH_STATE_PATH")
+    # API 호출이 연속으로 이만큼 실패한 파일은 다시 수정될 때까지 재시도하지 않음
+    watch_max_retries: int = Field(3, alias="WATCH_MAX_RETRIES")
+
+    # 실행 중 지표: port를 정하면 /metrics(Prometheus), /metrics.json 제공
+    # 스냅샷 파일은 snapshot_interval초마다 갱신
+    metrics_enabled: bool = Field(False, alias="METRICS_ENABLED")
+    metrics_host: str = Field("127.0.0.1", alias="METRICS_HOST")
+    metrics_port: Optional[int] = Field(None, alias="METRICS_PORT")
+    metrics_snapshot_interval: float = Field(10.0, alias="METRICS_SNAPSHOT_INTERVAL")
+    metrics_snapshot_path: Path = Field(Path("output/metrics.json"), alias="METRICS_SNAPSHOT_PATH")
+
+    # 여러 서버에 시험을 나눠 처리할 때 쓰는 작업 큐 (coordinator/worker 모드)
+    work_queue_path: Path = Field(Path("output/work_queue.db"), alias="WORK_QUEUE_PATH")
+    # 이어서 처리할 coordinator 실행 id (없으면 새 실행)
+    work_run_id: Optional[str] = Field(None, alias="WORK_RUN_ID")
+    work_shard_size: int = Field(20, alias="WORK_SHARD_SIZE")
+    work_lease_timeout: float = Field(300.0, alias="WORK_LEASE_TIMEOUT")
+    work_max_attempts: int = Field(3, alias="WORK_MAX_ATTEMPTS")
+
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
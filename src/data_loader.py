@@ -1,11 +1,12 @@
 # src/data_loader.py
-import json
 import logging
 from pathlib import Path
 from typing import List
 
 from src.config import settings
 from src.models import Question
+from src.serialization import JSONDecodeError, load_question, load_question_list
+from src.tracing import traced
 
 logger = logging.getLogger(__name__)
 
@@ -17,6 +18,7 @@ class DataLoader:
         self.data_dir = data_dir
         logger.debug(f"DataLoader initialized with data_dir: {self.data_dir}")
 
+    @traced("load_questions")
     def load_questions(
         self, exam_name: str, start_num: int = None, end_num: int = None
     ) -> List[Question]:
@@ -53,15 +55,38 @@ class DataLoader:
 
         for file_path in json_files:
             try:
-                with file_path.open("r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    question = Question(**data)
-                    questions.append(question)
+                question = load_question(file_path)
+                questions.append(question)
                 logger.debug(f"Loaded question ID: {question.id} from {file_path.name}")
-            except json.JSONDecodeError as e:
+            except JSONDecodeError as e:
                 logger.error(f"JSON decode error in file {file_path}: {e}")
             except Exception as e:
                 logger.error(f"Error loading question from file {file_path}: {e}")
 
         logger.info(f"Loaded {len(questions)} questions from {exam_name}")
         return questions
+
+    def load_question_file(self, file_path: Path) -> List[Question]:
+        """Load a JSON file holding an array of questions, validated in one pass"""
+        questions = load_question_list(file_path)
+        logger.info(f"Loaded {len(questions)} questions from {file_path}")
+        return questions
+
+    def get_all_exams(self) -> List[str]:
+        """Return the names of all exam folders that contain question files"""
+        if not self.data_dir.exists():
+            logger.error(f"Data directory does not exist: {self.data_dir}")
+            return []
+
+        exams = sorted(
+            path.name
+            for path in self.data_dir.iterdir()
+            if path.is_dir() and any(path.glob("*.json"))
+        )
+        logger.debug(f"Found {len(exams)} exams in {self.data_dir}")
+        return exams
+
+    def get_question_numbers(self, exam_name: str) -> List[int]:
+        """Return the sorted question numbers available for an exam"""
+        exam_path = self.data_dir / exam_name
+        return sorted(int(path.stem) for path in exam_path.glob("*.json"))
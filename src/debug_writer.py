@@ -0,0 +1,217 @@
+# src/debug_writer.py
+import argparse
+import gzip
+import json
+import logging
+import queue
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import IO, Dict, Iterator, Optional
+
+from src import serialization
+
+logger = logging.getLogger(__name__)
+
+COMPRESSION_SUFFIXES = {None: ".jsonl", "gzip": ".jsonl.gz", "zstd": ".jsonl.zst"}
+
+_CLOSE = object()
+
+
+def _open_stream(path: Path, compression: Optional[str]) -> IO[bytes]:
+    if compression is None:
+        return path.open("wb")
+    if compression == "gzip":
+        return gzip.open(path, "wb", compresslevel=6)
+    if compression == "zstd":
+        try:
+            import zstandard
+        except ImportError as e:
+            raise ImportError(
+                "zstd compression requires the 'zstandard' package"
+            ) from e
+        return zstandard.ZstdCompressor().stream_writer(path.open("wb"))
+    raise ValueError(f"Unsupported debug compression: {compression}")
+
+
+def _flush_stream(stream: IO[bytes], compression: Optional[str]):
+    if compression == "zstd":
+        import zstandard
+
+        # 블록 경계까지 압축해 두어 중간에 종료되어도 앞부분은 복원 가능
+        stream.flush(zstandard.FLUSH_BLOCK)
+    else:
+        # GzipFile.flush()는 Z_SYNC_FLUSH로 지금까지의 데이터를 모두 내보냄
+        stream.flush()
+
+
+class DebugWriter:
+    """debug 항목을 완료되는 즉시 compact JSONL로 추가 기록하는 스트리밍 writer
+
+    write()는 큐에 넣기만 하고, 직렬화와 디스크 쓰기/flush는 백그라운드 스레드가
+    처리한다. 항목을 메모리에 모아두지 않으므로 시험 크기와 무관하게 메모리가 일정하고,
+    실행이 중간에 죽어도 마지막 flush까지의 항목은 파일에 남는다.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        compression: Optional[str] = None,
+        flush_interval: float = 1.0,
+    ):
+        self.path = Path(path)
+        self.compression = compression
+        self.flush_interval = flush_interval
+        self.entries_written = 0
+        self._queue: "queue.SimpleQueue" = queue.SimpleQueue()
+        self._stream = _open_stream(self.path, compression)
+        self._error: Optional[BaseException] = None
+        self._thread = threading.Thread(
+            target=self._run, name=f"debug-writer-{self.path.name}", daemon=True
+        )
+        self._thread.start()
+
+    @classmethod
+    def for_exam(
+        cls, debug_dir: Path, exam_name: str, compression: Optional[str] = None
+    ) -> "DebugWriter":
+        suffix = COMPRESSION_SUFFIXES.get(compression, ".jsonl")
+        return cls(debug_dir / f"{exam_name}_debug{suffix}", compression)
+
+    def write(self, entry: Dict):
+        self._queue.put(entry)
+
+    def _run(self):
+        last_flush = time.monotonic()
+        dirty = False
+        while True:
+            timeout = max(0.0, self.flush_interval - (time.monotonic() - last_flush))
+            try:
+                entry = self._queue.get(timeout=timeout if dirty else None)
+            except queue.Empty:
+                entry = None
+
+            if entry is _CLOSE:
+                break
+            if entry is not None:
+                try:
+                    self._stream.write(serialization.dumps_line(entry))
+                    self.entries_written += 1
+                    dirty = True
+                except Exception as e:
+                    self._error = e
+                    logger.error(f"Failed to write debug entry to {self.path}: {e}")
+
+            if dirty and time.monotonic() - last_flush >= self.flush_interval:
+                _flush_stream(self._stream, self.compression)
+                last_flush = time.monotonic()
+                dirty = False
+
+    def close(self):
+        """남은 항목을 모두 기록하고 파일을 닫음"""
+        if not self._thread.is_alive():
+            return
+        self._queue.put(_CLOSE)
+        self._thread.join()
+        self._stream.close()
+        logger.info(
+            f"Debug information saved to {self.path} ({self.entries_written} entries)"
+        )
+
+    def __enter__(self) -> "DebugWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+
+def _iter_raw_chunks(path: Path, chunk_size: int = 1 << 16) -> Iterator[bytes]:
+    """압축을 푼 바이트 청크를 생성. 잘린 압축 스트림은 복원 가능한 부분까지만 반환"""
+    if path.suffix == ".zst":
+        import zstandard
+
+        with zstandard.ZstdDecompressor().stream_reader(path.open("rb")) as stream:
+            while True:
+                try:
+                    chunk = stream.read(chunk_size)
+                except zstandard.ZstdError as e:
+                    logger.warning(f"Debug file {path} is truncated: {e}")
+                    return
+                if not chunk:
+                    return
+                yield chunk
+
+    with path.open("rb") as f:
+        if path.suffix != ".gz":
+            yield from iter(lambda: f.read(chunk_size), b"")
+            return
+
+        # GzipFile은 잘린 파일에서 EOFError를 내므로 zlib로 직접 풀어 앞부분을 살림
+        decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        for raw in iter(lambda: f.read(chunk_size), b""):
+            while raw:
+                yield decompressor.decompress(raw)
+                raw = decompressor.unused_data
+                if raw:
+                    # 여러 gzip 멤버가 이어진 경우
+                    decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        if not decompressor.eof:
+            logger.warning(f"Debug file {path} is truncated")
+
+
+def read_debug_entries(path: Path) -> Iterator[Dict]:
+    """JSONL debug 파일(.jsonl / .jsonl.gz / .jsonl.zst)의 항목을 순서대로 읽음
+
+    비정상 종료로 마지막 줄이나 압축 블록이 잘린 경우 온전한 항목까지만 반환한다.
+    """
+    path = Path(path)
+    buffer = b""
+    for chunk in _iter_raw_chunks(path):
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            if line.strip():
+                yield serialization.loads(line)
+
+    if buffer.strip():
+        try:
+            yield serialization.loads(buffer)
+        except serialization.JSONDecodeError:
+            logger.warning(f"Skipping incomplete last entry in {path}")
+
+
+def convert_to_legacy(jsonl_path: Path, json_path: Optional[Path] = None) -> Path:
+    """JSONL debug 파일을 기존 indent=2 JSON 배열 형식으로 변환 (항목 단위 스트리밍)"""
+    jsonl_path = Path(jsonl_path)
+    if json_path is None:
+        name = jsonl_path.name.split(".jsonl")[0]
+        json_path = jsonl_path.with_name(f"{name}.json")
+
+    # 기존 json.dump(indent=2) 출력과 바이트 단위로 같도록 표준 json 사용
+    with Path(json_path).open("w", encoding="utf-8") as f:
+        first = True
+        for entry in read_debug_entries(jsonl_path):
+            text = json.dumps(entry, indent=2, ensure_ascii=False, default=str)
+            f.write("[\n" if first else ",\n")
+            f.write("\n".join("  " + line for line in text.splitlines()))
+            first = False
+        f.write("[]" if first else "\n]")
+
+    logger.info(f"Converted {jsonl_path} to {json_path}")
+    return Path(json_path)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Convert streamed JSONL debug output to the legacy JSON format"
+    )
+    parser.add_argument("jsonl_path", type=Path)
+    parser.add_argument("json_path", type=Path, nargs="?", default=None)
+    args = parser.parse_args()
+    print(convert_to_legacy(args.jsonl_path, args.json_path))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,333 @@
+# src/dedup.py
+import hashlib
+import logging
+import re
+import threading
+import unicodedata
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from src import serialization
+from src.data_loader import DataLoader
+from src.debug_writer import read_debug_entries
+from src.models import Question
+
+logger = logging.getLogger(__name__)
+
+# 공백, 문장부호, 보기 번호 표기(①, 1., (1) 등)는 비교에서 무시
+_IGNORED = re.compile(r"[\s\W_]+", re.UNICODE)
+_OPTION_PREFIX = re.compile(r"^\s*(?:[①-⑤]|\(?[1-5][.)])\s*")
+# 정규화한(공백 제거) 문제 문장에서 묻는 방향을 뒤집는 표현 (옳은 것은? / 옳지 않은 것은?)
+_NEGATIVE = re.compile(
+    r"(?:옳|적절하|타당하|맞|해당하|포함되|관련)지않|아닌|틀린|잘못된|부적절한"
+)
+
+
+def normalize_text(text: str) -> str:
+    text = unicodedata.normalize("NFKC", text).lower()
+    return _IGNORED.sub("", text)
+
+
+def normalize_options(options: List[str]) -> List[str]:
+    return [normalize_text(_OPTION_PREFIX.sub("", option)) for option in options]
+
+
+def _normalize_data(data: Optional[Dict]) -> str:
+    if not data:
+        return ""
+    return normalize_text(serialization.dumps(data).decode("utf-8"))
+
+
+def question_hash(question: Question) -> str:
+    """정규화한 문제, 보기, 자료의 해시 (표기만 다른 완전 중복 판정용)"""
+    parts = [normalize_text(question.question), *normalize_options(question.options)]
+    parts.append(_normalize_data(question.data))
+    return hashlib.sha1("\x1f".join(parts).encode("utf-8")).hexdigest()
+
+
+def stem_polarity(text: str) -> int:
+    """문제 문장의 부정 표현 수
+
+    "옳은 것은?"과 "옳지 않은 것은?"은 글자 대부분이 같아 n-gram 유사도가 매우 높지만
+    정답이 정반대이므로, 유사 중복의 답을 재사용하기 전에 이 값이 같은지 확인한다.
+    """
+    return len(_NEGATIVE.findall(normalize_text(text)))
+
+
+def embed_text(text: str, dim: int = 4096, ngram: int = 3) -> np.ndarray:
+    """문자 n-gram을 해싱한 단위 벡터 (연도, 금액, 조사만 바뀐 문제도 가깝게 나옴)
+
+    외부 임베딩 모델 없이 프로세스/실행 간 같은 값이 나오도록 crc32로 해싱한다.
+    """
+    vector = np.zeros(dim, dtype=np.float32)
+    text = normalize_text(text)
+    if len(text) < ngram:
+        text = text.ljust(ngram)
+    for i in range(len(text) - ngram + 1):
+        vector[zlib.crc32(text[i : i + ngram].encode("utf-8")) % dim] += 1.0
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm else vector
+
+
+def embed_question(question: Question, dim: int = 4096) -> np.ndarray:
+    text = " ".join([question.question, *question.options])
+    return embed_text(text, dim)
+
+
+@dataclass
+class DuplicateMatch:
+    question_id: str
+    exam_name: Optional[str]
+    similarity: float
+    exact: bool
+
+
+@dataclass
+class _Answer:
+    selected_answer: str
+    reasoning: List[str]
+
+
+def remap_answer(
+    answer: str, source_options: List[str], target_options: List[str]
+) -> Optional[str]:
+    """보기 내용이 같으면 source 문제의 답 번호를 target 문제의 번호로 변환
+
+    보기 순서만 바뀐 경우도 처리한다. 보기 집합이 다르면 None.
+    """
+    source = normalize_options(source_options)
+    target = normalize_options(target_options)
+    if sorted(source) != sorted(target) or len(set(target)) != len(target):
+        return None
+    if not answer.isdigit() or not 1 <= int(answer) <= len(source):
+        return answer if source == target else None
+    return str(target.index(source[int(answer) - 1]) + 1)
+
+
+class DuplicateIndex:
+    """여러 시험의 문제를 모아 둔 중복 문제 색인
+
+    정규화 해시가 같으면 완전 중복, 문자 n-gram 임베딩의 코사인 유사도가
+    threshold 이상이면 유사 중복으로 본다. 유사 중복 중 보기와 자료가 같고
+    검증된(정답이었던) 답이 있는 문제는 API를 호출하지 않고 그 답을 재사용한다.
+    문제 id는 시험 안에서만 고유하므로(Q1, Q2 ...) 문제는 (시험 이름, id)로 구분하고,
+    같은 시험의 문제끼리는 매칭하지 않는다.
+    """
+
+    def __init__(self, threshold: float = 0.92, dim: int = 4096):
+        self.threshold = threshold
+        self.dim = dim
+        self._questions: List[Question] = []
+        self._exams: List[Optional[str]] = []
+        self._by_hash: Dict[str, List[int]] = {}
+        self._vectors: List[np.ndarray] = []
+        self._matrix: Optional[np.ndarray] = None
+        # (시험 이름, 문제 id) -> 검증된 답
+        self._answers: Dict[Tuple[Optional[str], str], _Answer] = {}
+        self._lock = threading.Lock()
+        self.lookups = 0
+        self.exact_matches = 0
+        self.near_matches = 0
+        self.reused = 0
+
+    def __len__(self) -> int:
+        return len(self._questions)
+
+    def add(self, question: Question, exam_name: Optional[str] = None):
+        with self._lock:
+            index = len(self._questions)
+            self._questions.append(question)
+            self._exams.append(exam_name)
+            self._by_hash.setdefault(question_hash(question), []).append(index)
+            self._vectors.append(embed_question(question, self.dim))
+            self._matrix = None
+
+    def build(self, data_loader: DataLoader, exams: Optional[List[str]] = None) -> int:
+        """data_loader의 시험(기본: 전체)의 문제를 모두 색인. 색인한 문제 수를 반환"""
+        before = len(self)
+        for exam_name in exams or data_loader.get_all_exams():
+            for question in data_loader.load_questions(exam_name):
+                self.add(question, exam_name)
+        logger.info(f"Indexed {len(self) - before} questions for duplicate detection")
+        return len(self) - before
+
+    def record_answer(
+        self,
+        exam_name: Optional[str],
+        question_id: str,
+        selected_answer: str,
+        reasoning: List[str],
+    ):
+        """정답으로 확인된 답을 재사용 후보로 저장"""
+        with self._lock:
+            self._answers[(exam_name, question_id)] = _Answer(
+                selected_answer, list(reasoning)
+            )
+
+    def _exam_for_debug_file(self, path: Path) -> str:
+        """debug 파일 이름(<run_label>_debug.jsonl[.gz|.zst])에 해당하는 시험 이름
+
+        run_label은 시험 이름이거나 시험 이름 뒤에 '_<범위>', '_watch' 등이 붙은 형태다.
+        """
+        name = Path(path).name
+        label = name[: name.rindex("_debug")] if "_debug" in name else name
+        exams = {exam for exam in self._exams if exam}
+        if label in exams:
+            return label
+        prefixes = [exam for exam in exams if label.startswith(f"{exam}_")]
+        return max(prefixes, key=len) if prefixes else label
+
+    def load_answers(self, debug_files: Iterable[Path]) -> int:
+        """과거 debug JSONL에서 정답이었던 답을 읽어 옴. 읽은 답 수를 반환"""
+        loaded = 0
+        for path in debug_files:
+            exam_name = self._exam_for_debug_file(path)
+            for entry in read_debug_entries(path):
+                if not entry.get("is_correct") or "gpt_response" not in entry:
+                    continue
+                response = entry["gpt_response"]
+                self.record_answer(
+                    exam_name,
+                    entry["question_id"],
+                    response["selected_answer"],
+                    response.get("reasoning") or [],
+                )
+                loaded += 1
+        logger.info(f"Loaded {loaded} validated answers for reuse")
+        return loaded
+
+    def _get_matrix(self) -> np.ndarray:
+        with self._lock:
+            if self._matrix is None:
+                self._matrix = (
+                    np.vstack(self._vectors)
+                    if self._vectors
+                    else np.zeros((0, self.dim), dtype=np.float32)
+                )
+            return self._matrix
+
+    def _candidates(
+        self, question: Question, exam_name: Optional[str]
+    ) -> List[Tuple[int, float, bool]]:
+        """다른 시험 문제의 (색인 위치, 유사도, 완전 중복 여부)를 유사도가 높은 순으로"""
+        exact = [
+            (index, 1.0, True)
+            for index in self._by_hash.get(question_hash(question), [])
+            if self._exams[index] != exam_name
+        ]
+        matrix = self._get_matrix()
+        if not len(matrix):
+            return exact
+        similarities = matrix @ embed_question(question, self.dim)
+        exact_indexes = {index for index, _, _ in exact}
+        near = [
+            (int(index), float(similarities[index]), False)
+            for index in np.flatnonzero(similarities >= self.threshold)
+            if int(index) not in exact_indexes and self._exams[index] != exam_name
+        ]
+        near.sort(key=lambda candidate: -candidate[1])
+        return exact + near
+
+    def find(
+        self, question: Question, exam_name: Optional[str] = None
+    ) -> Optional[DuplicateMatch]:
+        """exam_name 외의 시험에서 가장 가까운 중복 문제 (threshold 미만이면 None)"""
+        candidates = self._candidates(question, exam_name)
+        if not candidates:
+            return None
+        index, similarity, exact = candidates[0]
+        return DuplicateMatch(
+            self._questions[index].id, self._exams[index], similarity, exact
+        )
+
+    def reusable_answer(
+        self, question: Question, exam_name: Optional[str] = None
+    ) -> Optional[Tuple[str, List[str], DuplicateMatch]]:
+        """다른 시험에서 재사용할 수 있는 (답, 풀이, 매칭)을 반환. 없으면 None
+
+        완전 중복(정규화한 문제가 같음)이거나, 유사 중복이면서 묻는 방향(stem_polarity)이
+        같은 문제의 답만 재사용한다. 방향이 다른 유사 중복은 duplicate_pairs 등 보고에만
+        쓰인다.
+        """
+        candidates = self._candidates(question, exam_name)
+        with self._lock:
+            self.lookups += 1
+            if candidates:
+                if candidates[0][2]:
+                    self.exact_matches += 1
+                else:
+                    self.near_matches += 1
+
+        data = _normalize_data(question.data)
+        polarity = stem_polarity(question.question)
+        for index, similarity, exact in candidates:
+            source = self._questions[index]
+            answer = self._answers.get((self._exams[index], source.id))
+            if answer is None or _normalize_data(source.data) != data:
+                continue
+            if not exact and stem_polarity(source.question) != polarity:
+                continue
+            selected = remap_answer(
+                answer.selected_answer, source.options, question.options
+            )
+            if selected is None:
+                continue
+            with self._lock:
+                self.reused += 1
+            match = DuplicateMatch(source.id, self._exams[index], similarity, exact)
+            logger.debug(
+                f"Reusing answer of '{source.id}' for '{question.id}' "
+                f"(similarity {similarity:.3f})"
+            )
+            return selected, answer.reasoning, match
+        return None
+
+    def _label(self, index: int) -> str:
+        exam_name = self._exams[index]
+        question_id = self._questions[index].id
+        return f"{exam_name}/{question_id}" if exam_name else question_id
+
+    def _index_pairs(self) -> List[Tuple[int, int, float]]:
+        matrix = self._get_matrix()
+        if not len(matrix):
+            return []
+        similarities = matrix @ matrix.T
+        rows, cols = np.nonzero(np.triu(similarities >= self.threshold, k=1))
+        return [
+            (i, j, float(similarities[i, j]))
+            for i, j in zip(rows.tolist(), cols.tolist())
+            if self._exams[i] != self._exams[j]
+        ]
+
+    def duplicate_pairs(self) -> List[Tuple[str, str, float]]:
+        """서로 다른 시험 사이의 ("시험/문제 id", "시험/문제 id", 유사도) 중복 쌍"""
+        return [
+            (self._label(i), self._label(j), sim) for i, j, sim in self._index_pairs()
+        ]
+
+    def inconsistent_pairs(self) -> List[Tuple[str, str, float]]:
+        """보기가 같은 중복 쌍 중 정답 번호가 서로 맞지 않는 쌍 (연도 간 일관성 점검용)"""
+        inconsistent = []
+        for i, j, similarity in self._index_pairs():
+            first, second = self._questions[i], self._questions[j]
+            expected = remap_answer(first.correct_answer, first.options, second.options)
+            if expected is not None and expected != second.correct_answer:
+                inconsistent.append((self._label(i), self._label(j), similarity))
+        return inconsistent
+
+    def report(self) -> Dict[str, float]:
+        with self._lock:
+            lookups = self.lookups
+            return {
+                "indexed": len(self._questions),
+                "validated_answers": len(self._answers),
+                "lookups": lookups,
+                "exact_matches": self.exact_matches,
+                "near_matches": self.near_matches,
+                "reused": self.reused,
+                "reuse_rate": self.reused / lookups if lookups else 0.0,
+            }
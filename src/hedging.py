@@ -0,0 +1,190 @@
+# src/hedging.py
+import logging
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, List, Optional
+
+from src.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class StreamingQuantile:
+    """P² 알고리즘(Jain & Chlamtac)으로 분위수 하나를 O(1) 메모리로 추정
+
+    관측값을 저장하지 않고 5개의 marker 높이만 갱신한다. 5개가 모이기 전에는
+    정렬된 관측값에서 바로 계산한다.
+    """
+
+    def __init__(self, quantile: float):
+        if not 0 < quantile < 1:
+            raise ValueError(f"quantile must be between 0 and 1: {quantile}")
+        self.quantile = quantile
+        self.count = 0
+        self._heights: List[float] = []
+        self._positions = [1, 2, 3, 4, 5]
+        self._desired = [1, 1 + 2 * quantile, 1 + 4 * quantile, 3 + 2 * quantile, 5]
+        self._increments = [0, quantile / 2, quantile, (1 + quantile) / 2, 1]
+
+    def add(self, value: float):
+        self.count += 1
+        heights = self._heights
+        if len(heights) < 5:
+            heights.append(value)
+            heights.sort()
+            return
+
+        if value < heights[0]:
+            heights[0] = value
+            k = 0
+        elif value >= heights[4]:
+            heights[4] = value
+            k = 3
+        else:
+            k = next(i for i in range(4) if heights[i] <= value < heights[i + 1])
+
+        positions = self._positions
+        for i in range(k + 1, 5):
+            positions[i] += 1
+        for i in range(5):
+            self._desired[i] += self._increments[i]
+
+        for i in range(1, 4):
+            d = self._desired[i] - positions[i]
+            if (d >= 1 and positions[i + 1] - positions[i] > 1) or (
+                d <= -1 and positions[i - 1] - positions[i] < -1
+            ):
+                step = 1 if d > 0 else -1
+                height = self._parabolic(i, step)
+                if not heights[i - 1] < height < heights[i + 1]:
+                    height = self._linear(i, step)
+                heights[i] = height
+                positions[i] += step
+
+    def _parabolic(self, i: int, step: int) -> float:
+        n, q = self._positions, self._heights
+        return q[i] + step / (n[i + 1] - n[i - 1]) * (
+            (n[i] - n[i - 1] + step) * (q[i + 1] - q[i]) / (n[i + 1] - n[i])
+            + (n[i + 1] - n[i] - step) * (q[i] - q[i - 1]) / (n[i] - n[i - 1])
+        )
+
+    def _linear(self, i: int, step: int) -> float:
+        n, q = self._positions, self._heights
+        return q[i] + step * (q[i + step] - q[i]) / (n[i + step] - n[i])
+
+    def value(self) -> Optional[float]:
+        if not self._heights:
+            return None
+        if self.count < 5:
+            index = min(len(self._heights) - 1, int(self.quantile * len(self._heights)))
+            return self._heights[index]
+        return self._heights[2]
+
+
+class Hedger:
+    """느린 호출에 중복 요청(hedge)을 보내 꼬리 지연을 줄임
+
+    호출이 최근 지연 시간의 quantile 분위수보다 오래 걸리면 같은 호출을 한 번 더
+    보내고 먼저 성공한 결과를 사용한다. hedge 요청 수는 전체 요청의
+    max_hedge_ratio 이하로 제한한다. 동기 SDK 호출은 중간에 끊을 수 없으므로
+    진 쪽은 아직 시작 전이면 취소하고, 이미 보내졌으면 결과를 버린다.
+
+    호출하는 스레드마다 primary와 hedge가 동시에 실행될 수 있도록 스레드 풀은 기본
+    2 * max_concurrency 크기로 만든다. 풀이 작으면 primary가 큐에서 기다린 시간까지
+    hedge 대기 시간에 포함되어 불필요한 hedge가 나간다.
+    """
+
+    def __init__(
+        self,
+        quantile: float = 0.95,
+        max_hedge_ratio: float = 0.05,
+        min_samples: int = 20,
+        max_workers: Optional[int] = None,
+    ):
+        if max_workers is None:
+            max_workers = 2 * max(1, settings.max_concurrency)
+        self.max_hedge_ratio = max_hedge_ratio
+        self.min_samples = min_samples
+        self.requests = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+        self._latency = StreamingQuantile(quantile)
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers, thread_name_prefix="hedge")
+
+    def hedge_delay(self) -> Optional[float]:
+        """hedge를 보내기까지 기다릴 시간. 표본이 부족하면 None (hedge 안 함)"""
+        with self._lock:
+            if self._latency.count < self.min_samples:
+                return None
+            return self._latency.value()
+
+    def _record_latency(self, seconds: float):
+        with self._lock:
+            self._latency.add(seconds)
+
+    def _try_acquire_hedge(self) -> bool:
+        with self._lock:
+            if self.hedges + 1 > self.max_hedge_ratio * self.requests:
+                return False
+            self.hedges += 1
+            return True
+
+    def _submit(self, func: Callable, args, kwargs) -> Future:
+        def timed_call():
+            # 큐에서 기다린 시간은 제외하고 실제 호출 시간만 측정
+            start = time.perf_counter()
+            result = func(*args, **kwargs)
+            # 성공한 호출만 지연 분포에 반영 (hedge로 진 호출 포함)
+            self._record_latency(time.perf_counter() - start)
+            return result
+
+        return self._executor.submit(timed_call)
+
+    def call(self, func: Callable, *args, **kwargs) -> Any:
+        with self._lock:
+            self.requests += 1
+
+        delay = self.hedge_delay()
+        if delay is None:
+            # 표본을 모으는 동안은 스레드를 거치지 않고 바로 호출
+            start = time.perf_counter()
+            result = func(*args, **kwargs)
+            self._record_latency(time.perf_counter() - start)
+            return result
+
+        primary = self._submit(func, args, kwargs)
+        done, _ = wait([primary], timeout=delay)
+        if done or not self._try_acquire_hedge():
+            return primary.result()
+
+        logger.debug(f"Call exceeded {delay:.2f}s, sending hedge request")
+        hedge = self._submit(func, args, kwargs)
+        pending = {primary, hedge}
+        error: Optional[BaseException] = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is not None:
+                    error = future.exception()
+                    continue
+                for loser in pending:
+                    loser.cancel()
+                if future is hedge:
+                    with self._lock:
+                        self.hedge_wins += 1
+                return future.result()
+        raise error
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "hedges": self.hedges,
+                "hedge_wins": self.hedge_wins,
+                "latency_quantile": self._latency.value(),
+            }
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
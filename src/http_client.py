@@ -0,0 +1,120 @@
+# src/http_client.py
+import logging
+import threading
+from typing import Dict, Optional
+
+import openai
+
+from src.config import settings
+from src.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+# SDK가 사용하는 HTTP 라이브러리(httpx)의 Limits 클래스
+Limits = type(openai.DEFAULT_CONNECTION_LIMITS)
+
+
+class ConnectionStats:
+    """HTTP 요청 수와 새로 연 연결/TLS handshake 수
+
+    요청마다 httpcore trace 콜백을 달아 연결 수립 이벤트를 센다. 새 연결 없이 보낸
+    요청은 keep-alive 연결을 재사용한 것이다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.new_connections = 0
+        self.tls_handshakes = 0
+
+    def _trace(self, event_name: str, info: Dict):
+        if event_name == "connection.connect_tcp.complete":
+            with self._lock:
+                self.new_connections += 1
+        elif event_name == "connection.start_tls.complete":
+            with self._lock:
+                self.tls_handshakes += 1
+
+    def on_request(self, request):
+        """httpx request event hook"""
+        with self._lock:
+            self.requests += 1
+        # SDK가 재시도할 때마다 붙이는 헤더 (첫 시도는 0)
+        if request.headers.get("x-stainless-retry-count", "0") != "0":
+            metrics.inc("retries_total")
+        request.extensions["trace"] = self._trace
+
+    def snapshot(self) -> Dict[str, float]:
+        with self._lock:
+            reused = max(0, self.requests - self.new_connections)
+            return {
+                "requests": self.requests,
+                "new_connections": self.new_connections,
+                "tls_handshakes": self.tls_handshakes,
+                "reused_connections": reused,
+                "reuse_ratio": reused / self.requests if self.requests else 0.0,
+            }
+
+
+connection_stats = ConnectionStats()
+
+_shared_client: Optional[openai.OpenAI] = None
+_shared_lock = threading.Lock()
+
+
+def build_http_client(
+    stats: ConnectionStats = connection_stats,
+    max_connections: int = settings.http_max_connections,
+    max_keepalive_connections: int = settings.http_max_keepalive_connections,
+    keepalive_expiry: float = settings.http_keepalive_expiry,
+    connect_timeout: float = settings.http_connect_timeout,
+    read_timeout: float = settings.http_read_timeout,
+    proxy: Optional[str] = settings.http_proxy,
+    http2: bool = settings.http2,
+) -> openai.DefaultHttpxClient:
+    """연결 풀 크기, keep-alive, timeout, proxy를 명시한 HTTP 클라이언트
+
+    http2=True는 h2 패키지가 필요하다.
+    """
+    return openai.DefaultHttpxClient(
+        limits=Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        ),
+        timeout=openai.Timeout(read_timeout, connect=connect_timeout),
+        proxy=proxy,
+        http2=http2,
+        event_hooks={"request": [stats.on_request]},
+    )
+
+
+def get_shared_client() -> openai.OpenAI:
+    """프로세스 안의 모든 OpenAIClient/스레드가 공유하는 SDK 클라이언트"""
+    global _shared_client
+    with _shared_lock:
+        if _shared_client is None:
+            # 동시성 자동 조절이 켜져 있으면 SDK는 재시도하지 않음. SDK 안에서 재시도하면
+            # 429/5xx가 AIMDController에 보이지 않으므로 OpenAIClient가 한도 안에서 재시도
+            max_retries = (
+                0 if settings.adaptive_concurrency else settings.openai_max_retries
+            )
+            _shared_client = openai.OpenAI(
+                api_key=settings.openai_api_key,
+                max_retries=max_retries,
+                http_client=build_http_client(),
+            )
+            logger.debug(
+                f"Shared OpenAI client created "
+                f"(max_connections={settings.http_max_connections}, "
+                f"http2={settings.http2})"
+            )
+        return _shared_client
+
+
+def close_shared_client():
+    global _shared_client
+    with _shared_lock:
+        if _shared_client is not None:
+            _shared_client.close()
+            _shared_client = None
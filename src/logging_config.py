@@ -0,0 +1,244 @@
+# src/logging_config.py
+import atexit
+import gzip
+import logging
+import multiprocessing
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from pathlib import Path
+from typing import Dict, Iterator, Optional
+
+from src.config import settings
+
+# 프롬프트/추론처럼 큰 페이로드를 기록하는 로거 이름의 접미사
+PAYLOAD_LOGGER_SUFFIX = "payload"
+
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+_listener: Optional[QueueListener] = None
+
+
+def get_payload_logger(name: str) -> logging.Logger:
+    """모듈 로거 아래의 payload 전용 로거 (예: src.openai_client.payload)"""
+    return logging.getLogger(f"{name}.{PAYLOAD_LOGGER_SUFFIX}")
+
+
+class PayloadSamplingFilter(logging.Filter):
+    """로거별 속도 제한과 샘플링
+
+    로거마다 1초당 최대 rate_limit개까지 통과시키고, 나머지는 sample_every번째
+    레코드만 통과시킨다. 같은 레코드가 여러 핸들러를 거쳐도 한 번만 판정한다.
+    """
+
+    def __init__(self, rate_limit: int = 5, sample_every: int = 100):
+        super().__init__()
+        self.rate_limit = rate_limit
+        self.sample_every = sample_every
+        self._lock = threading.Lock()
+        self._windows: Dict[str, list] = {}
+
+    def _allow(self, name: str) -> bool:
+        now = int(time.monotonic())
+        with self._lock:
+            window = self._windows.setdefault(name, [now, 0, 0])
+            if window[0] != now:
+                window[0], window[1] = now, 0
+            window[1] += 1
+            window[2] += 1
+            return window[1] <= self.rate_limit or bool(
+                self.sample_every and window[2] % self.sample_every == 0
+            )
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        allowed = getattr(record, "payload_sampled", None)
+        if allowed is None:
+            allowed = self._allow(record.name)
+            record.payload_sampled = allowed
+        return allowed
+
+
+def truncate_record(record: logging.LogRecord, max_chars: int) -> logging.LogRecord:
+    """메시지가 max_chars를 넘으면 잘라낸 사본을 반환 (원본은 트레이스 핸들러와 공유)"""
+    message = record.getMessage()
+    if len(message) <= max_chars:
+        return record
+    truncated = logging.makeLogRecord(record.__dict__)
+    truncated.msg = f"{message[:max_chars]}... [{len(message)} chars truncated]"
+    truncated.args = None
+    return truncated
+
+
+class PayloadOnlyFilter(logging.Filter):
+    def filter(self, record: logging.LogRecord) -> bool:
+        return record.name.endswith(f".{PAYLOAD_LOGGER_SUFFIX}")
+
+
+class CompressedTraceHandler(logging.Handler):
+    """payload 로그 전체를 gzip 트레이스 파일에 그대로 기록 (QueueListener 스레드에서만 호출)"""
+
+    def __init__(self, trace_file: Path):
+        super().__init__(logging.DEBUG)
+        self.trace_file = trace_file
+        self._stream = gzip.open(trace_file, "at", encoding="utf-8")
+
+    def emit(self, record: logging.LogRecord):
+        try:
+            self._stream.write(self.format(record) + "\n")
+        except Exception:
+            self.handleError(record)
+
+    def close(self):
+        try:
+            self._stream.close()
+        finally:
+            super().close()
+
+
+class _PayloadQueueHandler(QueueHandler):
+    """payload 레코드를 큐에 넣기 전에 샘플링하고 잘라냄
+
+    QueueHandler.prepare()가 호출한 스레드에서 메시지를 포맷하므로, 버려질 레코드는
+    포맷/큐잉 전에 걸러낸다. 트레이스 파일에는 payload 전체가 필요하므로 keep_all이면
+    샘플링 판정만 기록해 두고 그대로 큐에 넣는다 (_MainLogHandler가 판정을 따름).
+    """
+
+    def __init__(
+        self,
+        log_queue,
+        sampler: PayloadSamplingFilter,
+        max_chars: int,
+        keep_all: bool = False,
+    ):
+        super().__init__(log_queue)
+        self.sampler = sampler
+        self.max_chars = max_chars
+        self.keep_all = keep_all
+        self._payload_only = PayloadOnlyFilter()
+
+    def handle(self, record: logging.LogRecord) -> bool:
+        if self._payload_only.filter(record):
+            if not self.sampler.filter(record) and not self.keep_all:
+                return False
+        return super().handle(record)
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        if not self.keep_all and self._payload_only.filter(record):
+            record = truncate_record(record, self.max_chars)
+        return super().prepare(record)
+
+
+class _MainLogHandler(logging.Handler):
+    """payload 레코드는 샘플링하고 잘라낸 뒤, 나머지는 그대로 대상 핸들러로 전달"""
+
+    def __init__(
+        self, target: logging.Handler, sampler: PayloadSamplingFilter, max_chars: int
+    ):
+        super().__init__(target.level)
+        self.target = target
+        self.sampler = sampler
+        self.max_chars = max_chars
+        self._payload_only = PayloadOnlyFilter()
+
+    def handle(self, record: logging.LogRecord) -> bool:
+        if self._payload_only.filter(record):
+            if not self.sampler.filter(record):
+                return False
+            record = truncate_record(record, self.max_chars)
+        return self.target.handle(record)
+
+    def close(self):
+        self.target.close()
+        super().close()
+
+
+def setup_logging(
+    logs_dir: Path = Path("logs"),
+    payload_sample_every: int = settings.log_payload_sample_every,
+    payload_rate_limit: int = settings.log_payload_rate_limit,
+    payload_max_chars: int = settings.log_payload_max_chars,
+    trace_payloads: bool = settings.log_trace_payloads,
+) -> QueueListener:
+    """루트 로거에는 QueueHandler만 붙이고, 파일/콘솔 쓰기는 백그라운드 QueueListener가 담당"""
+    global _listener
+    if _listener is not None:
+        return _listener
+
+    logs_dir.mkdir(exist_ok=True)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    log_file = logs_dir / f"app_{timestamp}.log"
+    formatter = logging.Formatter(LOG_FORMAT)
+
+    file_handler = RotatingFileHandler(log_file, maxBytes=10**6, backupCount=5)
+    file_handler.setLevel(logging.DEBUG)
+    file_handler.setFormatter(formatter)
+
+    console_handler = logging.StreamHandler()
+    console_handler.setLevel(logging.INFO)
+    console_handler.setFormatter(formatter)
+
+    sampler = PayloadSamplingFilter(payload_rate_limit, payload_sample_every)
+    handlers = [
+        _MainLogHandler(file_handler, sampler, payload_max_chars),
+        _MainLogHandler(console_handler, sampler, payload_max_chars),
+    ]
+    if trace_payloads:
+        trace_handler = CompressedTraceHandler(logs_dir / f"trace_{timestamp}.log.gz")
+        trace_handler.setFormatter(formatter)
+        trace_handler.addFilter(PayloadOnlyFilter())
+        handlers.append(trace_handler)
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    logger = logging.getLogger()
+    logger.setLevel(logging.DEBUG)
+    logger.addHandler(
+        _PayloadQueueHandler(log_queue, sampler, payload_max_chars, trace_payloads)
+    )
+
+    _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    atexit.register(shutdown_logging)
+    return _listener
+
+
+def shutdown_logging():
+    """큐에 남은 레코드를 모두 기록하고 백그라운드 스레드를 종료"""
+    global _listener
+    if _listener is None:
+        return
+    _listener.stop()
+    for handler in _listener.handlers:
+        handler.close()
+    _listener = None
+
+
+class _ReemitHandler(logging.Handler):
+    """자식 프로세스에서 받은 레코드를 부모 프로세스의 같은 이름 로거로 다시 보냄"""
+
+    def handle(self, record: logging.LogRecord) -> bool:
+        logging.getLogger(record.name).handle(record)
+        return True
+
+
+@contextmanager
+def worker_log_queue(mp_context) -> Iterator[multiprocessing.Queue]:
+    """프로세스 풀 worker의 로그를 받아 부모의 핸들러(샘플링/파일/콘솔)로 전달하는 큐"""
+    log_queue = mp_context.Queue()
+    listener = QueueListener(log_queue, _ReemitHandler())
+    listener.start()
+    try:
+        yield log_queue
+    finally:
+        listener.stop()
+
+
+def setup_worker_logging(log_queue):
+    """worker 프로세스의 루트 로거가 모든 레코드를 부모 프로세스로 보내도록 설정"""
+    logger = logging.getLogger()
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+    logger.setLevel(logging.DEBUG)
+    logger.addHandler(QueueHandler(log_queue))
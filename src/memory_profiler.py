@@ -0,0 +1,271 @@
+# src/memory_profiler.py
+import logging
+import os
+import sys
+import threading
+import tracemalloc
+from contextlib import nullcontext
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from src import serialization
+from src.config import settings
+
+logger = logging.getLogger(__name__)
+
+_MB = 1024 * 1024
+_PROC_STATUS = Path("/proc/self/status")
+_PROC_CLEAR_REFS = Path("/proc/self/clear_refs")
+
+# 프로파일링이 꺼져 있을 때 stage()가 돌려주는 공유 no-op 컨텍스트
+_NULL_STAGE = nullcontext()
+
+
+def _proc_status(field: str) -> Optional[int]:
+    """/proc/self/status의 kB 값을 bytes로 (Linux 외에는 None)"""
+    try:
+        with _PROC_STATUS.open() as f:
+            for line in f:
+                if line.startswith(field):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return None
+
+
+def current_rss() -> Optional[int]:
+    return _proc_status("VmRSS:")
+
+
+def peak_rss() -> Optional[int]:
+    peak = _proc_status("VmHWM:")
+    if peak is not None:
+        return peak
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS는 bytes, Linux는 kB
+    return maxrss if sys.platform == "darwin" else maxrss * 1024
+
+
+def _reset_peak_rss() -> bool:
+    """peak RSS(VmHWM)를 현재 RSS로 되돌림. Linux 4.0+ 에서만 가능"""
+    try:
+        _PROC_CLEAR_REFS.write_text("5")
+        return True
+    except OSError:
+        return False
+
+
+def _mb(value: Optional[int]) -> Optional[float]:
+    return None if value is None else round(value / _MB, 2)
+
+
+class _Stage:
+    __slots__ = (
+        "profiler",
+        "name",
+        "args",
+        "rss_before",
+        "snapshot",
+        "peak",
+        "traced_before",
+        "traced_peak",
+    )
+
+    def __init__(self, profiler: "MemoryProfiler", name: str, args: Dict[str, Any]):
+        self.profiler = profiler
+        self.name = name
+        self.args = args
+        self.rss_before: Optional[int] = None
+        self.snapshot: Optional[tracemalloc.Snapshot] = None
+        self.peak: Optional[int] = None
+        self.traced_before = 0
+        self.traced_peak = 0
+
+    def __enter__(self):
+        self.profiler._enter(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.profiler._exit(self, exc_type)
+        return False
+
+
+class MemoryProfiler:
+    """단계(load, process, save, visualize ...) 경계에서 메모리를 기록하는 프로파일러
+
+    단계마다 시작/끝 RSS, 단계 중 peak RSS, tracemalloc 기준 증가량과 가장 많이 늘어난
+    할당 위치(top_n개)를 남긴다. top_n=0이면 tracemalloc 없이 RSS만 기록한다.
+    단계는 한 스레드에서 순서대로(중첩 가능) 사용하며, 바깥 단계의 peak에는 안쪽
+    단계의 peak가 포함된다. 꺼져 있을 때는 공유 no-op 컨텍스트만 반환한다.
+    """
+
+    def __init__(self, enabled: bool = False, top_n: int = 10):
+        self.enabled = enabled
+        self.top_n = top_n
+        self.records: List[Dict[str, Any]] = []
+        self._stack: List[_Stage] = []
+        self._lock = threading.Lock()
+        # peak RSS를 단계별로 되돌릴 수 없으면 프로세스 전체의 peak를 기록
+        # (첫 단계에서 결정)
+        self.peak_scope: Optional[str] = None
+
+    def stage(self, name: str, **args) -> Any:
+        if not self.enabled:
+            return _NULL_STAGE
+        return _Stage(self, name, args)
+
+    @property
+    def tracing(self) -> bool:
+        return self.top_n > 0
+
+    def _take_snapshot(self) -> tracemalloc.Snapshot:
+        return tracemalloc.take_snapshot().filter_traces(
+            (
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+                tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+            )
+        )
+
+    def _fold_peaks(self, stage: _Stage):
+        """peak 카운터를 되돌리기 전에 지금까지의 peak를 stage에 반영"""
+        rss_peak = peak_rss()
+        if rss_peak is not None:
+            stage.peak = max(stage.peak or 0, rss_peak)
+        if self.tracing:
+            stage.traced_peak = max(
+                stage.traced_peak, tracemalloc.get_traced_memory()[1]
+            )
+
+    def _enter(self, stage: _Stage):
+        with self._lock:
+            if self.tracing and not tracemalloc.is_tracing():
+                tracemalloc.start()
+            if self._stack:
+                self._fold_peaks(self._stack[-1])
+            stage.rss_before = current_rss()
+            if self.peak_scope is None:
+                self.peak_scope = "stage" if _reset_peak_rss() else "process"
+            elif self.peak_scope == "stage":
+                _reset_peak_rss()
+            if self.tracing:
+                tracemalloc.reset_peak()
+                stage.traced_before = tracemalloc.get_traced_memory()[0]
+                stage.snapshot = self._take_snapshot()
+            self._stack.append(stage)
+
+    def _exit(self, stage: _Stage, exc_type):
+        with self._lock:
+            self._fold_peaks(stage)
+            rss_after = current_rss()
+            record = {
+                "stage": stage.name,
+                **{key: str(value) for key, value in stage.args.items()},
+                "rss_before_mb": _mb(stage.rss_before),
+                "rss_after_mb": _mb(rss_after),
+                "rss_growth_mb": (
+                    _mb(rss_after - stage.rss_before)
+                    if rss_after is not None and stage.rss_before is not None
+                    else None
+                ),
+                "peak_rss_mb": _mb(stage.peak),
+            }
+            if exc_type is not None:
+                record["error"] = exc_type.__name__
+            if self.tracing and stage.snapshot is not None:
+                after = self._take_snapshot()
+                record["traced_growth_mb"] = _mb(
+                    tracemalloc.get_traced_memory()[0] - stage.traced_before
+                )
+                record["traced_peak_mb"] = _mb(stage.traced_peak)
+                record["top_allocations"] = self._top_allocations(stage.snapshot, after)
+                stage.snapshot = None
+
+            self._stack.pop()
+            if self._stack:
+                parent = self._stack[-1]
+                parent.peak = max(parent.peak or 0, stage.peak or 0)
+                parent.traced_peak = max(parent.traced_peak, stage.traced_peak)
+            self.records.append(record)
+
+    def _top_allocations(
+        self, before: tracemalloc.Snapshot, after: tracemalloc.Snapshot
+    ) -> List[Dict[str, Any]]:
+        cwd = os.getcwd()
+        top = []
+        for stat in after.compare_to(before, "lineno"):
+            if stat.size_diff <= 0:
+                continue
+            frame = stat.traceback[0]
+            filename = frame.filename
+            if filename.startswith(cwd):
+                filename = os.path.relpath(filename, cwd)
+            top.append(
+                {
+                    "location": f"{filename}:{frame.lineno}",
+                    "size_diff_kb": round(stat.size_diff / 1024, 1),
+                    "count_diff": stat.count_diff,
+                }
+            )
+            if len(top) >= self.top_n:
+                break
+        return top
+
+    def summary(self) -> Dict[str, Any]:
+        """단계 이름별 합계와 단계별 기록"""
+        with self._lock:
+            records = list(self.records)
+        by_stage: Dict[str, Dict[str, Any]] = {}
+        for record in records:
+            totals = by_stage.setdefault(
+                record["stage"],
+                {"count": 0, "rss_growth_mb": 0.0, "max_peak_rss_mb": 0.0},
+            )
+            totals["count"] += 1
+            totals["rss_growth_mb"] = round(
+                totals["rss_growth_mb"] + (record["rss_growth_mb"] or 0.0), 2
+            )
+            totals["max_peak_rss_mb"] = max(
+                totals["max_peak_rss_mb"], record["peak_rss_mb"] or 0.0
+            )
+            if "traced_growth_mb" in record:
+                totals["traced_growth_mb"] = round(
+                    totals.get("traced_growth_mb", 0.0) + record["traced_growth_mb"], 2
+                )
+        return {
+            "peak_rss_scope": self.peak_scope,
+            "process_peak_rss_mb": _mb(peak_rss()),
+            "by_stage": by_stage,
+            "stages": records,
+        }
+
+    def write_summary(self, path: Path) -> Path:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        summary = self.summary()
+        serialization.dump_file(summary, path, indent=True)
+        for name, totals in summary["by_stage"].items():
+            logger.info(
+                f"Memory stage '{name}': x{totals['count']}, "
+                f"RSS growth {totals['rss_growth_mb']:.1f} MB, "
+                f"peak {totals['max_peak_rss_mb']:.1f} MB"
+            )
+        logger.info(f"Memory profile saved to {path}")
+        return path
+
+    def clear(self):
+        with self._lock:
+            self.records = []
+
+
+profiler = MemoryProfiler(
+    enabled=settings.memory_profile, top_n=settings.memory_profile_top
+)
+
+
+def memory_stage(name: str, **args):
+    return profiler.stage(name, **args)
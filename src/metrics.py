@@ -0,0 +1,439 @@
+# src/metrics.py
+import bisect
+import logging
+import os
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from src import serialization
+from src.config import settings
+
+logger = logging.getLogger(__name__)
+
+PREFIX = "cpa_eval_"
+
+# 요청/문제 처리 시간 histogram 경계 (초)
+LATENCY_BUCKETS = (
+    0.25,
+    0.5,
+    1.0,
+    2.0,
+    3.0,
+    5.0,
+    7.5,
+    10.0,
+    15.0,
+    20.0,
+    30.0,
+    60.0,
+    120.0,
+)
+
+# (이름, 종류, 설명)
+METRICS = {
+    "questions_completed_total": ("counter", "Questions answered, per exam"),
+    "questions_correct_total": ("counter", "Questions answered correctly, per exam"),
+    "questions_failed_total": ("counter", "Questions that raised an error, per exam"),
+    "question_latency_seconds": ("histogram", "Time to answer one question"),
+    "api_requests_started_total": ("counter", "API requests sent (including hedges)"),
+    "api_requests_finished_total": ("counter", "API requests finished"),
+    "api_requests_failed_total": ("counter", "API requests that raised an error"),
+    "api_request_latency_seconds": ("histogram", "Latency of one API request"),
+    "tokens_total": ("counter", "Prompt/completion tokens reported by the API"),
+    "cached_prompt_tokens_total": (
+        "counter",
+        "Prompt tokens served from the API prompt cache (included in prompt tokens)",
+    ),
+    "retries_total": ("counter", "HTTP retries made by the OpenAI SDK"),
+    "answer_reuse_total": ("counter", "Answers reused from duplicate questions"),
+}
+
+Key = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+
+class _Shard:
+    """한 스레드만 쓰는 값 저장소 (쓰기에 lock이 필요 없음)"""
+
+    __slots__ = ("values", "histograms")
+
+    def __init__(self):
+        self.values: Dict[Key, float] = {}
+        # key -> [bucket별 개수..., +Inf 개수, 합, 전체 개수]
+        self.histograms: Dict[Key, List[float]] = {}
+
+
+def _key(name: str, labels: Dict[str, str]) -> Key:
+    return name, tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+
+class MetricsRegistry:
+    """worker 스레드에서 lock 없이 갱신하는 counter/histogram 모음
+
+    스레드마다 자기 shard(dict)에만 더하고, 읽을 때 모든 shard를 합친다. shard 등록은
+    스레드당 한 번만 lock을 잡는다. 종료된 스레드의 shard는 등록/읽기 때 retired
+    합계로 옮겨, 시험마다 새 스레드 풀을 만드는 긴 실행에서도 shard 수가 늘지 않는다.
+    꺼져 있으면 갱신 호출은 바로 반환한다.
+    """
+
+    def __init__(
+        self, enabled: bool = False, buckets: Tuple[float, ...] = LATENCY_BUCKETS
+    ):
+        self.enabled = enabled
+        self.buckets = buckets
+        self.started_at = time.time()
+        self._local = threading.local()
+        # (소유 스레드, shard). 등록/읽기/정리는 _register_lock 안에서만
+        self._shards: List[Tuple[threading.Thread, _Shard]] = []
+        # 종료된 스레드들의 합계 (더 이상 쓰는 스레드가 없음)
+        self._retired = _Shard()
+        self._register_lock = threading.Lock()
+        # 최근 처리량 계산용 (시각, 토큰 수, 완료 문제 수) 샘플. 읽는 쪽에서만 사용
+        self._samples: deque = deque(maxlen=120)
+        self._samples_lock = threading.Lock()
+
+    def _shard(self) -> _Shard:
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = self._local.shard = _Shard()
+            with self._register_lock:
+                self._retire_dead_shards()
+                self._shards.append((threading.current_thread(), shard))
+        return shard
+
+    def _retire_dead_shards(self):
+        """종료된 스레드의 shard를 retired 합계에 합침 (_register_lock 안에서 호출)"""
+        alive = []
+        for thread, shard in self._shards:
+            if thread.is_alive():
+                alive.append((thread, shard))
+            else:
+                _merge_shard(self._retired, shard.values, shard.histograms)
+        self._shards = alive
+
+    def inc(self, name: str, value: float = 1.0, **labels):
+        if not self.enabled:
+            return
+        values = self._shard().values
+        key = _key(name, labels)
+        values[key] = values.get(key, 0.0) + value
+
+    def observe(self, name: str, value: float, **labels):
+        if not self.enabled:
+            return
+        histograms = self._shard().histograms
+        key = _key(name, labels)
+        histogram = histograms.get(key)
+        if histogram is None:
+            histogram = histograms[key] = [0.0] * (len(self.buckets) + 3)
+        histogram[bisect.bisect_left(self.buckets, value)] += 1
+        histogram[-2] += value
+        histogram[-1] += 1
+
+    def clear(self):
+        with self._register_lock:
+            self._shards = []
+            self._retired = _Shard()
+        self._local = threading.local()
+        self.started_at = time.time()
+        with self._samples_lock:
+            self._samples.clear()
+
+    def collect(self) -> Tuple[Dict[Key, float], Dict[Key, List[float]]]:
+        """모든 shard를 합친 (counter 값, histogram 값)"""
+        merged = _Shard()
+        with self._register_lock:
+            self._retire_dead_shards()
+            _merge_shard(merged, self._retired.values, self._retired.histograms)
+            for _, shard in self._shards:
+                # dict.copy()는 GIL 아래에서 한 번에 실행되어 쓰는 스레드와 충돌하지 않음
+                _merge_shard(merged, shard.values.copy(), shard.histograms.copy())
+        return merged.values, merged.histograms
+
+    def _quantile(self, histogram: List[float], q: float) -> Optional[float]:
+        """bucket 안에서 선형 보간한 근사 분위수"""
+        total = histogram[-1]
+        if not total:
+            return None
+        rank = q * total
+        cumulative = 0.0
+        lower = 0.0
+        for index, upper in enumerate(self.buckets):
+            count = histogram[index]
+            if cumulative + count >= rank and count:
+                return lower + (upper - lower) * (rank - cumulative) / count
+            cumulative += count
+            lower = upper
+        return self.buckets[-1]
+
+    def _recent_rates(self, tokens: float, completed: float) -> Dict[str, float]:
+        """최근 60초(없으면 시작 이후)의 초당 토큰/문제 처리량"""
+        now = time.time()
+        with self._samples_lock:
+            self._samples.append((now, tokens, completed))
+            while len(self._samples) > 2 and now - self._samples[1][0] >= 60:
+                self._samples.popleft()
+            first = self._samples[0]
+        if first[0] == now:
+            first = (self.started_at, 0.0, 0.0)
+        elapsed = max(now - first[0], 1e-9)
+        return {
+            "tokens_per_second": (tokens - first[1]) / elapsed,
+            "questions_per_second": (completed - first[2]) / elapsed,
+        }
+
+    def snapshot(self) -> Dict:
+        """JSON 스냅샷: counter 합계, 시험별 정확도, 분위수, 처리량"""
+        values, histograms = self.collect()
+
+        def total(name: str) -> float:
+            return sum(value for (key, _), value in values.items() if key == name)
+
+        def per_exam(name: str) -> Dict[str, float]:
+            exams: Dict[str, float] = {}
+            for (key, labels), value in values.items():
+                if key == name:
+                    exam = dict(labels).get("exam", "")
+                    exams[exam] = exams.get(exam, 0.0) + value
+            return exams
+
+        completed = per_exam("questions_completed_total")
+        correct = per_exam("questions_correct_total")
+        failed = per_exam("questions_failed_total")
+        exams = {
+            exam: {
+                "completed": completed.get(exam, 0.0),
+                "correct": correct.get(exam, 0.0),
+                "failed": failed.get(exam, 0.0),
+                "accuracy": (
+                    correct.get(exam, 0.0) / completed[exam]
+                    if completed.get(exam)
+                    else 0.0
+                ),
+            }
+            for exam in sorted(set(completed) | set(failed))
+        }
+
+        latency = {}
+        for (name, labels), histogram in histograms.items():
+            latency[name] = {
+                "count": histogram[-1],
+                "mean": histogram[-2] / histogram[-1] if histogram[-1] else None,
+                "p50": self._quantile(histogram, 0.5),
+                "p90": self._quantile(histogram, 0.9),
+                "p99": self._quantile(histogram, 0.99),
+            }
+
+        # 캐시된 토큰은 prompt 토큰에 이미 포함되어 있으므로 합계에 더하지 않음
+        tokens = total("tokens_total")
+        questions = total("questions_completed_total")
+        return {
+            "timestamp": time.time(),
+            "uptime_seconds": time.time() - self.started_at,
+            "questions_completed": questions,
+            "questions_failed": total("questions_failed_total"),
+            "in_flight_requests": total("api_requests_started_total")
+            - total("api_requests_finished_total"),
+            "api_requests": total("api_requests_started_total"),
+            "api_errors": total("api_requests_failed_total"),
+            "retries": total("retries_total"),
+            "answer_reuse": total("answer_reuse_total"),
+            "tokens": tokens,
+            "cached_prompt_tokens": total("cached_prompt_tokens_total"),
+            **self._recent_rates(tokens, questions),
+            "latency": latency,
+            "exams": exams,
+        }
+
+    def prometheus(self) -> str:
+        """Prometheus text exposition format (0.0.4)"""
+        values, histograms = self.collect()
+        lines = []
+        for name, (kind, help_text) in METRICS.items():
+            metric = PREFIX + name
+            lines.append(f"# HELP {metric} {help_text}")
+            lines.append(f"# TYPE {metric} {kind}")
+            if kind == "histogram":
+                for (key, labels), histogram in sorted(histograms.items()):
+                    if key == name:
+                        lines.extend(self._histogram_lines(metric, labels, histogram))
+            else:
+                for (key, labels), value in sorted(values.items()):
+                    if key == name:
+                        lines.append(f"{metric}{_labels(labels)} {_number(value)}")
+
+        # 파생 gauge
+        in_flight = _sum(values, "api_requests_started_total") - _sum(
+            values, "api_requests_finished_total"
+        )
+        lines.append(f"# HELP {PREFIX}in_flight_requests Requests sent, not finished")
+        lines.append(f"# TYPE {PREFIX}in_flight_requests gauge")
+        lines.append(f"{PREFIX}in_flight_requests {_number(in_flight)}")
+
+        lines.append(f"# HELP {PREFIX}exam_accuracy Running accuracy per exam")
+        lines.append(f"# TYPE {PREFIX}exam_accuracy gauge")
+        for (key, labels), completed in sorted(values.items()):
+            if key == "questions_completed_total" and completed:
+                correct = values.get(("questions_correct_total", labels), 0.0)
+                lines.append(
+                    f"{PREFIX}exam_accuracy{_labels(labels)} {_number(correct / completed)}"
+                )
+        return "\n".join(lines) + "\n"
+
+    def _histogram_lines(
+        self, metric: str, labels, histogram: List[float]
+    ) -> List[str]:
+        lines = []
+        cumulative = 0.0
+        for upper, count in zip(self.buckets + (float("inf"),), histogram):
+            cumulative += count
+            le = "+Inf" if upper == float("inf") else repr(float(upper))
+            lines.append(
+                f"{metric}_bucket{_labels(labels + (('le', le),))} {_number(cumulative)}"
+            )
+        lines.append(f"{metric}_sum{_labels(labels)} {_number(histogram[-2])}")
+        lines.append(f"{metric}_count{_labels(labels)} {_number(histogram[-1])}")
+        return lines
+
+
+def _merge_shard(
+    target: _Shard, values: Dict[Key, float], histograms: Dict[Key, List[float]]
+):
+    for key, value in values.items():
+        target.values[key] = target.values.get(key, 0.0) + value
+    for key, histogram in histograms.items():
+        merged = target.histograms.setdefault(key, [0.0] * len(histogram))
+        for index, count in enumerate(list(histogram)):
+            merged[index] += count
+
+
+def _sum(values: Dict[Key, float], name: str) -> float:
+    return sum(value for (key, _), value in values.items() if key == name)
+
+
+def _number(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+def _labels(labels) -> str:
+    if not labels:
+        return ""
+    escaped = (
+        f'{key}="'
+        + value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+        + '"'
+        for key, value in labels
+    )
+    return "{" + ",".join(escaped) + "}"
+
+
+metrics = MetricsRegistry(enabled=settings.metrics_enabled)
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    registry: MetricsRegistry = metrics
+
+    def do_GET(self):
+        path = self.path.split("?")[0]
+        if path == "/metrics":
+            body = self.registry.prometheus().encode("utf-8")
+            content_type = "text/plain; version=0.0.4; charset=utf-8"
+        elif path == "/metrics.json":
+            body = serialization.dumps(self.registry.snapshot())
+            content_type = "application/json"
+        else:
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        logger.debug(f"metrics request: {format % args}")
+
+
+class MetricsExporter:
+    """로컬 HTTP 엔드포인트(/metrics, /metrics.json)와 주기적 JSON 스냅샷 파일
+
+    port=None이면 HTTP 서버 없이 스냅샷 파일만, snapshot_path=None이면 파일 없이
+    서버만 실행한다.
+    """
+
+    def __init__(
+        self,
+        registry: MetricsRegistry = metrics,
+        host: str = settings.metrics_host,
+        port: Optional[int] = settings.metrics_port,
+        snapshot_path: Optional[Path] = settings.metrics_snapshot_path,
+        snapshot_interval: float = settings.metrics_snapshot_interval,
+    ):
+        self.registry = registry
+        self.host = host
+        self.port = port
+        self.snapshot_path = Path(snapshot_path) if snapshot_path else None
+        self.snapshot_interval = snapshot_interval
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._stop = threading.Event()
+        self._threads: List[threading.Thread] = []
+
+    @property
+    def address(self) -> Optional[Tuple[str, int]]:
+        return self._server.server_address[:2] if self._server else None
+
+    def start(self) -> "MetricsExporter":
+        if self.port is not None:
+            handler = type("Handler", (_MetricsHandler,), {"registry": self.registry})
+            self._server = ThreadingHTTPServer((self.host, self.port), handler)
+            self._server.daemon_threads = True
+            self._threads.append(
+                threading.Thread(
+                    target=self._server.serve_forever, name="metrics-http", daemon=True
+                )
+            )
+            logger.info(
+                f"Metrics endpoint at http://{self.address[0]}:{self.address[1]}/metrics"
+            )
+        if self.snapshot_path is not None:
+            self._threads.append(
+                threading.Thread(
+                    target=self._write_snapshots, name="metrics-snapshot", daemon=True
+                )
+            )
+        for thread in self._threads:
+            thread.start()
+        return self
+
+    def write_snapshot(self):
+        self.snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.snapshot_path.with_suffix(".tmp")
+        serialization.dump_file(self.registry.snapshot(), tmp_path, indent=True)
+        os.replace(tmp_path, self.snapshot_path)
+
+    def _write_snapshots(self):
+        while not self._stop.wait(self.snapshot_interval):
+            try:
+                self.write_snapshot()
+            except Exception as e:
+                logger.warning(f"Could not write metrics snapshot: {e}")
+
+    def stop(self):
+        self._stop.set()
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+        for thread in self._threads:
+            thread.join(timeout=5)
+        if self.snapshot_path is not None:
+            self.write_snapshot()  # 마지막 상태
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+        return False
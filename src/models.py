@@ -17,6 +17,8 @@ class Question(BaseModel):
 class GPTResponse(BaseModel):
     selected_answer: str
     reasoning: List[str]
+    # cascade 모드에서 모델별 시도 기록 (model, selected_answer, confidence, latency, cost)
+    cascade: Optional[List[Dict]] = None
 
 
 class ComparisonResult(BaseModel):
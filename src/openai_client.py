@@ -1,22 +1,84 @@
 # src/openai_client.py
 import logging
-from typing import List, Dict, Optional
+import random
+import time
+from typing import List, Dict, Optional, Tuple
 
 import openai
 from openai.types.chat import ChatCompletion, ChatCompletionMessage
 
+from src.cascade import ANSWER_PATTERN, answer_confidence, request_cost
+from src.concurrency import AIMDController, classify_error
 from src.config import settings
+from src.hedging import Hedger
+from src.http_client import get_shared_client
+from src.logging_config import get_payload_logger
+from src.metrics import metrics
 from src.models import GPTResponse  # 기존 모델과의 호환성 유지
 from src.prompts import Prompts
-from src.schemas import AnswerResponse
+from src.schemas import AnswerOnlyResponse, AnswerResponse
+from src.tracing import traced
 
 logger = logging.getLogger(__name__)
+# 프롬프트/추론 원문은 샘플링되는 payload 로거로만 기록
+payload_logger = get_payload_logger(__name__)
+
+# 동시성 자동 조절 모드에서 직접 재시도할 때의 대기 시간 (SDK와 같은 지수 백오프)
+RETRY_BASE_DELAY = 0.5
+RETRY_MAX_DELAY = 8.0
+
+
+def _retry_delay(error: BaseException, attempt: int) -> float:
+    """retry-after 헤더가 있으면 그 값, 없으면 지터를 섞은 지수 백오프 (초)"""
+    response = getattr(error, "response", None)
+    retry_after = response.headers.get("retry-after") if response is not None else None
+    try:
+        if retry_after is not None and 0 <= float(retry_after) <= 60:
+            return float(retry_after)
+    except ValueError:
+        pass
+    delay = min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2**attempt)
+    return delay * (0.75 + random.random() / 4)
 
 
 class OpenAIClient:
-    def __init__(self, model_name: str = settings.model_name):
+    def __init__(
+        self,
+        model_name: str = settings.model_name,
+        hedger: Optional[Hedger] = None,
+        client: Optional[openai.OpenAI] = None,
+        fast_model: Optional[str] = settings.cascade_fast_model,
+        cascade_threshold: float = settings.cascade_threshold,
+        answer_only: bool = settings.answer_only,
+        concurrency: Optional[AIMDController] = None,
+        max_retries: int = settings.openai_max_retries,
+    ):
         self.model = model_name
-        openai.api_key = settings.openai_api_key
+        # fast_model이 있으면 먼저 묻고, confidence가 낮을 때만 self.model로 escalate
+        self.fast_model = fast_model
+        self.cascade_threshold = cascade_threshold
+        # 풀이 없이 답 번호만 스트리밍으로 받는 모드 (정확도 측정용)
+        self.answer_only = answer_only
+        if answer_only and fast_model is not None:
+            logger.warning("Cascade is not used in answer-only mode")
+        # 연결 풀을 재사용하도록 기본적으로 프로세스 공용 SDK 클라이언트를 사용
+        self.client = client or get_shared_client()
+        if hedger is None and settings.hedge_enabled:
+            hedger = Hedger(settings.hedge_quantile, settings.hedge_max_ratio)
+        # None이면 hedge 없이 바로 호출
+        self.hedger = hedger
+        if concurrency is None and settings.adaptive_concurrency:
+            concurrency = AIMDController(
+                initial_limit=min(
+                    settings.adaptive_initial_limit, settings.max_concurrency
+                ),
+                max_limit=settings.max_concurrency,
+            )
+        # None이면 동시 요청 수를 제한하지 않음 (호출하는 쪽의 스레드 수만큼)
+        self.concurrency = concurrency
+        # concurrency가 있을 때 429/5xx/timeout을 재시도할 횟수. 시도마다 컨트롤러를
+        # 거치므로 SDK 클라이언트는 max_retries=0이어야 한다 (공용 클라이언트는 그렇게 생성)
+        self.max_retries = max_retries
         logger.debug(f"OpenAIClient initialized with model_name: {self.model}")
 
     def get_response(
@@ -27,34 +89,206 @@ class OpenAIClient:
         기존 GPTResponse 형식과의 호환성을 유지합니다.
         """
         logger.info("Starting OpenAI API request")
+        if self.answer_only:
+            return self._get_answer_only_response(question, options, data)
+
         prompt = Prompts.get_question_prompt(question, options, data)
-        logger.debug(f"Constructed prompt:\n{prompt}")
+        if payload_logger.isEnabledFor(logging.DEBUG):
+            payload_logger.debug("Constructed prompt:\n%s", prompt)
 
         try:
-            response = self._make_api_call(
-                prompt=prompt,
-            )
-            logger.info("OpenAI API call successful")
+            cascade = None
+            if self.fast_model is not None:
+                structured_response, cascade = self._cascade(prompt)
+            else:
+                response = self._call(prompt)
+                logger.info("OpenAI API call successful")
 
-            # AnswerResponse에서 GPTResponse로 변환
-            structured_response = self._validate_and_parse_response(response)
+                # AnswerResponse에서 GPTResponse로 변환
+                structured_response = self._validate_and_parse_response(response)
+            if payload_logger.isEnabledFor(logging.DEBUG):
+                payload_logger.debug(
+                    "Reasoning:\n%s", "\n".join(structured_response.reasoning)
+                )
             return GPTResponse(
                 selected_answer=structured_response.selected_answer,
                 reasoning=structured_response.reasoning,
+                cascade=cascade,
             )
 
         except Exception as e:
             logger.error(f"Error during OpenAI API call: {e}", exc_info=True)
             raise ValueError(f"Error during OpenAI API call: {str(e)}")
 
+    def _get_answer_only_response(
+        self, question: str, options: List[str], data: Optional[Dict]
+    ) -> GPTResponse:
+        prompt = Prompts.get_answer_only_prompt(question, options, data)
+        if payload_logger.isEnabledFor(logging.DEBUG):
+            payload_logger.debug("Constructed prompt:\n%s", prompt)
+
+        try:
+            if self.hedger is not None:
+                selected_answer = self.hedger.call(
+                    self._send, self._stream_answer, prompt
+                )
+            else:
+                selected_answer = self._send(self._stream_answer, prompt)
+            logger.info("OpenAI API call successful")
+            return GPTResponse(selected_answer=selected_answer, reasoning=[])
+
+        except Exception as e:
+            logger.error(f"Error during OpenAI API call: {e}", exc_info=True)
+            raise ValueError(f"Error during OpenAI API call: {str(e)}")
+
+    @traced("api_call_stream")
+    def _stream_answer(
+        self,
+        prompt: str,
+        temperature: float = 0.2,
+        max_tokens: int = settings.answer_only_max_tokens,
+    ) -> str:
+        """답 번호가 나오는 즉시 스트림을 닫고 반환 (나머지 토큰은 기다리지 않음)"""
+        content = ""
+        with self.client.beta.chat.completions.stream(
+            model=self.model,
+            messages=[
+                {"role": "system", "content": Prompts.SYSTEM_MESSAGE},
+                {"role": "user", "content": prompt},
+            ],
+            response_format=AnswerOnlyResponse,
+            temperature=temperature,
+            max_tokens=max_tokens,
+        ) as stream:
+            for event in stream:
+                if event.type == "refusal.done":
+                    raise ValueError(f"Model refused to answer: {event.refusal}")
+                if event.type != "content.delta":
+                    continue
+                content += event.delta
+                # selected_answer 값이 완성되면 바로 반환
+                match = ANSWER_PATTERN.search(content)
+                if match:
+                    return match.group(1)
+
+        logger.warning(f"No answer found in streamed response: {content!r}")
+        raise ValueError("No answer found in streamed response")
+
+    def _send(self, func, *args, **kwargs):
+        """동시성 컨트롤러가 있으면 한도 안에서 호출하고 지연 시간/오류를 알려줌
+
+        컨트롤러가 있으면 재시도도 여기서 한다. 429/5xx/timeout 하나하나가 컨트롤러의
+        한도를 줄이고, 재시도는 줄어든 한도 안에서 다시 슬롯을 얻어 보낸다.
+        """
+        if self.concurrency is None:
+            return self._measured(func, *args, **kwargs)
+        for attempt in range(self.max_retries + 1):
+            try:
+                with self.concurrency.slot():
+                    return self._measured(func, *args, **kwargs)
+            except Exception as e:
+                if attempt >= self.max_retries or classify_error(e) is None:
+                    raise
+                delay = _retry_delay(e, attempt)
+                logger.debug(f"Retrying API request in {delay:.2f}s after: {e}")
+                metrics.inc("retries_total")
+                time.sleep(delay)
+
+    def _measured(self, func, *args, **kwargs):
+        """요청 하나의 in-flight 수, 지연 시간, 토큰 수를 metrics에 기록"""
+        if not metrics.enabled:
+            return func(*args, **kwargs)
+        metrics.inc("api_requests_started_total")
+        start = time.perf_counter()
+        try:
+            response = func(*args, **kwargs)
+        except BaseException:
+            metrics.inc("api_requests_failed_total")
+            raise
+        finally:
+            metrics.observe("api_request_latency_seconds", time.perf_counter() - start)
+            metrics.inc("api_requests_finished_total")
+
+        # 스트리밍 answer-only 응답은 usage가 없음
+        usage = getattr(response, "usage", None)
+        if usage is not None:
+            metrics.inc("tokens_total", usage.prompt_tokens or 0, kind="prompt")
+            metrics.inc("tokens_total", usage.completion_tokens or 0, kind="completion")
+            details = getattr(usage, "prompt_tokens_details", None)
+            cached = getattr(details, "cached_tokens", None) or 0
+            if cached:
+                metrics.inc("cached_prompt_tokens_total", cached)
+        return response
+
+    def _call(self, prompt: str, **kwargs) -> ChatCompletion:
+        if self.hedger is not None:
+            return self.hedger.call(
+                self._send, self._make_api_call, prompt=prompt, **kwargs
+            )
+        return self._send(self._make_api_call, prompt=prompt, **kwargs)
+
+    def _cascade(self, prompt: str) -> Tuple[AnswerResponse, List[Dict]]:
+        """빠른 모델의 답 confidence가 threshold 미만이면 기본 모델로 다시 물음
+
+        각 시도의 모델, 답, confidence, 지연 시간, 비용을 기록해 함께 반환한다.
+        """
+        attempts = []
+        start = time.perf_counter()
+        try:
+            response = self._call(prompt, model=self.fast_model, logprobs=True)
+            parsed = self._validate_and_parse_response(response)
+            confidence = answer_confidence(response)
+            attempts.append(
+                {
+                    "model": self.fast_model,
+                    "selected_answer": parsed.selected_answer,
+                    "confidence": confidence,
+                    "latency": time.perf_counter() - start,
+                    "cost": request_cost(self.fast_model, response.usage),
+                }
+            )
+            if confidence is not None and confidence >= self.cascade_threshold:
+                logger.info(
+                    f"Accepted {self.fast_model} answer (confidence {confidence:.3f})"
+                )
+                return parsed, attempts
+            logger.info(f"Escalating to {self.model} (confidence {confidence})")
+        except Exception as e:
+            logger.warning(f"Fast model {self.fast_model} failed, escalating: {e}")
+            attempts.append(
+                {
+                    "model": self.fast_model,
+                    "error": str(e),
+                    "latency": time.perf_counter() - start,
+                }
+            )
+
+        start = time.perf_counter()
+        response = self._call(prompt)
+        parsed = self._validate_and_parse_response(response)
+        attempts.append(
+            {
+                "model": self.model,
+                "selected_answer": parsed.selected_answer,
+                "confidence": None,
+                "latency": time.perf_counter() - start,
+                "cost": request_cost(self.model, response.usage),
+            }
+        )
+        return parsed, attempts
+
+    @traced("api_call")
     def _make_api_call(
         self,
         prompt: str,
         temperature: float = 0.2,
         max_tokens: int = 500,
+        model: Optional[str] = None,
+        logprobs: bool = False,
     ) -> ChatCompletion:
-        return openai.beta.chat.completions.parse(
-            model=self.model,
+        extra = {"logprobs": True, "top_logprobs": 5} if logprobs else {}
+        return self.client.beta.chat.completions.parse(
+            model=model or self.model,
             messages=[
                 {"role": "system", "content": Prompts.SYSTEM_MESSAGE},
                 {"role": "user", "content": prompt},
@@ -62,8 +296,10 @@ class OpenAIClient:
             response_format=AnswerResponse,
             temperature=temperature,
             max_tokens=max_tokens,
+            **extra,
         )
 
+    @traced("parse_response")
     def _validate_and_parse_response(self, response: ChatCompletion) -> AnswerResponse:
         message: ChatCompletionMessage = response.choices[0].message
 
@@ -1,32 +1,113 @@
 # src/processor.py
-import json
 import logging
+import multiprocessing
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
-from typing import List, Dict
+from pathlib import Path
+from typing import List, Dict, Optional, Tuple
 
 from tqdm import tqdm
 
+from src.cascade import tier_report
 from src.config import settings
 from src.data_loader import DataLoader
-from src.models import QuestionResult, ExamResult
+from src.debug_writer import DebugWriter
+from src.dedup import DuplicateIndex
+from src.http_client import connection_stats
+from src.logging_config import setup_worker_logging, worker_log_queue
+from src.memory_profiler import memory_stage
+from src.metrics import metrics
+from src.models import GPTResponse, Question, QuestionResult, ExamResult
 from src.openai_client import OpenAIClient
+from src.result_table import ResultTable
+from src.scheduler import ExamJob, QuestionScheduler
+from src.tracing import span, tracer
 
 logger = logging.getLogger(__name__)
 
 
+class ProcessingCancelled(Exception):
+    """process_exam이 cancel 이벤트로 중단됨 (결과를 쓰면 안 됨)"""
+
+
+# 프로세스 풀 worker마다 하나씩 만들어지는 Processor
+_worker_processor: Optional["Processor"] = None
+
+
+def _init_exam_worker(log_queue, data_dir: Path, model_name: str, max_concurrency: int):
+    global _worker_processor
+    setup_worker_logging(log_queue)
+    _worker_processor = Processor(
+        DataLoader(data_dir), OpenAIClient(model_name), max_concurrency
+    )
+
+
+def _process_exam_in_worker(exam_name: str) -> ExamResult:
+    return _worker_processor.process_exam(exam_name)
+
+
 class Processor:
-    def __init__(self, data_loader: DataLoader, openai_client: OpenAIClient):
+    def __init__(
+        self,
+        data_loader: DataLoader,
+        openai_client: OpenAIClient,
+        max_concurrency: int = settings.max_concurrency,
+        scheduler: Optional[QuestionScheduler] = None,
+        dedup_index: Optional[DuplicateIndex] = None,
+    ):
         self.data_loader = data_loader
         self.openai_client = openai_client
+        # 한 시험 안에서 동시에 보내는 API 요청 수
+        self.max_concurrency = max(1, max_concurrency)
+        # None이면 문제를 파일 순서대로 보냄
+        self.scheduler = scheduler
+        # 다른 시험의 중복 문제에서 검증된 답을 재사용 (None이면 항상 API 호출)
+        self.dedup_index = dedup_index
         self.debug_dir = settings.output_dir / "debug"
         self.debug_dir.mkdir(parents=True, exist_ok=True)
         logger.debug("Processor initialized")
 
     def process_exam(
-        self, exam_name: str = None, start_num: int = None, end_num: int = None
+        self,
+        exam_name: str = None,
+        start_num: int = None,
+        end_num: int = None,
+        run_label: Optional[str] = None,
+        cancel: Optional[threading.Event] = None,
+    ) -> ExamResult:
+        """Process an exam (or a question range of it).
+
+        run_label names the debug/trace output files (defaults to the exam name),
+        so that several shards of one exam do not overwrite each other. Once
+        cancel is set, questions that have not started yet are skipped without
+        an API call and ProcessingCancelled is raised.
+        """
+        run_label = run_label or exam_name
+        exam_start_time = datetime.now()
+        try:
+            with span("exam", exam_name=exam_name):
+                return self._process_exam(
+                    exam_name, start_num, end_num, exam_start_time, run_label, cancel
+                )
+        finally:
+            if tracer.enabled:
+                tracer.export_chrome_trace(self.debug_dir / f"{run_label}_trace.json")
+                tracer.clear()
+
+    def _process_exam(
+        self,
+        exam_name: str,
+        start_num: int,
+        end_num: int,
+        exam_start_time: datetime,
+        run_label: str,
+        cancel: Optional[threading.Event] = None,
     ) -> ExamResult:
         # 먼저 문제들을 로드
-        questions = self.data_loader.load_questions(exam_name, start_num, end_num)
+        with memory_stage("load", exam=exam_name):
+            questions = self.data_loader.load_questions(exam_name, start_num, end_num)
 
         # questions가 없을 때 None 대신 빈 ExamResult 객체 반환
         if not questions:
@@ -42,45 +123,236 @@ class Processor:
             )
 
         questions_results = []
-        debug_info = []
+        cascade_entries = []
         logger.info(f"Processing {len(questions)} questions for exam '{exam_name}'")
 
-        for idx, question in enumerate(
-            tqdm(questions, desc=f"Processing {exam_name}", unit="question"), start=1
-        ):
+        # debug 항목은 완료되는 즉시 JSONL로 스트리밍 기록
+        with memory_stage("process", exam=exam_name), DebugWriter.for_exam(
+            self.debug_dir, run_label, settings.debug_compression
+        ) as debug_writer, ThreadPoolExecutor(
+            self.max_concurrency, thread_name_prefix="question"
+        ) as executor:
+            # 보내는 순서와 무관하게 결과는 문제 순서대로 받음
+            outcomes = self._submit_questions(executor, questions, exam_name, cancel)
+            for question_result, debug_entry in tqdm(
+                outcomes,
+                total=len(questions),
+                desc=f"Processing {exam_name}",
+                unit="question",
+            ):
+                if question_result is not None:
+                    questions_results.append(question_result)
+                if "cascade" in debug_entry:
+                    # tier 집계에 필요한 필드만 보관 (debug 항목 전체는 파일로만)
+                    cascade_entries.append(
+                        {
+                            "cascade": debug_entry["cascade"],
+                            "is_correct": debug_entry.get("is_correct"),
+                        }
+                    )
+                debug_writer.write(debug_entry)
+
+        if cancel is not None and cancel.is_set():
+            raise ProcessingCancelled(f"Processing of '{run_label}' was cancelled")
+        if cascade_entries:
             logger.info(
-                f"Processing question {idx}/{len(questions)} (ID: {question.id})"
+                f"Cascade tiers for '{exam_name}': {tier_report(cascade_entries)}"
+            )
+        if self.dedup_index is not None:
+            logger.info(f"Duplicate reuse stats: {self.dedup_index.report()}")
+        return self._build_exam_result(
+            exam_name, questions, questions_results, exam_start_time, datetime.now()
+        )
+
+    def _build_exam_result(
+        self,
+        exam_name: str,
+        questions: List[Question],
+        questions_results: List[QuestionResult],
+        exam_start_time: datetime,
+        exam_end_time: datetime,
+    ) -> ExamResult:
+        # Calculate exam results
+        exam_duration = (exam_end_time - exam_start_time).total_seconds()
+        correct_answers = sum(1 for result in questions_results if result.is_correct)
+
+        exam_result = ExamResult(
+            exam_name=exam_name,
+            start_time=exam_start_time,
+            end_time=exam_end_time,
+            execution_time=exam_duration,
+            questions_results=questions_results,
+            total_questions=len(questions),
+            correct_answers=correct_answers,
+            accuracy=correct_answers / len(questions) if questions else 0,
+        )
+
+        logger.info(
+            f"Completed processing of exam '{exam_name}' with {len(questions_results)} results"
+        )
+        logger.info(
+            f"Exam duration: {exam_duration:.2f}s, Accuracy: {exam_result.accuracy:.2%}"
+        )
+        logger.debug(f"HTTP connection stats: {connection_stats.snapshot()}")
+
+        return exam_result
+
+    def _submit_questions(
+        self,
+        executor: ThreadPoolExecutor,
+        questions: List[Question],
+        exam_name: Optional[str] = None,
+        cancel: Optional[threading.Event] = None,
+    ):
+        if self.scheduler is None:
+            # map은 완료 순서와 무관하게 문제 순서대로 결과를 돌려줌
+            return executor.map(
+                self._process_question,
+                questions,
+                [exam_name] * len(questions),
+                [cancel] * len(questions),
+            )
+
+        # 예상 시간이 긴 문제부터 제출 (executor 큐는 FIFO)
+        futures = [None] * len(questions)
+        for index in self.scheduler.order(questions):
+            futures[index] = executor.submit(
+                self._process_scheduled_question,
+                self.scheduler,
+                questions[index],
+                exam_name,
+                cancel,
             )
+        return (future.result() for future in futures)
+
+    def _process_scheduled_question(
+        self,
+        scheduler: QuestionScheduler,
+        question: Question,
+        exam_name: Optional[str] = None,
+        cancel: Optional[threading.Event] = None,
+    ) -> Tuple[Optional[QuestionResult], Dict]:
+        question_result, debug_entry = self._process_question(
+            question, exam_name, cancel
+        )
+        if question_result is not None:
+            scheduler.latency_model.observe_question(
+                question, question_result.execution_time
+            )
+        return question_result, debug_entry
+
+    def process_exams(self, jobs: List[ExamJob]) -> List[ExamResult]:
+        """Process several exams on one shared pool in scheduler order.
+
+        Questions of all jobs are dispatched by priority, deadline and predicted
+        latency (longest first), so concurrency slots stay busy across exam
+        boundaries until the last question.
+        """
+        scheduler = self.scheduler or QuestionScheduler()
+        scheduler.check_deadlines(jobs, self.max_concurrency)
+        run_start_time = datetime.now()
+
+        results = []
+        with ThreadPoolExecutor(
+            self.max_concurrency, thread_name_prefix="question"
+        ) as executor:
+            futures = [[None] * len(job.questions) for job in jobs]
+            for dispatch in scheduler.plan(jobs):
+                job = jobs[dispatch.job_index]
+                question = job.questions[dispatch.question_index]
+                futures[dispatch.job_index][dispatch.question_index] = executor.submit(
+                    self._process_scheduled_question, scheduler, question, job.exam_name
+                )
+
+            for job, job_futures in zip(jobs, futures):
+                questions_results = []
+                with DebugWriter.for_exam(
+                    self.debug_dir, job.exam_name, settings.debug_compression
+                ) as debug_writer:
+                    for future in tqdm(
+                        job_futures, desc=f"Processing {job.exam_name}", unit="question"
+                    ):
+                        question_result, debug_entry = future.result()
+                        if question_result is not None:
+                            questions_results.append(question_result)
+                        debug_writer.write(debug_entry)
+
+                exam_end_time = max(
+                    (result.end_time for result in questions_results),
+                    default=datetime.now(),
+                )
+                results.append(
+                    self._build_exam_result(
+                        job.exam_name,
+                        job.questions,
+                        questions_results,
+                        run_start_time,
+                        exam_end_time,
+                    )
+                )
+        return results
+
+    def process_question(
+        self, question: Question, exam_name: Optional[str] = None
+    ) -> Tuple[Optional[QuestionResult], Dict]:
+        """Process a single question outside of an exam run (used by watch mode)."""
+        return self._process_question(question, exam_name)
+
+    def _process_question(
+        self,
+        question: Question,
+        exam_name: Optional[str] = None,
+        cancel: Optional[threading.Event] = None,
+    ) -> Tuple[Optional[QuestionResult], Dict]:
+        """문제 하나를 풀고 (QuestionResult, debug 항목)을 반환. 실패 시 결과는 None
+
+        exam_name은 중복 문제 답 재사용(같은 시험 제외)과 metrics의 시험별 집계에 쓰인다.
+        """
+        if cancel is not None and cancel.is_set():
+            return None, {"question_id": question.id, "status": "cancelled"}
+        exam_label = exam_name or ""
+        with span("question", question_id=question.id):
+            logger.info(f"Processing question {question.id}")
             try:
                 # Record start time
                 question_start_time = datetime.now()
+                start_ns = time.perf_counter_ns()
 
-                # Get GPT response
-                gpt_response = self.openai_client.get_response(
-                    question.question, question.options
+                # 검증된 답이 있는 중복 문제면 재사용, 아니면 GPT에 질의
+                reuse = (
+                    self.dedup_index.reusable_answer(question, exam_name)
+                    if self.dedup_index is not None
+                    else None
                 )
+                if reuse is not None:
+                    selected_answer, reasoning, match = reuse
+                    gpt_response = GPTResponse(
+                        selected_answer=selected_answer, reasoning=reasoning
+                    )
+                else:
+                    gpt_response = self.openai_client.get_response(
+                        question.question, question.options
+                    )
 
                 # Record end time
+                question_duration = (time.perf_counter_ns() - start_ns) / 1e9
                 question_end_time = datetime.now()
-                question_duration = (
-                    question_end_time - question_start_time
-                ).total_seconds()
-
-                # Create question result
-                is_correct = (
-                    gpt_response.selected_answer.upper()
-                    == question.correct_answer.upper()
-                )
-                question_result = QuestionResult(
-                    question_id=question.id,
-                    start_time=question_start_time,
-                    end_time=question_end_time,
-                    execution_time=question_duration,
-                    selected_answer=gpt_response.selected_answer.upper(),
-                    is_correct=is_correct,
-                    reasoning=gpt_response.reasoning,
-                )
-                questions_results.append(question_result)
+
+                with span("score"):
+                    # Create question result
+                    is_correct = (
+                        gpt_response.selected_answer.upper()
+                        == question.correct_answer.upper()
+                    )
+                    question_result = QuestionResult(
+                        question_id=question.id,
+                        start_time=question_start_time,
+                        end_time=question_end_time,
+                        execution_time=question_duration,
+                        selected_answer=gpt_response.selected_answer.upper(),
+                        is_correct=is_correct,
+                        reasoning=gpt_response.reasoning,
+                    )
 
                 # Create debug info
                 debug_entry = {
@@ -95,76 +367,137 @@ class Processor:
                     "is_correct": is_correct,
                     "execution_time": question_duration,
                 }
-                debug_info.append(debug_entry)
+                if question.data:
+                    # 다음 실행의 처리 시간 예측(LatencyModel.load_history)에 필요
+                    debug_entry["data"] = question.data
+                if isinstance(gpt_response.cascade, list):
+                    debug_entry["cascade"] = gpt_response.cascade
+                if reuse is not None:
+                    debug_entry["reused_from"] = {
+                        "question_id": match.question_id,
+                        "exam_name": match.exam_name,
+                        "similarity": match.similarity,
+                    }
+                elif is_correct and self.dedup_index is not None:
+                    self.dedup_index.record_answer(
+                        exam_name,
+                        question.id,
+                        gpt_response.selected_answer,
+                        gpt_response.reasoning,
+                    )
+
+                metrics.inc("questions_completed_total", exam=exam_label)
+                if is_correct:
+                    metrics.inc("questions_correct_total", exam=exam_label)
+                if reuse is not None:
+                    metrics.inc("answer_reuse_total")
+                metrics.observe("question_latency_seconds", question_duration)
 
                 logger.info(
                     f"Question '{question.id}' processed: Correct={is_correct}, Time={question_duration:.2f}s"
                 )
+                return question_result, debug_entry
 
             except Exception as e:
                 logger.error(
                     f"Error processing question '{question.id}': {e}", exc_info=True
                 )
+                metrics.inc("questions_failed_total", exam=exam_label)
                 # Add error info to debug
-                debug_info.append(
-                    {"question_id": question.id, "error": str(e), "status": "failed"}
-                )
+                return None, {
+                    "question_id": question.id,
+                    "error": str(e),
+                    "status": "failed",
+                }
 
-        # Calculate exam results
-        exam_end_time = datetime.now()
-        exam_duration = (exam_end_time - exam_start_time).total_seconds()
-        correct_answers = sum(1 for result in questions_results if result.is_correct)
+    def process_all_exams(
+        self,
+        exam_workers: int = settings.exam_workers,
+        table: Optional[ResultTable] = None,
+    ) -> List[ExamResult]:
+        """Process all available exams in the data directory.
 
-        exam_result = ExamResult(
-            exam_name=exam_name,
-            start_time=exam_start_time,
-            end_time=exam_end_time,
-            execution_time=exam_duration,
-            questions_results=questions_results,
-            total_questions=len(questions),
-            correct_answers=correct_answers,
-            accuracy=correct_answers / len(questions) if questions else 0,
-        )
+        With exam_workers > 1 the exams run in a process pool (see
+        _process_exams_in_pool); otherwise they run one by one in this process.
+        If a ResultTable is given, question results are moved into it as each
+        exam finishes and the returned ExamResults hold table views instead.
+        """
+        exams = self.data_loader.get_all_exams()
 
-        # Save debug information
-        self._save_debug_info(exam_name, debug_info)
+        logger.info(f"Starting to process {len(exams)} exams")
+        if exam_workers > 1 and len(exams) > 1:
+            results = self._process_exams_in_pool(exams, exam_workers, table)
+        else:
+            results = self._process_exams_serially(exams, table)
 
         logger.info(
-            f"Completed processing of exam '{exam_name}' with {len(questions_results)} results"
-        )
-        logger.info(
-            f"Exam duration: {exam_duration:.2f}s, Accuracy: {exam_result.accuracy:.2%}"
+            f"Completed processing all exams. Processed {len(results)} exams successfully"
         )
+        return results
 
-        return exam_result
-
-    def process_all_exams(self) -> List[ExamResult]:
-        """Process all available exams in the data directory."""
+    def _process_exams_serially(
+        self, exams: List[str], table: Optional[ResultTable] = None
+    ) -> List[ExamResult]:
         results = []
-        exams = self.data_loader.get_all_exams()
-
-        logger.info(f"Starting to process {len(exams)} exams")
         for exam in exams:
             try:
                 result = self.process_exam(exam)
                 if result:
-                    results.append(result)
+                    with memory_stage("save", exam=exam):
+                        results.append(
+                            table.compact(result) if table is not None else result
+                        )
             except Exception as e:
                 logger.error(f"Failed to process exam {exam}: {e}", exc_info=True)
+        return results
 
+    def _process_exams_in_pool(
+        self,
+        exams: List[str],
+        exam_workers: int,
+        table: Optional[ResultTable] = None,
+    ) -> List[ExamResult]:
+        """시험 단위로 프로세스 풀에서 처리하고 ExamResult를 부모 프로세스로 모음
+
+        각 worker는 자기 OpenAIClient를 만들고, 전체 요청 한도(self.max_concurrency)를
+        worker 수로 나눈 만큼만 동시에 요청한다. 프롬프트 생성, pydantic 검증,
+        debug 직렬화 같은 CPU 작업이 GIL 하나에 묶이지 않는다.
+        중복 문제 답 재사용(dedup_index)은 이 프로세스 안에서만 적용되고, 메모리
+        프로파일에는 부모 프로세스의 단계(save)만 기록된다.
+        """
+        workers = min(exam_workers, len(exams))
+        concurrency_slice = max(1, self.max_concurrency // workers)
         logger.info(
-            f"Completed processing all exams. Processed {len(results)} exams successfully"
+            f"Processing exams in {workers} processes "
+            f"({concurrency_slice} concurrent requests each)"
         )
-        return results
 
-    def _save_debug_info(self, exam_name: str, debug_info: List[Dict]):
-        """Save detailed debug information for each question."""
-        debug_file = self.debug_dir / f"{exam_name}_debug.json"
-        try:
-            with debug_file.open("w", encoding="utf-8") as f:
-                json.dump(
-                    debug_info, f, indent=2, ensure_ascii=False, default=str
-                )  # default=str to handle datetime serialization
-            logger.info(f"Debug information saved to {debug_file}")
-        except Exception as e:
-            logger.error(f"Failed to save debug information: {e}")
+        # 부모의 로깅 스레드가 fork로 복사되지 않도록 spawn 사용
+        mp_context = multiprocessing.get_context("spawn")
+        results = []
+        with worker_log_queue(mp_context) as log_queue, ProcessPoolExecutor(
+            workers,
+            mp_context=mp_context,
+            initializer=_init_exam_worker,
+            initargs=(
+                log_queue,
+                self.data_loader.data_dir,
+                self.openai_client.model,
+                concurrency_slice,
+            ),
+        ) as executor:
+            futures = [
+                (exam, executor.submit(_process_exam_in_worker, exam))
+                for exam in exams
+            ]
+            for exam, future in futures:
+                try:
+                    result = future.result()
+                    if result:
+                        with memory_stage("save", exam=exam):
+                            results.append(
+                                table.compact(result) if table is not None else result
+                            )
+                except Exception as e:
+                    logger.error(f"Failed to process exam {exam}: {e}", exc_info=True)
+        return results
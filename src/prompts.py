@@ -2,6 +2,8 @@
 from typing import List, Dict, Optional
 import json
 
+from src.tracing import traced
+
 
 class Prompts:
     SYSTEM_MESSAGE = """특별한 언급이 없는 한 기업의 보고기간(회계기간)은
@@ -11,10 +13,8 @@ class Prompts:
 계속해서 한국채택국제회계기준(K-IFRS)을 적용"""
 
     @staticmethod
-    def get_question_prompt(question: str, options: List[str], data: Optional[Dict] = None) -> str:
-        # Base question and options
-        prompt = f"Please analyze the following multiple choice question and provide your answer with reasoning.\n\n"
-        prompt += f"Question: {question}\n\n"
+    def _question_body(question: str, options: List[str], data: Optional[Dict]) -> str:
+        prompt = f"Question: {question}\n\n"
 
         # Add table/data if present
         if data:
@@ -22,6 +22,14 @@ class Prompts:
             prompt += json.dumps(data, ensure_ascii=False, indent=2) + "\n\n"
 
         prompt += "Options:\n" + "\n".join(f"{idx + 1}. {opt}" for idx, opt in enumerate(options)) + "\n\n"
+        return prompt
+
+    @staticmethod
+    @traced("get_question_prompt")
+    def get_question_prompt(question: str, options: List[str], data: Optional[Dict] = None) -> str:
+        # Base question and options
+        prompt = f"Please analyze the following multiple choice question and provide your answer with reasoning.\n\n"
+        prompt += Prompts._question_body(question, options, data)
 
         # Response format instruction
         prompt += (
@@ -38,3 +46,15 @@ class Prompts:
             "}"
         )
         return prompt
+
+    @staticmethod
+    @traced("get_answer_only_prompt")
+    def get_answer_only_prompt(question: str, options: List[str], data: Optional[Dict] = None) -> str:
+        # 정확도만 측정할 때: 풀이 없이 답 번호만 요청
+        prompt = "Please answer the following multiple choice question.\n\n"
+        prompt += Prompts._question_body(question, options, data)
+        prompt += (
+            "풀이 없이 아래의 JSON 형식으로 답 번호만 제공하세요\n"
+            '{"selected_answer": "1"}  // The number (1-5) of your chosen option'
+        )
+        return prompt
@@ -0,0 +1,352 @@
+# src/result_table.py
+import json
+import logging
+import threading
+from collections.abc import Sequence
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from src import serialization
+from src.models import ExamResult, QuestionResult
+
+logger = logging.getLogger(__name__)
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def _to_micros(value: datetime) -> int:
+    return (value - _EPOCH) // _MICROSECOND
+
+
+def _from_micros(value: int) -> datetime:
+    return _EPOCH + timedelta(microseconds=int(value))
+
+
+class _StringPool:
+    """같은 문자열은 한 번만 저장하고 정수 id로 참조"""
+
+    def __init__(self, values: Optional[List[str]] = None):
+        self.values: List[str] = list(values or [])
+        self._ids: Dict[str, int] = {value: i for i, value in enumerate(self.values)}
+
+    def intern(self, value: str) -> int:
+        index = self._ids.get(value)
+        if index is None:
+            index = self._ids[value] = len(self.values)
+            self.values.append(value)
+        return index
+
+    def id_of(self, value: str) -> Optional[int]:
+        return self._ids.get(value)
+
+    def __getitem__(self, index: int) -> str:
+        return self.values[index]
+
+
+class _Column:
+    """용량을 두 배씩 늘리는 1차원 NumPy 배열"""
+
+    def __init__(self, dtype, capacity: int = 1024):
+        self._data = np.empty(capacity, dtype=dtype)
+        self.size = 0
+
+    def append(self, value):
+        if self.size == len(self._data):
+            self._data = np.resize(self._data, max(1, 2 * len(self._data)))
+        self._data[self.size] = value
+        self.size += 1
+
+    def extend(self, values):
+        values = np.asarray(values, dtype=self._data.dtype)
+        needed = self.size + len(values)
+        if needed > len(self._data):
+            self._data = np.resize(self._data, max(needed, 2 * len(self._data)))
+        self._data[self.size : needed] = values
+        self.size = needed
+
+    @property
+    def values(self) -> np.ndarray:
+        return self._data[: self.size]
+
+
+_NUMERIC_COLUMNS = {
+    "exam": np.int32,
+    "question_id": np.int32,
+    "start_us": np.int64,
+    "end_us": np.int64,
+    "execution_time": np.float64,
+    "selected_answer": np.int32,
+    "is_correct": np.bool_,
+    # 메모리 모드: reasoning_ids의 시작 위치 / spill 모드: 파일 내 byte offset
+    "reasoning_offset": np.int64,
+    "reasoning_length": np.int32,
+}
+
+
+class ResultTable:
+    """대규모 실행 결과를 NumPy 열로 저장하는 compact 결과 테이블
+
+    문제 하나당 pydantic QuestionResult(datetime 2개 + 문자열 리스트) 대신 정수/실수
+    몇 개만 저장한다. 시험 이름, 문제 id, 답안은 문자열 pool에 한 번만 저장한다.
+    reasoning은 기본적으로 문장 단위로 intern 하고, reasoning_path를 주면 디스크의
+    JSONL 파일로 내보내고 offset만 남긴다. 기존 코드에는 row(i) / exam_view()로
+    필요할 때만 QuestionResult를 만들어 돌려준다.
+    datetime은 naive(로컬) 시각으로 마이크로초 단위로 저장한다.
+    """
+
+    def __init__(self, reasoning_path: Optional[Path] = None):
+        self._columns = {name: _Column(dtype) for name, dtype in _NUMERIC_COLUMNS.items()}
+        self._exams = _StringPool()
+        self._question_ids = _StringPool()
+        self._answers = _StringPool()
+        self._reasoning = _StringPool()
+        self._reasoning_ids = _Column(np.int32)
+        # 시험 id -> 문제 수 (ExamResult.total_questions, 실패한 문제 포함)
+        self._exam_totals: Dict[int, int] = {}
+        self.reasoning_path = Path(reasoning_path) if reasoning_path else None
+        self._open_spill()
+
+    def _open_spill(self):
+        self._spill = None
+        self._spill_offset = 0
+        # spill 파일을 읽는 handle은 처음 읽을 때 한 번만 열고 재사용
+        self._reader = None
+        self._reader_lock = threading.Lock()
+        if self.reasoning_path is not None:
+            self._spill = self.reasoning_path.open("ab")
+            self._spill_offset = self._spill.tell()
+
+    def __len__(self) -> int:
+        return self._columns["exam"].size
+
+    def column(self, name: str) -> np.ndarray:
+        return self._columns[name].values
+
+    def append(self, exam_name: str, result: QuestionResult):
+        columns = self._columns
+        columns["exam"].append(self._exams.intern(exam_name))
+        columns["question_id"].append(self._question_ids.intern(result.question_id))
+        columns["start_us"].append(_to_micros(result.start_time))
+        columns["end_us"].append(_to_micros(result.end_time))
+        columns["execution_time"].append(result.execution_time)
+        columns["selected_answer"].append(self._answers.intern(result.selected_answer))
+        columns["is_correct"].append(result.is_correct)
+
+        if self._spill is not None:
+            line = serialization.dumps(result.reasoning)
+            self._spill.write(line + b"\n")
+            columns["reasoning_offset"].append(self._spill_offset)
+            columns["reasoning_length"].append(len(line))
+            self._spill_offset += len(line) + 1
+        else:
+            columns["reasoning_offset"].append(self._reasoning_ids.size)
+            columns["reasoning_length"].append(len(result.reasoning))
+            self._reasoning_ids.extend(
+                [self._reasoning.intern(text) for text in result.reasoning]
+            )
+
+    def add_exam(self, exam_result: ExamResult):
+        exam_id = self._exams.intern(exam_result.exam_name)
+        self._exam_totals[exam_id] = (
+            self._exam_totals.get(exam_id, 0) + exam_result.total_questions
+        )
+        for result in exam_result.questions_results:
+            self.append(exam_result.exam_name, result)
+
+    def compact(self, exam_result: ExamResult) -> ExamResult:
+        """시험 결과를 테이블에 추가하고, 문제 결과를 테이블 view로 바꾼 ExamResult를 반환
+
+        반환된 ExamResult는 검증 없이 만들어지며(model_construct) 원래의
+        QuestionResult 객체들은 더 이상 참조되지 않는다.
+        """
+        start = len(self)
+        self.add_exam(exam_result)
+        fields = dict(exam_result)
+        fields["questions_results"] = _QuestionResultView(self, start, len(self))
+        return ExamResult.model_construct(**fields)
+
+    def _load_reasoning(self, index: int) -> List[str]:
+        offset = int(self._columns["reasoning_offset"].values[index])
+        length = int(self._columns["reasoning_length"].values[index])
+        if self.reasoning_path is None:
+            ids = self._reasoning_ids.values[offset : offset + length]
+            return [self._reasoning[i] for i in ids]
+
+        self.flush()
+        with self._reader_lock:
+            if self._reader is None:
+                self._reader = self.reasoning_path.open("rb")
+            self._reader.seek(offset)
+            return serialization.loads(self._reader.read(length))
+
+    def row(self, index: int) -> QuestionResult:
+        columns = self._columns
+        return QuestionResult(
+            question_id=self._question_ids[columns["question_id"].values[index]],
+            start_time=_from_micros(columns["start_us"].values[index]),
+            end_time=_from_micros(columns["end_us"].values[index]),
+            execution_time=float(columns["execution_time"].values[index]),
+            selected_answer=self._answers[columns["selected_answer"].values[index]],
+            is_correct=bool(columns["is_correct"].values[index]),
+            reasoning=self._load_reasoning(index),
+        )
+
+    def __iter__(self) -> Iterator[QuestionResult]:
+        for index in range(len(self)):
+            yield self.row(index)
+
+    def exam_names(self) -> List[str]:
+        return list(self._exams.values)
+
+    def exam_view(self, exam_name: str) -> Sequence:
+        """시험 하나의 문제 결과를 QuestionResult 시퀀스처럼 보여주는 view"""
+        exam_id = self._exams.id_of(exam_name)
+        if exam_id is None:
+            return _QuestionResultView(self, 0, 0)
+        return _QuestionResultView(
+            self, indices=np.flatnonzero(self.column("exam") == exam_id)
+        )
+
+    def to_frame(self) -> pd.DataFrame:
+        """reasoning을 제외한 열을 DataFrame으로 (문자열 열은 category)"""
+        return pd.DataFrame(
+            {
+                "exam": pd.Categorical.from_codes(
+                    self.column("exam"), categories=self._exams.values
+                ),
+                "question_id": pd.Categorical.from_codes(
+                    self.column("question_id"), categories=self._question_ids.values
+                ),
+                "start_time": pd.to_datetime(self.column("start_us"), unit="us"),
+                "end_time": pd.to_datetime(self.column("end_us"), unit="us"),
+                "execution_time": self.column("execution_time"),
+                "selected_answer": pd.Categorical.from_codes(
+                    self.column("selected_answer"), categories=self._answers.values
+                ),
+                "is_correct": self.column("is_correct"),
+            }
+        )
+
+    def summary(self) -> pd.DataFrame:
+        """시험별 문제 수, 정답 수, 정확도, 처리 시간 통계 (벡터 연산)
+
+        문제 수와 정확도는 ExamResult와 같이 실패한 문제까지 포함한 전체 문제 수
+        기준이고, 처리 시간 통계는 결과가 있는 문제(행) 기준이다. add_exam 없이
+        append로만 넣은 시험은 행 수를 문제 수로 쓴다.
+        """
+        exam = self.column("exam")
+        times = self.column("execution_time")
+        n_exams = len(self._exams.values)
+
+        rows = np.bincount(exam, minlength=n_exams)
+        questions = np.array(
+            [self._exam_totals.get(i, rows[i]) for i in range(n_exams)], dtype=np.int64
+        )
+        correct = np.bincount(exam, weights=self.column("is_correct"), minlength=n_exams)
+        time_sums = np.bincount(exam, weights=times, minlength=n_exams)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            accuracy = np.where(questions > 0, correct / questions, 0.0)
+            mean_time = np.where(rows > 0, time_sums / rows, 0.0)
+
+        # 시험별 분위수: 시험 id, 시간 순으로 정렬한 뒤 구간별 인덱스로 계산
+        sorted_times = times[np.lexsort((times, exam))]
+        starts = np.cumsum(rows) - rows
+
+        def quantile(q: float) -> np.ndarray:
+            if not len(sorted_times):
+                return np.zeros(n_exams)
+            positions = starts + np.floor(q * np.maximum(rows - 1, 0)).astype(np.int64)
+            values = sorted_times[np.minimum(positions, len(sorted_times) - 1)]
+            return np.where(rows > 0, values, 0.0)
+
+        return pd.DataFrame(
+            {
+                "Exam Name": self._exams.values,
+                "Total Questions": questions,
+                "Correct Answers": correct.astype(np.int64),
+                "Accuracy": accuracy,
+                "Total Time (s)": time_sums,
+                "Average Time per Question (s)": mean_time,
+                "p50 Time (s)": quantile(0.5),
+                "p95 Time (s)": quantile(0.95),
+            }
+        )
+
+    def save(self, path: Path):
+        """NumPy 열과 문자열 pool을 .npz 하나로 저장 (spill된 reasoning은 경로만 기록)"""
+        self.flush()
+        meta = {
+            "exams": self._exams.values,
+            "question_ids": self._question_ids.values,
+            "answers": self._answers.values,
+            "reasoning": self._reasoning.values,
+            "exam_totals": {str(i): total for i, total in self._exam_totals.items()},
+            "reasoning_path": str(self.reasoning_path) if self.reasoning_path else None,
+        }
+        np.savez_compressed(
+            path,
+            meta=np.array(json.dumps(meta, ensure_ascii=False)),
+            reasoning_ids=self._reasoning_ids.values,
+            **{name: column.values for name, column in self._columns.items()},
+        )
+        logger.info(f"Saved {len(self)} results to {path}")
+
+    @classmethod
+    def load(cls, path: Path) -> "ResultTable":
+        with np.load(path) as data:
+            meta = json.loads(str(data["meta"]))
+            table = cls.__new__(cls)
+            table._columns = {}
+            for name, dtype in _NUMERIC_COLUMNS.items():
+                column = _Column(dtype, capacity=0)
+                column.extend(data[name])
+                table._columns[name] = column
+            table._reasoning_ids = _Column(np.int32, capacity=0)
+            table._reasoning_ids.extend(data["reasoning_ids"])
+        table._exams = _StringPool(meta["exams"])
+        table._question_ids = _StringPool(meta["question_ids"])
+        table._answers = _StringPool(meta["answers"])
+        table._reasoning = _StringPool(meta["reasoning"])
+        table._exam_totals = {
+            int(i): total for i, total in meta.get("exam_totals", {}).items()
+        }
+        table.reasoning_path = Path(meta["reasoning_path"]) if meta["reasoning_path"] else None
+        table._open_spill()
+        return table
+
+    def flush(self):
+        if self._spill is not None:
+            self._spill.flush()
+
+    def close(self):
+        if self._spill is not None:
+            self._spill.close()
+            self._spill = None
+        if self._reader is not None:
+            self._reader.close()
+            self._reader = None
+
+
+class _QuestionResultView(Sequence):
+    """ResultTable의 일부 행을 QuestionResult 리스트처럼 보여줌 (접근할 때 생성)"""
+
+    def __init__(self, table: ResultTable, start: int = 0, stop: int = 0, indices=None):
+        self._table = table
+        self._indices = np.arange(start, stop) if indices is None else indices
+
+    def __len__(self) -> int:
+        return len(self._indices)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return _QuestionResultView(self._table, indices=self._indices[index])
+        return self._table.row(int(self._indices[index]))
+
+    def __iter__(self) -> Iterator[QuestionResult]:
+        for index in self._indices:
+            yield self._table.row(int(index))
@@ -0,0 +1,234 @@
+# src/scheduler.py
+import hashlib
+import heapq
+import json
+import logging
+import math
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from src.debug_writer import read_debug_entries
+from src.models import Question
+from src.prompts import Prompts
+
+logger = logging.getLogger(__name__)
+
+_encoding = None
+_encoding_loaded = False
+
+
+def _get_encoding():
+    global _encoding, _encoding_loaded
+    if not _encoding_loaded:
+        _encoding_loaded = True
+        try:
+            import tiktoken
+
+            _encoding = tiktoken.get_encoding("o200k_base")
+        except Exception as e:  # tiktoken이 없거나 인코딩 파일을 받을 수 없는 경우
+            logger.debug(f"tiktoken unavailable, estimating token counts: {e}")
+    return _encoding
+
+
+def count_tokens(text: str) -> int:
+    encoding = _get_encoding()
+    if encoding is not None:
+        return len(encoding.encode(text))
+    # 한국어 위주 텍스트는 대략 2글자당 1토큰
+    return len(text) // 2 + 1
+
+
+def prompt_tokens(question: Question) -> int:
+    prompt = Prompts.get_question_prompt(
+        question.question, question.options, question.data
+    )
+    return count_tokens(prompt)
+
+
+def content_key(question_text: str, options: List[str], data: Optional[Dict]) -> str:
+    """지문, 보기, 자료의 해시
+
+    문제 id(Q1, Q2 ...)는 시험 안에서만 고유하므로 문제별 기록은 내용으로 구분한다.
+    """
+    payload = json.dumps(
+        [question_text, options, data], ensure_ascii=False, sort_keys=True
+    )
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+def question_key(question: Question) -> str:
+    return content_key(question.question, question.options, question.data)
+
+
+class LatencyModel:
+    """문제별 처리 시간 예측
+
+    문제는 내용 해시(question_key)로 구분한다. 같은 문제의 과거 시간이 있으면 그 지수
+    이동 평균을, 없으면 프롬프트 토큰 수에 대한 1차 회귀(온라인 최소제곱)로 예측한다.
+    관측이 두 개 미만이면 토큰 수에 비례한 값을 돌려주어 순서 결정에만 쓰인다.
+    """
+
+    def __init__(self, history_weight: float = 0.5, seconds_per_token: float = 0.005):
+        self.history_weight = history_weight
+        self.seconds_per_token = seconds_per_token
+        # question_key -> 처리 시간 EMA / 프롬프트 토큰 수
+        self._history: Dict[str, float] = {}
+        self._tokens: Dict[str, int] = {}
+        self._sums = [0.0] * 5  # n, Σx, Σy, Σxx, Σxy
+        self._lock = threading.Lock()
+
+    def tokens(self, question: Question) -> int:
+        key = question_key(question)
+        tokens = self._tokens.get(key)
+        if tokens is None:
+            tokens = self._tokens[key] = prompt_tokens(question)
+        return tokens
+
+    def observe(self, key: str, tokens: int, seconds: float):
+        with self._lock:
+            previous = self._history.get(key)
+            self._history[key] = (
+                seconds
+                if previous is None
+                else self.history_weight * seconds + (1 - self.history_weight) * previous
+            )
+            sums = self._sums
+            sums[0] += 1
+            sums[1] += tokens
+            sums[2] += seconds
+            sums[3] += tokens * tokens
+            sums[4] += tokens * seconds
+
+    def observe_question(self, question: Question, seconds: float):
+        self.observe(question_key(question), self.tokens(question), seconds)
+
+    def _predict_tokens(self, tokens: int) -> float:
+        n, sx, sy, sxx, sxy = self._sums
+        if n < 2:
+            return tokens * self.seconds_per_token
+        variance = n * sxx - sx * sx
+        if variance <= 0:
+            return sy / n
+        slope = (n * sxy - sx * sy) / variance
+        intercept = (sy - slope * sx) / n
+        return max(intercept + slope * tokens, 0.0)
+
+    def predict(self, question: Question) -> float:
+        with self._lock:
+            history = self._history.get(question_key(question))
+            if history is not None:
+                return history
+            return self._predict_tokens(self.tokens(question))
+
+    def load_history(self, debug_files: Iterable[Path]) -> int:
+        """debug JSONL 파일의 과거 실행 시간으로 모델을 학습. 읽은 항목 수를 반환
+
+        토큰 수와 문제 키는 실행 중(prompt_tokens, question_key)과 같은 방식으로
+        자료(data)까지 포함해 계산한다. data 항목이 없는 예전 debug 파일은 자료 없이
+        계산되므로, 자료가 있는 문제는 시간 기록이 매칭되지 않고 회귀에만 쓰인다.
+        """
+        loaded = 0
+        for path in debug_files:
+            for entry in read_debug_entries(path):
+                if "execution_time" not in entry or "question_text" not in entry:
+                    continue
+                data = entry.get("data")
+                prompt = Prompts.get_question_prompt(
+                    entry["question_text"], entry["options"], data
+                )
+                self.observe(
+                    content_key(entry["question_text"], entry["options"], data),
+                    count_tokens(prompt),
+                    entry["execution_time"],
+                )
+                loaded += 1
+        logger.info(f"Loaded {loaded} historical timings into latency model")
+        return loaded
+
+
+@dataclass
+class ExamJob:
+    """스케줄링 단위가 되는 시험 하나
+
+    priority가 높은 시험의 문제가 먼저 나가고, 같은 priority 안에서는 deadline
+    (실행 시작부터의 초)이 이른 시험이 먼저 나간다.
+    """
+
+    exam_name: str
+    questions: List[Question]
+    priority: int = 0
+    deadline: Optional[float] = None
+
+
+@dataclass(order=True)
+class _Dispatch:
+    sort_key: Tuple
+    job_index: int = field(compare=False)
+    question_index: int = field(compare=False)
+    predicted: float = field(compare=False)
+
+
+class QuestionScheduler:
+    """예상 처리 시간이 긴 문제부터 보내는 (LPT) 스케줄러
+
+    문제를 파일 순서대로 보내면 표가 큰 긴 문제가 마지막에 시작되어 시험 전체가
+    하나의 문제를 기다리게 된다. 긴 문제를 먼저 보내면 짧은 문제들이 남은 슬롯을
+    채워 동시성 슬롯이 끝까지 바쁘게 유지된다.
+    """
+
+    def __init__(self, latency_model: Optional[LatencyModel] = None):
+        self.latency_model = latency_model or LatencyModel()
+
+    def order(self, questions: List[Question]) -> List[int]:
+        """한 시험 안의 문제 인덱스를 보낼 순서대로 반환"""
+        predicted = [self.latency_model.predict(question) for question in questions]
+        return sorted(range(len(questions)), key=lambda i: -predicted[i])
+
+    def plan(self, jobs: List[ExamJob]) -> List[_Dispatch]:
+        """여러 시험의 문제를 (priority, deadline, 예상 시간) 순으로 정렬한 전체 순서"""
+        dispatches = []
+        for job_index, job in enumerate(jobs):
+            deadline = job.deadline if job.deadline is not None else math.inf
+            for question_index, question in enumerate(job.questions):
+                predicted = self.latency_model.predict(question)
+                dispatches.append(
+                    _Dispatch(
+                        (-job.priority, deadline, -predicted, job_index, question_index),
+                        job_index,
+                        question_index,
+                        predicted,
+                    )
+                )
+        dispatches.sort()
+        return dispatches
+
+    @staticmethod
+    def estimate_completion(
+        dispatches: List[_Dispatch], slots: int
+    ) -> Tuple[float, Dict[int, float]]:
+        """주어진 순서를 slots개의 슬롯에 list scheduling 했을 때의 예상 makespan과
+        시험(job_index)별 예상 완료 시각"""
+        free_at = [0.0] * max(1, slots)
+        finish: Dict[int, float] = {}
+        for dispatch in dispatches:
+            start = heapq.heappop(free_at)
+            end = start + dispatch.predicted
+            heapq.heappush(free_at, end)
+            finish[dispatch.job_index] = max(finish.get(dispatch.job_index, 0.0), end)
+        return max(free_at), finish
+
+    def check_deadlines(self, jobs: List[ExamJob], slots: int) -> List[str]:
+        """예상 완료 시각이 deadline을 넘는 시험 이름 목록 (경고 로그도 남김)"""
+        makespan, finish = self.estimate_completion(self.plan(jobs), slots)
+        logger.info(f"Estimated makespan: {makespan:.1f}s with {slots} slots")
+        late = []
+        for job_index, job in enumerate(jobs):
+            if job.deadline is not None and finish.get(job_index, 0.0) > job.deadline:
+                logger.warning(
+                    f"Exam '{job.exam_name}' is expected to finish at "
+                    f"{finish[job_index]:.1f}s, after its {job.deadline:.1f}s deadline"
+                )
+                late.append(job.exam_name)
+        return late
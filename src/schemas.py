@@ -18,3 +18,11 @@ class AnswerResponse(BaseModel):
         validate_assignment=True,  # 할당 시에도 검증
         frozen=True,  # 불변 객체로 만들기
     )
+
+
+class AnswerOnlyResponse(BaseModel):
+    """정확도 측정용 answer-only 모드의 응답 스키마 (reasoning 없음)"""
+
+    selected_answer: str = Field(description="선택한 답변 번호", pattern="^[1-5]$")
+
+    model_config = ConfigDict(extra="forbid", frozen=True)
@@ -0,0 +1,98 @@
+# src/serialization.py
+import json
+import logging
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, List, Union
+
+from pydantic import BaseModel, TypeAdapter
+
+from src.models import Question
+
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+except ImportError:  # orjson이 없으면 표준 json으로 (느리지만 같은 결과)
+    orjson = None
+
+# 문제 여러 개를 담은 JSON 배열 파일을 한 번에 검증하는 adapter (생성 비용이 커서 재사용)
+QUESTION_LIST_ADAPTER: TypeAdapter = TypeAdapter(List[Question])
+
+
+def _default(obj: Any) -> Any:
+    """orjson/json이 직접 처리하지 못하는 값의 변환"""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    if isinstance(obj, (datetime, date)):
+        # orjson의 기본 datetime 출력과 같은 ISO 8601 형식
+        return obj.isoformat()
+    if isinstance(obj, Path):
+        return str(obj)
+    if hasattr(obj, "tolist"):  # numpy 값/배열
+        return obj.tolist()
+    return str(obj)
+
+
+if orjson is not None:
+    _OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+    def dumps(obj: Any, indent: bool = False) -> bytes:
+        return orjson.dumps(
+            obj,
+            default=_default,
+            option=_OPTIONS | (orjson.OPT_INDENT_2 if indent else 0),
+        )
+
+    def dumps_line(obj: Any) -> bytes:
+        """JSONL 한 줄 (끝에 줄바꿈 포함)"""
+        return orjson.dumps(
+            obj, default=_default, option=_OPTIONS | orjson.OPT_APPEND_NEWLINE
+        )
+
+    loads = orjson.loads
+    JSONDecodeError = orjson.JSONDecodeError
+
+else:
+
+    def dumps(obj: Any, indent: bool = False) -> bytes:
+        if indent:
+            text = json.dumps(obj, default=_default, ensure_ascii=False, indent=2)
+        else:
+            text = json.dumps(
+                obj, default=_default, ensure_ascii=False, separators=(",", ":")
+            )
+        return text.encode("utf-8")
+
+    def dumps_line(obj: Any) -> bytes:
+        return dumps(obj) + b"\n"
+
+    def loads(data: Union[bytes, bytearray, memoryview, str]) -> Any:
+        return json.loads(data)
+
+    JSONDecodeError = json.JSONDecodeError
+
+
+def dump_file(obj: Any, path: Path, indent: bool = False) -> Path:
+    path = Path(path)
+    path.write_bytes(dumps(obj, indent=indent))
+    return path
+
+
+# 한국어 문자열이 대부분인 문제 파일에서는 pydantic의 JSON 파서(validate_json)보다
+# orjson.loads 후 validate_python이 더 빠르다 (benchmarks/bench_serialization.py).
+# orjson이 없으면 json.load + Question(**data)보다 빠른 validate_json을 사용한다.
+def load_question(path: Path) -> Question:
+    """문제 파일 하나를 bytes에서 바로 파싱/검증"""
+    data = Path(path).read_bytes()
+    if orjson is not None:
+        return Question.model_validate(orjson.loads(data))
+    return Question.model_validate_json(data)
+
+
+def load_question_list(path: Path) -> List[Question]:
+    """문제 여러 개가 담긴 JSON 배열 파일을 한 번에 검증"""
+    data = Path(path).read_bytes()
+    if orjson is not None:
+        return QUESTION_LIST_ADAPTER.validate_python(orjson.loads(data))
+    return QUESTION_LIST_ADAPTER.validate_json(data)
@@ -0,0 +1,149 @@
+# src/tracing.py
+import functools
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from src import serialization
+from src.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class _NullSpan:
+    """트레이싱이 꺼져 있을 때 사용하는 아무 일도 하지 않는 span"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def set(self, **args):
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class Span:
+    __slots__ = ("tracer", "name", "args", "start_ns")
+
+    def __init__(self, tracer: "Tracer", name: str, args: Dict[str, Any]):
+        self.tracer = tracer
+        self.name = name
+        self.args = args
+        self.start_ns = 0
+
+    def __enter__(self):
+        self.start_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        end_ns = time.perf_counter_ns()
+        if exc_type is not None:
+            self.args["error"] = exc_type.__name__
+        self.tracer._record(self.name, self.start_ns, end_ns, self.args)
+        return False
+
+    def set(self, **args):
+        """span이 끝나기 전에 인자 추가 (예: 결과 값)"""
+        self.args.update(args)
+
+
+class Tracer:
+    """perf_counter_ns 기반의 가벼운 span 트레이서
+
+    span은 스레드별로 시간 구간이 겹치면 Chrome trace viewer/Perfetto에서 자동으로
+    중첩되어 보인다. 꺼져 있을 때는 공유 no-op span만 반환한다.
+    """
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self._origin_ns = time.perf_counter_ns()
+        self._events: List[tuple] = []
+        self._lock = threading.Lock()
+
+    def span(self, name: str, **args) -> Any:
+        if not self.enabled:
+            return _NULL_SPAN
+        return Span(self, name, args)
+
+    def _record(self, name: str, start_ns: int, end_ns: int, args: Dict[str, Any]):
+        event = (name, start_ns, end_ns - start_ns, threading.get_ident(), args)
+        with self._lock:
+            self._events.append(event)
+
+    def clear(self):
+        with self._lock:
+            self._events = []
+
+    def events(self) -> List[Dict[str, Any]]:
+        """Chrome trace-event 형식 ("X" complete 이벤트, 마이크로초 단위)"""
+        with self._lock:
+            events = list(self._events)
+        pid = os.getpid()
+        return [
+            {
+                "name": name,
+                "ph": "X",
+                "ts": (start_ns - self._origin_ns) / 1000,
+                "dur": duration_ns / 1000,
+                "pid": pid,
+                "tid": tid,
+                "args": {key: str(value) for key, value in args.items()},
+            }
+            for name, start_ns, duration_ns, tid, args in events
+        ]
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """span 이름별 호출 수와 총/평균 시간(ms)"""
+        totals: Dict[str, List[float]] = {}
+        with self._lock:
+            for name, _, duration_ns, _, _ in self._events:
+                totals.setdefault(name, []).append(duration_ns / 1e6)
+        return {
+            name: {
+                "count": len(durations),
+                "total_ms": sum(durations),
+                "mean_ms": sum(durations) / len(durations),
+            }
+            for name, durations in totals.items()
+        }
+
+    def export_chrome_trace(self, path: Path) -> Path:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        serialization.dump_file(
+            {"traceEvents": self.events(), "displayTimeUnit": "ms"}, path
+        )
+        logger.info(f"Trace saved to {path}")
+        return path
+
+
+tracer = Tracer(enabled=settings.trace_enabled)
+
+
+def span(name: str, **args):
+    return tracer.span(name, **args)
+
+
+def traced(name: Optional[str] = None) -> Callable:
+    """함수 호출 전체를 span으로 기록하는 데코레이터"""
+
+    def decorator(func: Callable) -> Callable:
+        span_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not tracer.enabled:
+                return func(*args, **kwargs)
+            with tracer.span(span_name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
@@ -156,6 +156,9 @@ class Visualizer:
 
             if corrections:
                 df = pd.DataFrame(corrections)
+                # answer-only 모드 결과에는 reasoning이 없으므로 빈 열은 생략
+                if not df["Reasoning"].any():
+                    df = df.drop(columns="Reasoning")
                 corrections_path = self.output_dir / f"{exam_result.exam_name}_corrections.csv"
                 df.to_csv(corrections_path, index=False)
                 logger.info(f"Corrections table saved at: {corrections_path}")
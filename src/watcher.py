@@ -0,0 +1,333 @@
+# src/watcher.py
+import hashlib
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+from src import serialization
+from src.config import settings
+from src.models import ExamResult, Question, QuestionResult
+from src.processor import Processor
+from src.serialization import load_question
+from src.visualizer import Visualizer
+
+logger = logging.getLogger(__name__)
+
+
+def file_digest(path: Path) -> str:
+    return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+
+
+@dataclass
+class FileChanges:
+    """한 번의 scan에서 찾은 변경 (data_dir 기준 상대 경로)"""
+
+    added: List[str] = field(default_factory=list)
+    changed: List[str] = field(default_factory=list)
+    deleted: List[str] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.changed or self.deleted)
+
+
+class DataWatcher:
+    """data/<exam>/<n>.json 파일의 추가/변경/삭제를 polling으로 감지
+
+    (mtime, size)가 바뀐 파일만 다시 해싱하고, 내용 해시가 달라졌을 때만 변경으로
+    본다 (저장만 다시 한 파일은 무시). 편집기가 쓰는 도중의 파일을 읽지 않도록
+    마지막 수정 후 settle_time이 지난 파일만 보고한다.
+    """
+
+    def __init__(
+        self,
+        data_dir: Path = settings.data_dir,
+        exams: Optional[List[str]] = None,
+        settle_time: float = 0.5,
+    ):
+        self.data_dir = Path(data_dir)
+        self.exams = exams
+        self.settle_time = settle_time
+        # 상대 경로 -> 내용 해시 (마지막으로 보고한 상태)
+        self.hashes: Dict[str, str] = {}
+        self._stats: Dict[str, Tuple[int, int]] = {}
+
+    def _question_files(self) -> Dict[str, os.stat_result]:
+        files = {}
+        if not self.data_dir.exists():
+            return files
+        for exam_entry in os.scandir(self.data_dir):
+            if not exam_entry.is_dir():
+                continue
+            if self.exams is not None and exam_entry.name not in self.exams:
+                continue
+            for entry in os.scandir(exam_entry.path):
+                name, suffix = os.path.splitext(entry.name)
+                if suffix == ".json" and name.isdigit() and entry.is_file():
+                    files[f"{exam_entry.name}/{entry.name}"] = entry.stat()
+        return files
+
+    def forget(self, relative: str, retry: bool = False):
+        """처리하지 못한 파일을 다시 변경으로 보고되도록 함
+
+        retry=True이면 다음 scan에서 바로, 아니면 파일이 다시 수정된 뒤에 보고한다.
+        """
+        self.hashes.pop(relative, None)
+        if retry:
+            self._stats.pop(relative, None)
+
+    def scan(self) -> FileChanges:
+        changes = FileChanges()
+        now = time.time()
+        files = self._question_files()
+        for relative, stat in files.items():
+            signature = (stat.st_mtime_ns, stat.st_size)
+            if self._stats.get(relative) == signature:
+                continue
+            if now - stat.st_mtime < self.settle_time:
+                continue  # 아직 쓰는 중일 수 있음. 다음 scan에서 다시 확인
+            try:
+                digest = file_digest(self.data_dir / relative)
+            except OSError:
+                continue  # scan 도중 삭제됨
+            self._stats[relative] = signature
+            previous = self.hashes.get(relative)
+            if previous == digest:
+                continue
+            self.hashes[relative] = digest
+            (changes.added if previous is None else changes.changed).append(relative)
+
+        for relative in set(self.hashes) | set(self._stats):
+            if relative in files:
+                continue
+            if self.exams is not None and relative.split("/")[0] not in self.exams:
+                continue
+            self.hashes.pop(relative, None)
+            self._stats.pop(relative, None)
+            changes.deleted.append(relative)
+
+        for paths in (changes.added, changes.changed, changes.deleted):
+            paths.sort(key=_sort_key)
+        return changes
+
+
+def _sort_key(relative: str) -> Tuple[str, int]:
+    exam_name, file_name = relative.split("/")
+    return exam_name, int(Path(file_name).stem)
+
+
+class IncrementalEvaluator:
+    """바뀐 문제 파일만 다시 풀고 시험별 집계와 요약 출력을 갱신
+
+    문제별 결과와 파일 해시는 state_path에 저장되므로, 재시작해도 마지막 상태 이후
+    바뀐 파일만 다시 처리한다 (처음 실행할 때는 감시 대상 시험 전체를 한 번 처리).
+    시험의 execution_time은 문제별 처리 시간의 합이다.
+    API 호출에 실패한 파일은 다음 scan에서 다시 시도하되, max_retries번 연속으로
+    실패하면 (거부, 길이 초과처럼 반복해도 같은 결과) 파일이 다시 수정될 때까지 둔다.
+    """
+
+    def __init__(
+        self,
+        processor: Processor,
+        watcher: DataWatcher,
+        visualizer: Optional[Visualizer] = None,
+        state_path: Path = settings.watch_state_path,
+        visualize_timing: bool = False,
+        max_retries: int = settings.watch_max_retries,
+    ):
+        self.processor = processor
+        self.watcher = watcher
+        self.visualizer = visualizer
+        self.state_path = Path(state_path)
+        self.visualize_timing = visualize_timing
+        # exam -> {상대 경로 -> QuestionResult}
+        self.results: Dict[str, Dict[str, QuestionResult]] = {}
+        self.api_calls = 0
+        self.max_retries = max_retries
+        # 상대 경로 -> 연속 실패 횟수
+        self._failures: Dict[str, int] = {}
+        self._load_state()
+
+    def _load_state(self):
+        if not self.state_path.exists():
+            return
+        state = serialization.loads(self.state_path.read_bytes())
+        self.watcher.hashes = dict(state["hashes"])
+        for relative, result in state["results"].items():
+            exam_name = relative.split("/")[0]
+            self.results.setdefault(exam_name, {})[relative] = (
+                QuestionResult.model_validate(result)
+            )
+        logger.info(
+            f"Loaded watch state: {len(self.watcher.hashes)} files, "
+            f"{sum(len(r) for r in self.results.values())} results"
+        )
+
+    def _save_state(self):
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.state_path.with_suffix(".tmp")
+        serialization.dump_file(
+            {
+                "hashes": self.watcher.hashes,
+                "results": {
+                    relative: result
+                    for exam_results in self.results.values()
+                    for relative, result in exam_results.items()
+                },
+            },
+            tmp_path,
+        )
+        os.replace(tmp_path, self.state_path)
+
+    def exam_result(self, exam_name: str) -> ExamResult:
+        """현재 문제별 결과로 만든 시험 집계 (문제 번호 순)"""
+        results = [
+            self.results[exam_name][relative]
+            for relative in sorted(self.results.get(exam_name, {}), key=_sort_key)
+        ]
+        correct_answers = sum(result.is_correct for result in results)
+        return ExamResult(
+            exam_name=exam_name,
+            start_time=min((r.start_time for r in results), default=datetime.now()),
+            end_time=max((r.end_time for r in results), default=datetime.now()),
+            execution_time=sum(result.execution_time for result in results),
+            questions_results=results,
+            total_questions=len(results),
+            correct_answers=correct_answers,
+            accuracy=correct_answers / len(results) if results else 0,
+        )
+
+    def _load(self, relative: str) -> Optional[Question]:
+        try:
+            return load_question(self.watcher.data_dir / relative)
+        except Exception as e:
+            # 이전 결과를 유지하고, 파일이 다시 저장되면 재시도
+            logger.error(f"Could not load {relative}: {e}")
+            self.watcher.forget(relative)
+            return None
+
+    def _evaluate(self, pending: List[Tuple[str, Question]]) -> Set[str]:
+        """문제들을 다시 풀어 결과를 교체하고 결과가 바뀐 시험 이름을 반환
+
+        API 호출에 실패한 문제는 이전 결과를 유지하고 다음 scan에서 다시 시도한다.
+        max_retries번 연속으로 실패하면 파일이 다시 수정될 때까지 재시도하지 않는다.
+        """
+        touched = set()
+        with ThreadPoolExecutor(
+            self.processor.max_concurrency, thread_name_prefix="watch"
+        ) as executor:
+            outcomes = executor.map(
+                lambda item: self.processor.process_question(
+                    item[1], item[0].split("/")[0]
+                ),
+                pending,
+            )
+            for (relative, _), (question_result, debug_entry) in zip(pending, outcomes):
+                self.api_calls += 1
+                exam_name = relative.split("/")[0]
+                debug_entry["file"] = relative
+                debug_path = self.processor.debug_dir / f"{exam_name}_watch_debug.jsonl"
+                with debug_path.open("ab") as f:
+                    f.write(serialization.dumps_line(debug_entry))
+
+                if question_result is None:
+                    self._record_failure(relative)
+                    continue
+                self._failures.pop(relative, None)
+                self.results.setdefault(exam_name, {})[relative] = question_result
+                touched.add(exam_name)
+        return touched
+
+    def _record_failure(self, relative: str):
+        failures = self._failures.get(relative, 0) + 1
+        if failures < self.max_retries:
+            self._failures[relative] = failures
+            self.watcher.forget(relative, retry=True)
+            return
+        # 다음 보고는 파일이 다시 수정된 뒤이므로 횟수를 처음부터 다시 셈
+        self._failures.pop(relative, None)
+        self.watcher.forget(relative)
+        logger.warning(
+            f"Giving up on {relative} after {failures} failed attempts; "
+            f"it will be retried when the file changes"
+        )
+
+    def apply(self, changes: FileChanges) -> List[str]:
+        """변경을 반영하고 결과가 바뀐 시험 이름 목록을 반환"""
+        touched = set()
+        for relative in changes.deleted:
+            exam_name = relative.split("/")[0]
+            self._failures.pop(relative, None)
+            if self.results.get(exam_name, {}).pop(relative, None) is not None:
+                touched.add(exam_name)
+            logger.info(f"Question file removed: {relative}")
+
+        pending = []
+        for relative in changes.added + changes.changed:
+            action = "added" if relative in changes.added else "changed"
+            logger.info(f"Question file {action}: {relative}")
+            question = self._load(relative)
+            if question is not None:
+                pending.append((relative, question))
+        if pending:
+            touched |= self._evaluate(pending)
+
+        for exam_name in touched:
+            if not self.results.get(exam_name):
+                self.results.pop(exam_name, None)
+        if touched:
+            self._save_state()
+            self._update_outputs(sorted(touched))
+        return sorted(touched)
+
+    def _update_outputs(self, exams: List[str]):
+        for exam_name in exams:
+            if exam_name not in self.results:
+                logger.info(f"Exam '{exam_name}' has no questions left")
+                continue
+            result = self.exam_result(exam_name)
+            logger.info(
+                f"Exam '{exam_name}': {result.correct_answers}/{result.total_questions} "
+                f"correct ({result.accuracy:.2%})"
+            )
+        if self.visualizer is None:
+            return
+
+        # 요약 CSV는 전체 시험, 그림/오답표는 바뀐 시험만 다시 생성
+        all_results = [self.exam_result(name) for name in sorted(self.results)]
+        changed_results = [
+            self.exam_result(name) for name in exams if name in self.results
+        ]
+        for exam_name in exams:
+            # 오답이 없어지면 오답표가 새로 쓰이지 않으므로 이전 파일을 지움
+            corrections = self.visualizer.output_dir / f"{exam_name}_corrections.csv"
+            corrections.unlink(missing_ok=True)
+        self.visualizer.generate_exam_summary(all_results)
+        self.visualizer.generate_score_visualization(changed_results)
+        self.visualizer.generate_corrections_table(changed_results)
+        if self.visualize_timing:
+            self.visualizer.generate_timing_visualization(all_results)
+
+    def run_once(self) -> List[str]:
+        return self.apply(self.watcher.scan())
+
+    def watch(
+        self,
+        interval: float = settings.watch_interval,
+        max_iterations: Optional[int] = None,
+    ):
+        """interval초마다 scan하며 변경을 반영 (Ctrl+C로 종료)"""
+        logger.info(f"Watching {self.watcher.data_dir} every {interval}s")
+        iteration = 0
+        try:
+            while max_iterations is None or iteration < max_iterations:
+                iteration += 1
+                self.run_once()
+                time.sleep(interval)
+        except KeyboardInterrupt:
+            logger.info("Watch mode stopped")
+        logger.info(f"Watch mode made {self.api_calls} question evaluations")
@@ -0,0 +1,439 @@
+# src/work_queue.py
+import logging
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from src.config import settings
+from src.data_loader import DataLoader
+from src.models import ExamResult
+from src.processor import ProcessingCancelled
+
+logger = logging.getLogger(__name__)
+
+PENDING, LEASED, DONE, FAILED = "pending", "leased", "done", "failed"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS units (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    run_id TEXT NOT NULL DEFAULT '',
+    exam_name TEXT NOT NULL,
+    start_num INTEGER NOT NULL,
+    end_num INTEGER NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    worker_id TEXT,
+    lease_expires REAL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    result TEXT,
+    error TEXT,
+    UNIQUE (run_id, exam_name, start_num, end_num)
+)
+"""
+
+_UNIT_COLUMNS = (
+    "id, exam_name, start_num, end_num, status, worker_id, lease_expires,"
+    " attempts, result, error"
+)
+
+
+def new_run_id() -> str:
+    return f"{time.strftime('%Y%m%dT%H%M%S')}-{uuid.uuid4().hex[:6]}"
+
+
+@dataclass
+class WorkUnit:
+    id: int
+    exam_name: str
+    start_num: int
+    end_num: int
+    attempts: int = 0
+
+    @property
+    def run_label(self) -> str:
+        """debug/trace 파일 이름 (같은 시험의 shard끼리 겹치지 않도록)"""
+        return f"{self.exam_name}_{self.start_num}-{self.end_num}"
+
+
+class WorkQueue:
+    """SQLite 기반 작업 큐
+
+    한 시험의 문제 범위(work unit)를 worker가 lease 해서 처리한다. unit은 run_id로
+    실행(coordinator의 submit)마다 구분되어, 같은 DB를 다시 써도 이전 실행의 결과가
+    섞이지 않는다. worker는 run과 무관하게 가장 오래된 unit부터 가져간다. lease는
+    lease_timeout 안에 heartbeat로 연장해야 하며, 만료되면 다른 worker가 다시
+    가져갈 수 있다. max_attempts번 실패/만료된 unit은 failed로 남는다.
+    unit 하나가 수십 문제 단위라 쓰기가 드물므로 WAL 대신 기본 rollback journal을
+    사용한다 (WAL은 네트워크 파일시스템에서 동작하지 않음).
+    """
+
+    def __init__(
+        self,
+        db_path: Path = settings.work_queue_path,
+        lease_timeout: float = settings.work_lease_timeout,
+        max_attempts: int = settings.work_max_attempts,
+    ):
+        self.db_path = Path(db_path)
+        self.lease_timeout = lease_timeout
+        self.max_attempts = max_attempts
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._transaction() as conn:
+            self._migrate(conn)
+            conn.execute(_SCHEMA)
+
+    @staticmethod
+    def _migrate(conn: sqlite3.Connection):
+        """run_id가 없는 예전 스키마의 unit을 run_id ''로 옮김"""
+        columns = [row[1] for row in conn.execute("PRAGMA table_info(units)")]
+        if not columns or "run_id" in columns:
+            return
+        conn.execute("ALTER TABLE units RENAME TO units_old")
+        conn.execute(_SCHEMA)
+        conn.execute(
+            f"INSERT INTO units ({_UNIT_COLUMNS}) SELECT {_UNIT_COLUMNS} FROM units_old"
+        )
+        conn.execute("DROP TABLE units_old")
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        # 연결은 호출마다 새로 열어 프로세스/스레드 간에 공유하지 않음
+        conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        with self._connect() as conn:
+            # 쓰기 잠금을 먼저 잡아 두 worker가 같은 unit을 lease 하지 않도록 함
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    def add_units(self, units: Iterable[Tuple[str, int, int]], run_id: str = "") -> int:
+        """(exam_name, start_num, end_num) 목록을 run_id 실행에 추가
+
+        같은 범위의 unit이 이미 있으면 무시하고(중단된 실행 재개), 같은 실행 안에서
+        범위가 겹치는 다른 unit이 있으면 (shard 크기를 바꾼 경우 등) 결과가 두 번
+        집계되지 않도록 ValueError를 낸다. 이 경우 아무 unit도 추가하지 않는다.
+        """
+        with self._transaction() as conn:
+            added = 0
+            for exam_name, start_num, end_num in units:
+                overlap = conn.execute(
+                    "SELECT start_num, end_num FROM units WHERE run_id = ?"
+                    " AND exam_name = ? AND start_num <= ? AND end_num >= ?"
+                    " AND NOT (start_num = ? AND end_num = ?) LIMIT 1",
+                    (run_id, exam_name, end_num, start_num, start_num, end_num),
+                ).fetchone()
+                if overlap is not None:
+                    raise ValueError(
+                        f"Work unit {exam_name} {start_num}-{end_num} overlaps "
+                        f"existing unit {overlap[0]}-{overlap[1]} of run '{run_id}'"
+                    )
+                cursor = conn.execute(
+                    "INSERT OR IGNORE INTO units (run_id, exam_name, start_num, end_num)"
+                    " VALUES (?, ?, ?, ?)",
+                    (run_id, exam_name, start_num, end_num),
+                )
+                added += cursor.rowcount
+        logger.info(f"Added {added} work units to {self.db_path} (run '{run_id}')")
+        return added
+
+    def _expire_leases(self, conn: sqlite3.Connection, now: float):
+        """lease가 만료된 unit 중 재시도 횟수를 다 쓴 것은 failed로 표시"""
+        conn.execute(
+            "UPDATE units SET status = ?, error = 'lease expired', worker_id = NULL"
+            " WHERE status = ? AND lease_expires < ? AND attempts >= ?",
+            (FAILED, LEASED, now, self.max_attempts),
+        )
+
+    def lease(self, worker_id: str) -> Optional[WorkUnit]:
+        """대기 중이거나 lease가 만료된 unit 하나를 가져옴. 없으면 None"""
+        now = time.time()
+        with self._transaction() as conn:
+            self._expire_leases(conn, now)
+            row = conn.execute(
+                "SELECT id, exam_name, start_num, end_num, attempts FROM units"
+                " WHERE status = ? OR (status = ? AND lease_expires < ?)"
+                " ORDER BY id LIMIT 1",
+                (PENDING, LEASED, now),
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute(
+                "UPDATE units SET status = ?, worker_id = ?, lease_expires = ?,"
+                " attempts = attempts + 1 WHERE id = ?",
+                (LEASED, worker_id, now + self.lease_timeout, row[0]),
+            )
+        unit = WorkUnit(*row[:4], attempts=row[4] + 1)
+        logger.info(
+            f"Worker {worker_id} leased unit {unit.id} "
+            f"({unit.exam_name} {unit.start_num}-{unit.end_num}, attempt {unit.attempts})"
+        )
+        return unit
+
+    def _update_lease(self, sql: str, params: tuple, unit_id: int, worker_id: str) -> bool:
+        # 현재 lease를 가진 worker만 갱신할 수 있음 (만료 후 다른 worker가 가져간 경우 거부)
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                f"{sql} WHERE id = ? AND worker_id = ? AND status = ?",
+                (*params, unit_id, worker_id, LEASED),
+            )
+            return cursor.rowcount == 1
+
+    def heartbeat(self, unit_id: int, worker_id: str) -> bool:
+        """lease를 연장. lease를 잃었으면 False"""
+        return self._update_lease(
+            "UPDATE units SET lease_expires = ?",
+            (time.time() + self.lease_timeout,),
+            unit_id,
+            worker_id,
+        )
+
+    def complete(self, unit_id: int, worker_id: str, result: str) -> bool:
+        """결과(JSON 문자열)를 저장하고 unit을 done으로 표시"""
+        return self._update_lease(
+            "UPDATE units SET status = ?, result = ?, error = NULL",
+            (DONE, result),
+            unit_id,
+            worker_id,
+        )
+
+    def fail(self, unit_id: int, worker_id: str, error: str) -> bool:
+        """처리 실패. 재시도 횟수가 남아 있으면 다시 pending으로 돌림"""
+        return self._update_lease(
+            "UPDATE units SET status = CASE WHEN attempts < ? THEN ? ELSE ? END,"
+            " error = ?, worker_id = NULL, lease_expires = NULL",
+            (self.max_attempts, PENDING, FAILED, error),
+            unit_id,
+            worker_id,
+        )
+
+    def counts(self, run_id: Optional[str] = None) -> Dict[str, int]:
+        """상태별 unit 수 (run_id가 None이면 모든 실행)"""
+        with self._transaction() as conn:
+            self._expire_leases(conn, time.time())
+            rows = conn.execute(
+                "SELECT status, COUNT(*) FROM units"
+                " WHERE ? IS NULL OR run_id = ? GROUP BY status",
+                (run_id, run_id),
+            ).fetchall()
+        counts = {PENDING: 0, LEASED: 0, DONE: 0, FAILED: 0}
+        counts.update(dict(rows))
+        return counts
+
+    def is_finished(self, run_id: Optional[str] = None) -> bool:
+        counts = self.counts(run_id)
+        return counts[PENDING] == 0 and counts[LEASED] == 0
+
+    def results(self, run_id: str = "") -> List[Tuple[str, int, str]]:
+        """run_id 실행에서 완료된 unit의 (exam_name, start_num, result JSON) 목록"""
+        with self._connect() as conn:
+            return conn.execute(
+                "SELECT exam_name, start_num, result FROM units"
+                " WHERE status = ? AND run_id = ? ORDER BY exam_name, start_num",
+                (DONE, run_id),
+            ).fetchall()
+
+    def failures(self, run_id: str = "") -> List[Tuple[str, int, int, Optional[str]]]:
+        with self._connect() as conn:
+            return conn.execute(
+                "SELECT exam_name, start_num, end_num, error FROM units"
+                " WHERE status = ? AND run_id = ? ORDER BY id",
+                (FAILED, run_id),
+            ).fetchall()
+
+
+def shard_exam(
+    data_loader: DataLoader, exam_name: str, shard_size: int
+) -> List[Tuple[str, int, int]]:
+    """시험의 문제 번호를 shard_size개씩 (exam_name, start_num, end_num) 범위로 나눔"""
+    numbers = data_loader.get_question_numbers(exam_name)
+    return [
+        (exam_name, chunk[0], chunk[-1])
+        for chunk in (
+            numbers[i : i + shard_size] for i in range(0, len(numbers), shard_size)
+        )
+    ]
+
+
+def merge_exam_results(results: List[ExamResult]) -> ExamResult:
+    """같은 시험의 shard 결과들을 하나의 ExamResult로 합침"""
+    questions_results = [
+        question_result for result in results for question_result in result.questions_results
+    ]
+    total_questions = sum(result.total_questions for result in results)
+    correct_answers = sum(result.correct_answers for result in results)
+    start_time = min(result.start_time for result in results)
+    end_time = max(result.end_time for result in results)
+    return ExamResult(
+        exam_name=results[0].exam_name,
+        start_time=start_time,
+        end_time=end_time,
+        # shard들이 병렬로 돌기 때문에 처리 시간은 wall-clock 구간으로 계산
+        execution_time=(end_time - start_time).total_seconds(),
+        questions_results=questions_results,
+        total_questions=total_questions,
+        correct_answers=correct_answers,
+        accuracy=correct_answers / total_questions if total_questions else 0,
+    )
+
+
+class Coordinator:
+    """시험들을 work unit으로 나눠 큐에 넣고, 끝나면 결과를 시험별로 합침
+
+    run_id를 주면 그 실행을 이어서 처리하고(같은 shard 크기여야 함), 없으면 새 실행을
+    시작한다. 대기와 결과 병합은 이 실행의 unit만 본다.
+    """
+
+    def __init__(
+        self,
+        work_queue: WorkQueue,
+        data_loader: DataLoader,
+        run_id: Optional[str] = settings.work_run_id,
+    ):
+        self.work_queue = work_queue
+        self.data_loader = data_loader
+        self.run_id = run_id or new_run_id()
+        logger.info(f"Work queue run id: {self.run_id}")
+
+    def submit(
+        self, exams: Optional[List[str]] = None, shard_size: int = settings.work_shard_size
+    ) -> int:
+        exams = exams if exams is not None else self.data_loader.get_all_exams()
+        units = [
+            unit
+            for exam_name in exams
+            for unit in shard_exam(self.data_loader, exam_name, shard_size)
+        ]
+        logger.info(f"Sharded {len(exams)} exams into {len(units)} work units")
+        return self.work_queue.add_units(units, self.run_id)
+
+    def wait(self, poll_interval: float = 5.0, timeout: Optional[float] = None) -> bool:
+        """모든 unit이 done/failed가 될 때까지 대기. 시간 초과 시 False"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            counts = self.work_queue.counts(self.run_id)
+            if counts[PENDING] == 0 and counts[LEASED] == 0:
+                logger.info(f"All work units finished: {counts}")
+                return True
+            if deadline is not None and time.monotonic() >= deadline:
+                logger.warning(f"Timed out waiting for work units: {counts}")
+                return False
+            logger.debug(f"Waiting for work units: {counts}")
+            time.sleep(poll_interval)
+
+    def merge_results(self) -> List[ExamResult]:
+        for exam_name, start_num, end_num, error in self.work_queue.failures(
+            self.run_id
+        ):
+            logger.error(
+                f"Work unit {exam_name} {start_num}-{end_num} failed: {error}"
+            )
+
+        by_exam: Dict[str, List[ExamResult]] = {}
+        for exam_name, _, result in self.work_queue.results(self.run_id):
+            by_exam.setdefault(exam_name, []).append(
+                ExamResult.model_validate_json(result)
+            )
+        return [merge_exam_results(results) for results in by_exam.values()]
+
+
+class Worker:
+    """큐에서 unit을 lease 해서 Processor로 처리하고 결과를 저장하는 worker
+
+    처리 중에는 백그라운드 스레드가 lease_timeout / 3 간격으로 heartbeat를 보낸다.
+    lease를 잃으면 (다른 worker가 이어받았으므로) 아직 시작하지 않은 문제의 API 호출을
+    멈추고 unit을 포기한다.
+    """
+
+    def __init__(
+        self,
+        work_queue: WorkQueue,
+        processor,
+        worker_id: Optional[str] = None,
+        heartbeat_interval: Optional[float] = None,
+    ):
+        self.work_queue = work_queue
+        self.processor = processor
+        self.worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}"
+        self.heartbeat_interval = heartbeat_interval or work_queue.lease_timeout / 3
+
+    def _heartbeat(
+        self, unit: WorkUnit, stop: threading.Event, lease_lost: threading.Event
+    ):
+        while not stop.wait(self.heartbeat_interval):
+            if not self.work_queue.heartbeat(unit.id, self.worker_id):
+                logger.warning(
+                    f"Worker {self.worker_id} lost the lease on unit {unit.id}"
+                )
+                lease_lost.set()
+                return
+
+    def process_unit(self, unit: WorkUnit) -> bool:
+        stop = threading.Event()
+        lease_lost = threading.Event()
+        heartbeat = threading.Thread(
+            target=self._heartbeat, args=(unit, stop, lease_lost), daemon=True
+        )
+        heartbeat.start()
+        try:
+            result = self.processor.process_exam(
+                unit.exam_name,
+                unit.start_num,
+                unit.end_num,
+                run_label=unit.run_label,
+                cancel=lease_lost,
+            )
+        except ProcessingCancelled:
+            logger.warning(f"Worker {self.worker_id} abandoned unit {unit.id}")
+            return False
+        except Exception as e:
+            logger.error(
+                f"Worker {self.worker_id} failed on unit {unit.id}: {e}", exc_info=True
+            )
+            self.work_queue.fail(unit.id, self.worker_id, str(e))
+            return False
+        finally:
+            stop.set()
+            heartbeat.join()
+
+        if not self.work_queue.complete(unit.id, self.worker_id, result.model_dump_json()):
+            logger.warning(
+                f"Discarding result of unit {unit.id}: lease is held by another worker"
+            )
+            return False
+        return True
+
+    def run(self, max_units: Optional[int] = None, poll_interval: float = 0) -> int:
+        """큐가 빌 때까지 unit을 처리하고 완료한 개수를 반환
+
+        poll_interval > 0 이면 큐가 비어도 모든 unit이 끝날 때까지 대기하며
+        (다른 worker의 lease가 만료되면 이어받기 위해) 주기적으로 다시 확인한다.
+        """
+        completed = 0
+        processed = 0
+        while max_units is None or processed < max_units:
+            unit = self.work_queue.lease(self.worker_id)
+            if unit is None:
+                if poll_interval <= 0 or self.work_queue.is_finished():
+                    break
+                time.sleep(poll_interval)
+                continue
+            processed += 1
+            completed += self.process_unit(unit)
+
+        logger.info(f"Worker {self.worker_id} completed {completed} work units")
+        return completed
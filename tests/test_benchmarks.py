@@ -0,0 +1,27 @@
+from benchmarks import run, synthetic
+from src.data_loader import DataLoader
+
+
+def test_synthetic_exams_load(tmp_path):
+    names = synthetic.generate_exams(tmp_path, questions=23, exams=3, seed=1)
+    loader = DataLoader(tmp_path)
+    questions = [q for name in names for q in loader.load_questions(name)]
+
+    assert loader.get_all_exams() == sorted(names)
+    assert len(questions) == 23
+    assert all(len(q.options) == 5 for q in questions)
+    assert any(q.data for q in questions)
+
+
+def test_suite_reports_timings_and_ratios():
+    report = run.run_suite(
+        questions=10, exams=2, paragraphs=20, repeat=1, only=["data_loader", "prompts"]
+    )
+    assert set(report["results"]) == {
+        "data_loader.load_questions",
+        "prompts.get_question_prompt",
+    }
+    assert report["results"]["data_loader.load_questions"]["items"] == 10
+
+    ratios = run.compare(report, report)
+    assert all(ratio == 1.0 for ratio in ratios.values())
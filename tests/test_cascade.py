@@ -0,0 +1,175 @@
+import math
+from unittest.mock import MagicMock, patch
+
+import pytest
+from openai import OpenAI
+from openai.types.chat import ChatCompletion
+
+from src.cascade import answer_confidence, calibrate_threshold, tier_report
+from src.config import settings
+from src.data_loader import DataLoader
+from src.models import Question
+from src.openai_client import OpenAIClient
+from src.processor import Processor
+from src.schemas import AnswerResponse
+
+
+def _completion(model: str, answer: str, answer_prob: float = None) -> ChatCompletion:
+    content = f'{{"selected_answer":"{answer}","reasoning":["1","2","3","4","5"]}}'
+    logprobs = None
+    if answer_prob is not None:
+        tokens = ['{"', "selected", "_answer", '":"', answer, '","', "reason"]
+        tokens.append(content[len("".join(tokens)) :])
+        logprobs = {
+            "content": [
+                {
+                    "token": token,
+                    "bytes": None,
+                    "logprob": math.log(answer_prob) if token == answer else 0.0,
+                    "top_logprobs": [],
+                }
+                for token in tokens
+            ]
+        }
+    return ChatCompletion.model_validate(
+        {
+            "id": "test",
+            "object": "chat.completion",
+            "created": 0,
+            "model": model,
+            "choices": [
+                {
+                    "index": 0,
+                    "finish_reason": "stop",
+                    "logprobs": logprobs,
+                    "message": {"role": "assistant", "content": content},
+                }
+            ],
+            "usage": {
+                "prompt_tokens": 1000,
+                "completion_tokens": 100,
+                "total_tokens": 1100,
+            },
+        }
+    )
+
+
+def _parsed(response: ChatCompletion) -> ChatCompletion:
+    message = response.choices[0].message
+    object.__setattr__(
+        message, "parsed", AnswerResponse.model_validate_json(message.content)
+    )
+    object.__setattr__(message, "refusal", None)
+    return response
+
+
+def test_answer_confidence_reads_answer_token():
+    assert answer_confidence(_completion("m", "3", 0.8)) == pytest.approx(0.8)
+    assert answer_confidence(_completion("m", "3")) is None
+
+
+@pytest.mark.parametrize(
+    "fast_prob, expected_models",
+    [(0.95, ["gpt-4o-mini"]), (0.5, ["gpt-4o-mini", "gpt-4o"])],
+)
+def test_cascade_escalates_on_low_confidence(fast_prob, expected_models):
+    client = OpenAIClient(
+        model_name="gpt-4o",
+        client=OpenAI(api_key="test-key"),
+        fast_model="gpt-4o-mini",
+        cascade_threshold=0.9,
+    )
+
+    def parse(model, **kwargs):
+        if model == "gpt-4o-mini":
+            assert kwargs["logprobs"] is True
+            return _parsed(_completion(model, "2", fast_prob))
+        return _parsed(_completion(model, "4"))
+
+    with patch.object(client.client.beta.chat.completions, "parse", side_effect=parse):
+        response = client.get_response("질문", ["1", "2", "3", "4", "5"])
+
+    assert [attempt["model"] for attempt in response.cascade] == expected_models
+    assert response.selected_answer == ("2" if len(expected_models) == 1 else "4")
+    assert response.cascade[0]["cost"] == pytest.approx((1000 * 0.15 + 100 * 0.6) / 1e6)
+
+
+def _entry(confidence, fast_answer, correct_answer, escalated=False):
+    attempts = [
+        {
+            "model": "fast",
+            "selected_answer": fast_answer,
+            "confidence": confidence,
+            "latency": 1.0,
+            "cost": 0.1,
+        }
+    ]
+    if escalated:
+        attempts.append(
+            {
+                "model": "primary",
+                "selected_answer": correct_answer,
+                "confidence": None,
+                "latency": 3.0,
+                "cost": 1.0,
+            }
+        )
+    final = attempts[-1]["selected_answer"]
+    return {
+        "correct_answer": correct_answer,
+        "is_correct": final == correct_answer,
+        "cascade": attempts,
+    }
+
+
+def test_calibrate_threshold_from_stored_results():
+    entries = [
+        _entry(0.99, "1", "1"),
+        _entry(0.95, "2", "2"),
+        _entry(0.90, "3", "1", escalated=True),
+        _entry(0.80, "4", "4", escalated=True),
+        _entry(0.60, "5", "1", escalated=True),
+    ]
+    assert calibrate_threshold(entries, target_accuracy=1.0) == 0.95
+    assert calibrate_threshold(entries, target_accuracy=0.75) == 0.80
+    assert calibrate_threshold(entries[2:3], target_accuracy=0.9) is None
+
+
+def test_tier_report():
+    entries = [_entry(0.99, "1", "1"), _entry(0.5, "2", "1", escalated=True)]
+    report = tier_report(entries)
+
+    assert report["fast"]["requests"] == 2
+    assert report["fast"]["answered"] == 1
+    assert report["fast"]["accuracy"] == 1.0
+    assert report["primary"]["answered"] == 1
+    assert report["primary"]["mean_latency"] == 3.0
+    assert report["primary"]["cost"] == 1.0
+
+
+def test_processor_keeps_only_tier_fields_for_report(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "output_dir", tmp_path)
+    data_loader = MagicMock(spec=DataLoader)
+    data_loader.load_questions.return_value = [
+        Question(
+            id=f"Q{num}",
+            question="질문",
+            options=["1", "2", "3", "4", "5"],
+            correct_answer="1",
+        )
+        for num in range(1, 3)
+    ]
+    openai_client = MagicMock(spec=OpenAIClient)
+    openai_client.get_response.return_value = MagicMock(
+        selected_answer="1",
+        reasoning=["r"] * 5,
+        cascade=_entry(0.99, "1", "1")["cascade"],
+    )
+
+    with patch("src.processor.tier_report", wraps=tier_report) as report:
+        Processor(data_loader, openai_client).process_exam("2023_1형")
+
+    # 시험 전체의 debug 항목(프롬프트, 풀이 등)을 메모리에 들고 있지 않음
+    entries = report.call_args.args[0]
+    assert [set(entry) for entry in entries] == [{"cascade", "is_correct"}] * 2
+    assert tier_report(entries)["fast"]["correct"] == 2
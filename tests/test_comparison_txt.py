@@ -0,0 +1,115 @@
+import difflib
+import random
+import re
+
+import pytest
+
+from Retrival.comparison_txt import TextComparator, TextStats, diff_lines
+
+
+def _matcher_opcodes(lines1, lines2):
+    return [
+        tuple(opcode)
+        for opcode in difflib.SequenceMatcher(
+            None, lines1, lines2, autojunk=False
+        ).get_opcodes()
+    ]
+
+
+def _lcs_length(lines1, lines2) -> int:
+    previous = [0] * (len(lines2) + 1)
+    for line1 in lines1:
+        current = [0]
+        for j, line2 in enumerate(lines2):
+            current.append(
+                previous[j] + 1 if line1 == line2 else max(previous[j + 1], current[j])
+            )
+        previous = current
+    return previous[-1]
+
+
+def _apply(opcodes, lines1, lines2):
+    """opcode로 lines1에서 lines2를 다시 만듦 (구간이 빈틈없이 이어지는지도 확인)"""
+    rebuilt = []
+    i = j = 0
+    for tag, i1, i2, j1, j2 in opcodes:
+        assert (i1, j1) == (i, j)
+        if tag == "equal":
+            assert lines1[i1:i2] == lines2[j1:j2]
+            rebuilt.extend(lines1[i1:i2])
+        else:
+            rebuilt.extend(lines2[j1:j2])
+        i, j = i2, j2
+    assert (i, j) == (len(lines1), len(lines2))
+    return rebuilt
+
+
+@pytest.mark.parametrize(
+    "lines1, lines2",
+    [
+        ([], []),
+        ([], ["a", "b"]),
+        (["a", "b"], []),
+        (["a", "b", "c"], ["a", "b", "c"]),
+        (["a", "b", "c"], ["x", "y"]),
+        # 한쪽에만 있는 줄
+        (["x", "a", "b"], ["a", "y", "b"]),
+        (["a", "b", "only1", "c"], ["a", "b", "c", "only2"]),
+    ],
+)
+def test_diff_lines_matches_sequence_matcher_on_edge_cases(lines1, lines2):
+    # 최소 편집이 하나뿐인 입력만 (동률일 때 어느 쪽을 맞출지는 구현마다 다름)
+    assert diff_lines(lines1, lines2) == _matcher_opcodes(lines1, lines2)
+
+
+def test_diff_lines_is_a_minimal_edit_script():
+    rng = random.Random(0)
+    for _ in range(500):
+        alphabet = "abcde"[: rng.randint(1, 5)]
+        lines1 = [rng.choice(alphabet) for _ in range(rng.randint(0, 20))]
+        lines2 = [rng.choice(alphabet + "xy") for _ in range(rng.randint(0, 20))]
+        opcodes = diff_lines(lines1, lines2)
+
+        assert _apply(opcodes, lines1, lines2) == lines2
+        matched = sum(i2 - i1 for tag, i1, i2, _, _ in opcodes if tag == "equal")
+        # SequenceMatcher는 최소가 아닐 수 있으므로 LCS 길이와 비교
+        assert matched == _lcs_length(lines1, lines2)
+        assert matched >= sum(
+            i2 - i1
+            for tag, i1, i2, _, _ in _matcher_opcodes(lines1, lines2)
+            if tag == "equal"
+        )
+
+
+def _regex_stats(text: str) -> TextStats:
+    """Counter로 바꾸기 전의 정규식 기반 통계"""
+    return TextStats(
+        total_chars=len(text),
+        chars_no_space=len(text.replace(" ", "").replace("\n", "").replace("\t", "")),
+        korean_chars=len(re.findall("[가-힣]", text)),
+        english_chars=len(re.findall("[a-zA-Z]", text)),
+        numbers=len(re.findall("[0-9]", text)),
+        spaces=len(re.findall(r"[\s]", text)),
+        lines=len(text.splitlines()),
+        words=len(re.findall(r"\S+", text)),
+    )
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "",
+        "\n",
+        "\n\n",
+        "재무보고 개념체계 2018\n",
+        "마지막 줄에 줄바꿈 없음",
+        "윈도우\r\n줄바꿈\r\n",
+        "윈도우 줄바꿈, 끝에 없음\r\n둘째 줄",
+        "혼합\r줄바꿈\n\r\n\t탭 ABC xyz 123",
+        "특수 경계 문자\x0c와\x85끝",
+        "  앞뒤 공백  \t\n",
+    ],
+)
+def test_text_stats_match_regex_counts(text):
+    comparator = TextComparator.__new__(TextComparator)
+    assert comparator.get_text_stats(text) == _regex_stats(text)
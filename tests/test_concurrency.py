@@ -0,0 +1,174 @@
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from openai import OpenAI
+
+from src import http_client, openai_client
+from src.concurrency import AIMDController
+from src.config import settings
+from src.openai_client import OpenAIClient
+
+CAPACITY = 4
+
+
+class _LimitedHandler(BaseHTTPRequestHandler):
+    """동시에 CAPACITY개까지만 처리하고 넘치면 429를 돌려주는 stub 서버"""
+
+    protocol_version = "HTTP/1.1"
+    lock = threading.Lock()
+    in_flight = 0
+    rejected = 0
+
+    def _send_json(self, status: int, payload: dict):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("content-type", "application/json")
+        self.send_header("content-length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("content-length", 0)))
+        cls = type(self)
+        with cls.lock:
+            overloaded = cls.in_flight >= CAPACITY
+            if overloaded:
+                cls.rejected += 1
+            else:
+                cls.in_flight += 1
+        if overloaded:
+            self._send_json(
+                429, {"error": {"message": "Rate limit", "type": "rate_limit"}}
+            )
+            return
+
+        try:
+            time.sleep(0.02)
+            content = json.dumps(
+                {"selected_answer": "1", "reasoning": ["1", "2", "3", "4", "5"]}
+            )
+            self._send_json(
+                200,
+                {
+                    "id": "test",
+                    "object": "chat.completion",
+                    "created": 0,
+                    "model": "test",
+                    "choices": [
+                        {
+                            "index": 0,
+                            "finish_reason": "stop",
+                            "message": {"role": "assistant", "content": content},
+                        }
+                    ],
+                },
+            )
+        finally:
+            with cls.lock:
+                cls.in_flight -= 1
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def base_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _LimitedHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/v1"
+    server.shutdown()
+    server.server_close()
+
+
+def test_additive_increase_and_latency_backoff():
+    controller = AIMDController(initial_limit=2, max_limit=10, cooldown=0)
+    for _ in range(6):
+        controller.acquire()
+        controller.on_success(0.1)
+    assert controller.limit > 3
+
+    before = controller.limit
+    controller.acquire()
+    controller.on_success(1.0)  # 기준 지연 시간의 2배 초과
+    assert controller.limit == pytest.approx(before / 2)
+    assert controller.in_flight == 0
+
+
+def test_decreases_are_rate_limited_by_cooldown():
+    controller = AIMDController(initial_limit=16, cooldown=60)
+    controller.acquire()
+    controller.on_success(0.1)
+    for _ in range(5):
+        controller.acquire()
+        controller.on_success(10.0)
+    assert controller.decreases == 1
+
+
+@pytest.fixture
+def fast_retries(monkeypatch):
+    monkeypatch.setattr(openai_client, "RETRY_BASE_DELAY", 0.01)
+    monkeypatch.setattr(openai_client, "RETRY_MAX_DELAY", 0.05)
+
+
+def test_shared_client_leaves_retries_to_controller(monkeypatch):
+    monkeypatch.setattr(settings, "adaptive_concurrency", True)
+    monkeypatch.setattr(settings, "openai_api_key", "test-key")
+    monkeypatch.setattr(http_client, "_shared_client", None)
+    try:
+        assert http_client.get_shared_client().max_retries == 0
+    finally:
+        http_client.close_shared_client()
+
+
+def test_controller_converges_to_server_capacity(base_url, fast_retries):
+    controller = AIMDController(initial_limit=1, max_limit=32)
+    # 공용 클라이언트와 같이 SDK는 재시도하지 않고 OpenAIClient가 한도 안에서 재시도
+    client = OpenAIClient(
+        model_name="test",
+        client=OpenAI(api_key="test-key", base_url=base_url, max_retries=0),
+        concurrency=controller,
+    )
+
+    def ask(_):
+        try:
+            client.get_response("질문", ["1", "2", "3", "4", "5"])
+            return True
+        except ValueError:
+            return False
+
+    with ThreadPoolExecutor(32) as executor:
+        outcomes = list(executor.map(ask, range(400)))
+
+    stats = controller.stats()
+    # 한도가 서버 용량 근처에서 늘었다 줄었다 하며, 대부분의 요청은 성공
+    assert stats["decreases"] >= 1
+    assert 1 <= stats["limit"] <= 3 * CAPACITY
+    assert sum(outcomes) / len(outcomes) > 0.8
+
+
+def test_rate_limited_requests_reach_controller_and_are_retried(base_url, fast_retries):
+    controller = AIMDController(initial_limit=16, max_limit=16, cooldown=0)
+    client = OpenAIClient(
+        model_name="test",
+        client=OpenAI(api_key="test-key", base_url=base_url, max_retries=0),
+        concurrency=controller,
+        max_retries=5,
+    )
+    with ThreadPoolExecutor(16) as executor:
+        list(
+            executor.map(
+                lambda _: client.get_response("질문", ["1", "2", "3", "4", "5"]),
+                range(16),
+            )
+        )
+
+    stats = controller.stats()
+    # 429마다 한도가 줄고, 재시도 끝에 모든 요청이 성공
+    assert stats["errors"] >= 1 and stats["decreases"] >= 1
+    assert stats["successes"] == 16
+    assert stats["limit"] < 16
@@ -0,0 +1,53 @@
+import gzip
+import json
+from datetime import datetime
+
+import pytest
+
+from src.debug_writer import DebugWriter, convert_to_legacy, read_debug_entries
+
+ENTRIES = [
+    {"question_id": "Q1", "is_correct": True, "execution_time": 1.5},
+    {"question_id": "Q2", "error": "타임아웃", "status": "failed"},
+]
+
+
+@pytest.mark.parametrize("compression", [None, "gzip"])
+def test_writer_streams_compact_jsonl(tmp_path, compression):
+    with DebugWriter.for_exam(tmp_path, "exam", compression) as writer:
+        for entry in ENTRIES:
+            writer.write(entry)
+
+    assert writer.entries_written == 2
+    assert list(read_debug_entries(writer.path)) == ENTRIES
+
+
+def test_writer_serializes_datetime(tmp_path):
+    with DebugWriter(tmp_path / "d.jsonl") as writer:
+        writer.write({"time": datetime(2024, 1, 1, 9, 30)})
+
+    line = (tmp_path / "d.jsonl").read_text(encoding="utf-8").strip()
+    assert json.loads(line) == {"time": "2024-01-01T09:30:00"}
+
+
+def test_convert_to_legacy_matches_json_dump(tmp_path):
+    with DebugWriter(tmp_path / "exam_debug.jsonl.gz", "gzip") as writer:
+        for entry in ENTRIES:
+            writer.write(entry)
+
+    legacy_path = convert_to_legacy(writer.path)
+    assert legacy_path.name == "exam_debug.json"
+    assert legacy_path.read_text(encoding="utf-8") == json.dumps(
+        ENTRIES, indent=2, ensure_ascii=False
+    )
+
+
+def test_read_tolerates_truncated_file(tmp_path):
+    path = tmp_path / "crash.jsonl.gz"
+    with gzip.open(path, "wb") as f:
+        f.write(b'{"question_id":"Q1"}\n{"question_id":"Q2"}\n')
+    data = path.read_bytes()
+    path.write_bytes(data[:-10])  # gzip trailer 손상
+
+    entries = list(read_debug_entries(path))
+    assert entries[0] == {"question_id": "Q1"}
@@ -0,0 +1,193 @@
+import json
+from unittest.mock import MagicMock
+
+from src.config import settings
+from src.data_loader import DataLoader
+from src.dedup import (
+    DuplicateIndex,
+    embed_question,
+    question_hash,
+    remap_answer,
+    stem_polarity,
+)
+from src.models import Question
+from src.openai_client import OpenAIClient
+from src.processor import Processor
+
+OPTIONS = [
+    "① 재고자산은 순실현가능가치로 측정한다.",
+    "② 유형자산은 원가모형만 적용한다.",
+    "③ 무형자산은 상각하지 않는다.",
+    "④ 투자부동산은 공정가치모형만 적용한다.",
+    "⑤ 리스부채는 할인하지 않는다.",
+]
+
+
+def _question(question_id: str, text: str, options=OPTIONS, answer="1") -> Question:
+    return Question(
+        id=question_id, question=text, options=options, correct_answer=answer
+    )
+
+
+def test_hash_ignores_spacing_and_option_markers():
+    first = _question("2022_1", "다음 중 옳은 것은?")
+    second = _question(
+        "2023_1",
+        "다음 중  옳은 것은 ?",
+        options=[option[2:] for option in OPTIONS],
+    )
+    assert question_hash(first) == question_hash(second)
+
+
+def test_near_duplicate_similarity():
+    first = _question("2022_1", "20X1년 재무제표에 관한 다음 설명 중 옳은 것은?")
+    reworded = _question("2023_1", "20X2년 재무제표에 관한 다음 설명 중 옳은 것은?")
+    other = _question(
+        "2023_2",
+        "법인세 회계처리에 대한 설명으로 틀린 것은?",
+        options=["1", "2", "3", "4", "5"],
+    )
+    assert float(embed_question(first) @ embed_question(reworded)) > 0.9
+    assert float(embed_question(first) @ embed_question(other)) < 0.5
+
+
+def test_remap_answer_for_reordered_options():
+    reordered = [OPTIONS[2], OPTIONS[0], OPTIONS[1], OPTIONS[3], OPTIONS[4]]
+    assert remap_answer("1", OPTIONS, reordered) == "2"
+    assert remap_answer("1", OPTIONS, OPTIONS[:4] + ["⑤ 다른 보기"]) is None
+
+
+def test_reuses_validated_answer_only_when_options_match(tmp_path):
+    index = DuplicateIndex(threshold=0.9)
+    source = _question("2022_1", "20X1년 재무제표에 관한 다음 설명 중 옳은 것은?")
+    index.add(source, "2022")
+
+    debug_file = tmp_path / "2022_debug.jsonl"
+    debug_file.write_text(
+        json.dumps(
+            {
+                "question_id": "2022_1",
+                "gpt_response": {"selected_answer": "1", "reasoning": ["a"] * 5},
+                "is_correct": True,
+            }
+        )
+        + "\n",
+        encoding="utf-8",
+    )
+    assert index.load_answers([debug_file]) == 1
+
+    target = _question("2023_1", "20X2년 재무제표에 관한 다음 설명 중 옳은 것은?")
+    selected, reasoning, match = index.reusable_answer(target)
+    assert selected == "1"
+    assert match.question_id == "2022_1" and not match.exact
+
+    changed = _question(
+        "2023_2", target.question, options=OPTIONS[:4] + ["⑤ 리스부채는 할인한다."]
+    )
+    assert index.reusable_answer(changed) is None
+    # 같은 시험끼리는 매칭하지 않음
+    assert index.reusable_answer(source, "2022") is None
+
+    report = index.report()
+    assert report["reused"] == 1
+    assert report["lookups"] == 3
+
+
+def test_reversed_question_does_not_reuse_answer():
+    """보기는 같고 "옳은 것은?"/"옳지 않은 것은?"만 다른 문제는 답이 반대"""
+    index = DuplicateIndex(threshold=0.9)
+    source = _question("Q1", "재무제표 표시에 관한 설명으로 옳은 것은?")
+    index.add(source, "2022_1형")
+    index.record_answer("2022_1형", "Q1", "1", ["a"] * 5)
+
+    for text in [
+        "재무제표 표시에 관한 설명으로 옳지 않은 것은?",
+        "재무제표 표시에 관한 설명으로 적절하지 않은 것은?",
+        "재무제표 표시에 관한 설명으로 옳은 것이 아닌 것은?",
+    ]:
+        reversed_question = _question("Q1", text)
+        assert float(embed_question(source) @ embed_question(reversed_question)) > 0.9
+        assert stem_polarity(text) != stem_polarity(source.question)
+        assert index.reusable_answer(reversed_question, "2023_1형") is None
+        # 유사 중복으로는 계속 보고됨
+        assert index.find(reversed_question, "2023_1형").question_id == "Q1"
+
+    same_direction = _question("Q1", "재무제표의 표시에 관한 설명으로 옳은 것은?")
+    assert index.reusable_answer(same_direction, "2023_1형")[0] == "1"
+
+
+def test_inconsistent_answer_keys_across_years():
+    index = DuplicateIndex(threshold=0.9)
+    index.add(_question("2022_1", "다음 중 옳은 것은?", answer="1"), "2022")
+    index.add(_question("2023_1", "다음 중 옳은 것은?", answer="2"), "2023")
+    index.add(_question("2023_2", "다음 중 옳은 것은?", answer="1"), "2023")
+    assert {(a, b) for a, b, _ in index.inconsistent_pairs()} == {
+        ("2022/2022_1", "2023/2023_1"),
+    }
+
+
+def test_realistic_ids_repeat_across_exams(tmp_path):
+    """실제 데이터처럼 시험마다 Q1, Q2 ...가 반복되는 경우"""
+    index = DuplicateIndex(threshold=0.9)
+    reordered = [OPTIONS[1], OPTIONS[0], OPTIONS[2], OPTIONS[3], OPTIONS[4]]
+    index.add(_question("Q1", "다음 중 옳은 것은?"), "2022_1형")
+    index.add(_question("Q1", "다음 중 옳은 것은?", options=reordered), "2023_1형")
+    index.add(_question("Q2", "다음 중 옳은 것은?"), "2023_1형")
+
+    # 다른 시험의 같은 id가 가장 흔한 중복이고, 같은 시험 안의 문제는 후보가 아님
+    match = index.find(
+        _question("Q1", "다음 중 옳은 것은?", options=reordered), "2023_1형"
+    )
+    assert (match.exam_name, match.question_id) == ("2022_1형", "Q1")
+
+    # 시험마다 같은 id의 답이 따로 저장되어 서로 덮어쓰지 않음
+    debug_file = tmp_path / "2023_1형_1-20_debug.jsonl"
+    debug_file.write_text(
+        json.dumps(
+            {
+                "question_id": "Q1",
+                "gpt_response": {"selected_answer": "1", "reasoning": ["2023"] * 5},
+                "is_correct": True,
+            }
+        )
+        + "\n",
+        encoding="utf-8",
+    )
+    index.load_answers([debug_file])
+    index.record_answer("2022_1형", "Q1", "1", ["2022"] * 5)
+    assert set(index._answers) == {("2023_1형", "Q1"), ("2022_1형", "Q1")}
+
+    # 2024년의 Q1은 2022년 Q1의 답(보기 순서 그대로)을 받아야 함
+    selected, reasoning, match = index.reusable_answer(
+        _question("Q1", "다음 중 옳은 것은?"), "2024_1형"
+    )
+    assert (match.exam_name, selected, reasoning[0]) == ("2022_1형", "1", "2022")
+
+
+def test_processor_skips_api_call_for_reused_answer(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "output_dir", tmp_path)
+    index = DuplicateIndex(threshold=0.9)
+    index.add(_question("2022_1", "다음 중 옳은 것은?"), "2022")
+    index.record_answer("2022", "2022_1", "1", ["a"] * 5)
+
+    data_loader = MagicMock(spec=DataLoader)
+    data_loader.load_questions.return_value = [
+        _question("2023_1", "다음 중 옳은 것은?"),
+        _question(
+            "2023_2",
+            "법인세에 관한 설명으로 틀린 것은?",
+            options=["1", "2", "3", "4", "5"],
+        ),
+    ]
+    openai_client = MagicMock(spec=OpenAIClient)
+    openai_client.get_response.return_value = MagicMock(
+        selected_answer="1", reasoning=["b"] * 5, cascade=None
+    )
+
+    processor = Processor(data_loader, openai_client, dedup_index=index)
+    result = processor.process_exam("2023")
+
+    assert openai_client.get_response.call_count == 1
+    assert result.correct_answers == 2
+    # 새로 맞힌 답도 이후 재사용 후보가 됨
+    assert ("2023", "2023_2") in index._answers
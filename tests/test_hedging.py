@@ -0,0 +1,108 @@
+import random
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from src.config import settings
+from src.hedging import Hedger, StreamingQuantile
+
+
+@pytest.mark.parametrize("quantile", [0.5, 0.9, 0.99])
+def test_streaming_quantile_tracks_percentile(quantile):
+    rng = random.Random(0)
+    values = [rng.lognormvariate(0, 0.5) for _ in range(20000)]
+    estimator = StreamingQuantile(quantile)
+    for value in values:
+        estimator.add(value)
+
+    expected = np.percentile(values, quantile * 100)
+    assert estimator.value() == pytest.approx(expected, rel=0.05)
+
+
+def test_streaming_quantile_with_few_samples():
+    estimator = StreamingQuantile(0.5)
+    assert estimator.value() is None
+    for value in [3.0, 1.0, 2.0]:
+        estimator.add(value)
+    assert estimator.value() == 2.0
+
+
+def _warm_up(hedger: Hedger, latency: float = 0.01):
+    for _ in range(hedger.min_samples):
+        hedger.call(time.sleep, latency)
+
+
+def test_slow_call_is_hedged_and_fastest_result_wins():
+    hedger = Hedger(quantile=0.9, max_hedge_ratio=1.0, min_samples=10)
+    _warm_up(hedger)
+
+    calls = []
+    lock = threading.Lock()
+
+    def call():
+        with lock:
+            calls.append(len(calls))
+            attempt = calls[-1]
+        # 첫 요청은 매우 느리고, hedge 요청은 빠름
+        time.sleep(2.0 if attempt == 0 else 0.01)
+        return attempt
+
+    start = time.perf_counter()
+    assert hedger.call(call) == 1
+    assert time.perf_counter() - start < 1.0
+    assert hedger.stats()["hedges"] == 1
+    assert hedger.stats()["hedge_wins"] == 1
+    hedger.shutdown()
+
+
+def test_hedges_are_capped_by_ratio():
+    hedger = Hedger(quantile=0.5, max_hedge_ratio=0.0, min_samples=5)
+    _warm_up(hedger)
+
+    assert hedger.call(lambda: time.sleep(0.1) or "slow") == "slow"
+    assert hedger.stats()["hedges"] == 0
+    hedger.shutdown()
+
+
+def test_failed_primary_falls_back_to_hedge():
+    hedger = Hedger(quantile=0.5, max_hedge_ratio=1.0, min_samples=5)
+    _warm_up(hedger)
+    attempts = iter(range(2))
+
+    def call():
+        attempt = next(attempts)
+        if attempt == 0:
+            time.sleep(0.2)
+            raise RuntimeError("primary failed")
+        time.sleep(0.3)
+        return "hedge"
+
+    assert hedger.call(call) == "hedge"
+    hedger.shutdown()
+
+
+def test_pool_is_sized_for_concurrent_callers(monkeypatch):
+    monkeypatch.setattr(settings, "max_concurrency", 24)
+    hedger = Hedger()
+    # 호출 스레드마다 primary + hedge
+    assert hedger._executor._max_workers == 48
+    hedger.shutdown()
+
+
+def test_queue_wait_is_not_counted_as_latency():
+    hedger = Hedger(quantile=0.99, max_hedge_ratio=0.0, min_samples=5, max_workers=1)
+    _warm_up(hedger, latency=0.2)
+
+    threads = [
+        threading.Thread(target=hedger.call, args=(time.sleep, 0.2)) for _ in range(3)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # 워커 하나에서 차례로 실행되어 최대 0.4초를 기다렸지만, 호출 시간은 0.2초
+    assert max(hedger._latency._heights) < 0.35
+    hedger.shutdown()
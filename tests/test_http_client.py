@@ -0,0 +1,69 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from openai import OpenAI
+
+from src.http_client import ConnectionStats, build_http_client
+
+
+class _CompletionHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("content-length", 0)))
+        body = json.dumps(
+            {
+                "id": "test",
+                "object": "chat.completion",
+                "created": 0,
+                "model": "test",
+                "choices": [
+                    {
+                        "index": 0,
+                        "finish_reason": "stop",
+                        "message": {"role": "assistant", "content": "ok"},
+                    }
+                ],
+            }
+        ).encode()
+        self.send_response(200)
+        self.send_header("content-type", "application/json")
+        self.send_header("content-length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def base_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _CompletionHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/v1"
+    server.shutdown()
+    server.server_close()
+
+
+def test_keepalive_connections_are_reused(base_url):
+    stats = ConnectionStats()
+    client = OpenAI(
+        api_key="test-key",
+        base_url=base_url,
+        http_client=build_http_client(stats, max_connections=1),
+    )
+
+    for _ in range(5):
+        client.chat.completions.create(
+            model="test", messages=[{"role": "user", "content": "hi"}]
+        )
+    client.close()
+
+    snapshot = stats.snapshot()
+    assert snapshot["requests"] == 5
+    assert snapshot["new_connections"] == 1
+    assert snapshot["reused_connections"] == 4
+    assert snapshot["reuse_ratio"] == pytest.approx(0.8)
@@ -0,0 +1,96 @@
+import logging
+import queue
+
+from src.logging_config import (
+    PayloadSamplingFilter,
+    _PayloadQueueHandler,
+    get_payload_logger,
+    truncate_record,
+)
+
+
+def _record(name: str, msg: str = "payload") -> logging.LogRecord:
+    return logging.LogRecord(name, logging.DEBUG, __file__, 1, msg, None, None)
+
+
+def test_sampling_filter_rate_limits_per_logger():
+    """초당 허용량을 넘으면 sample_every번째 레코드만 통과"""
+    sampler = PayloadSamplingFilter(rate_limit=2, sample_every=5)
+    allowed = [sampler.filter(_record("a.payload")) for _ in range(10)]
+
+    assert allowed[:2] == [True, True]
+    assert sum(allowed) == 2 + 2  # 5번째, 10번째
+    # 다른 로거는 별도 한도를 가짐
+    assert sampler.filter(_record("b.payload"))
+
+
+def test_sampling_decision_is_shared_across_handlers():
+    """같은 레코드는 여러 핸들러를 거쳐도 한 번만 판정"""
+    sampler = PayloadSamplingFilter(rate_limit=1, sample_every=0)
+    record = _record("a.payload")
+
+    assert sampler.filter(record)
+    assert sampler.filter(record)
+    assert not sampler.filter(_record("a.payload"))
+
+
+def test_truncate_record_keeps_original():
+    record = _record("a.payload", "x" * 50)
+    truncated = truncate_record(record, 10)
+
+    assert truncated.getMessage().startswith("x" * 10 + "...")
+    assert "50 chars" in truncated.getMessage()
+    assert record.getMessage() == "x" * 50
+    assert truncate_record(record, 100) is record
+
+
+class _CountingArg:
+    """포맷될 때마다 횟수를 세는 로그 인자"""
+
+    def __init__(self):
+        self.formatted = 0
+
+    def __str__(self):
+        self.formatted += 1
+        return "y" * 50
+
+
+def test_queue_handler_drops_payloads_before_formatting():
+    log_queue = queue.SimpleQueue()
+    handler = _PayloadQueueHandler(
+        log_queue, PayloadSamplingFilter(rate_limit=1, sample_every=0), max_chars=10
+    )
+    args = [_CountingArg() for _ in range(3)]
+    for arg in args:
+        handler.handle(
+            logging.LogRecord(
+                "a.payload", logging.DEBUG, __file__, 1, "%s", (arg,), None
+            )
+        )
+    handler.handle(_record("a", "일반 로그"))
+
+    assert log_queue.qsize() == 2
+    # 샘플링에서 버려진 레코드는 포맷되지 않음
+    assert [arg.formatted for arg in args] == [1, 0, 0]
+    # 통과한 payload는 잘린 채로 큐에 들어감
+    assert "50 chars truncated" in log_queue.get().getMessage()
+
+
+def test_queue_handler_keeps_all_payloads_for_trace():
+    log_queue = queue.SimpleQueue()
+    handler = _PayloadQueueHandler(
+        log_queue,
+        PayloadSamplingFilter(rate_limit=1, sample_every=0),
+        max_chars=10,
+        keep_all=True,
+    )
+    for _ in range(3):
+        handler.handle(_record("a.payload", "x" * 50))
+
+    records = [log_queue.get() for _ in range(3)]
+    assert [record.payload_sampled for record in records] == [True, False, False]
+    assert records[0].getMessage() == "x" * 50
+
+
+def test_payload_logger_name():
+    assert get_payload_logger("src.openai_client").name == "src.openai_client.payload"
@@ -0,0 +1,91 @@
+import json
+import tracemalloc
+from unittest.mock import MagicMock
+
+import pytest
+
+from src import memory_profiler
+from src.config import settings
+from src.data_loader import DataLoader
+from src.memory_profiler import MemoryProfiler
+from src.models import Question
+from src.openai_client import OpenAIClient
+from src.processor import Processor
+
+
+@pytest.fixture(autouse=True)
+def stop_tracemalloc():
+    yield
+    tracemalloc.stop()
+
+
+def test_disabled_profiler_returns_shared_null_stage():
+    profiler = MemoryProfiler(enabled=False)
+    assert profiler.stage("load") is profiler.stage("process")
+    with profiler.stage("load"):
+        pass
+    assert profiler.records == []
+
+
+def test_stage_attributes_growth_to_allocation_site(tmp_path):
+    profiler = MemoryProfiler(enabled=True, top_n=5)
+    kept = []
+    with profiler.stage("process", exam="2023_1형"):
+        with profiler.stage("load"):
+            kept.append([str(i) * 10 for i in range(50_000)])
+        with profiler.stage("visualize"):
+            pass
+
+    load, visualize, process = profiler.records
+    assert [load["stage"], visualize["stage"], process["stage"]] == [
+        "load",
+        "visualize",
+        "process",
+    ]
+    assert process["exam"] == "2023_1형"
+    assert load["traced_growth_mb"] > 2
+    assert "test_memory_profiler.py" in load["top_allocations"][0]["location"]
+    # 바깥 단계의 peak는 안쪽 단계의 peak를 포함
+    assert process["traced_peak_mb"] >= load["traced_peak_mb"]
+    if load["peak_rss_mb"] is not None:
+        assert process["peak_rss_mb"] >= load["peak_rss_mb"]
+
+    path = profiler.write_summary(tmp_path / "memory_profile.json")
+    summary = json.loads(path.read_text(encoding="utf-8"))
+    assert summary["by_stage"]["load"]["count"] == 1
+    assert len(summary["stages"]) == 3
+
+
+def test_rss_only_mode_skips_tracemalloc():
+    profiler = MemoryProfiler(enabled=True, top_n=0)
+    with profiler.stage("save"):
+        pass
+    (record,) = profiler.records
+    assert "top_allocations" not in record
+    assert set(record) >= {"rss_before_mb", "rss_after_mb", "peak_rss_mb"}
+
+
+def test_processor_records_load_and_process_stages(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "output_dir", tmp_path)
+    profiler = MemoryProfiler(enabled=True, top_n=0)
+    monkeypatch.setattr(memory_profiler, "profiler", profiler)
+
+    data_loader = MagicMock(spec=DataLoader)
+    data_loader.load_questions.return_value = [
+        Question(
+            id="Q1",
+            question="질문",
+            options=["1", "2", "3", "4", "5"],
+            correct_answer="1",
+        )
+    ]
+    openai_client = MagicMock(spec=OpenAIClient)
+    openai_client.get_response.return_value = MagicMock(
+        selected_answer="1", reasoning=["a"] * 5, cascade=None
+    )
+    Processor(data_loader, openai_client).process_exam("2023_1형")
+
+    assert [(r["stage"], r["exam"]) for r in profiler.records] == [
+        ("load", "2023_1형"),
+        ("process", "2023_1형"),
+    ]
@@ -0,0 +1,247 @@
+import json
+import threading
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import MagicMock, Mock
+
+import pytest
+from openai import OpenAI
+from openai.types import CompletionUsage
+
+from src.config import settings
+from src.data_loader import DataLoader
+from src.http_client import ConnectionStats, build_http_client
+from src.metrics import MetricsExporter, MetricsRegistry, metrics
+from src.models import Question
+from src.openai_client import OpenAIClient
+from src.processor import Processor
+
+
+@pytest.fixture
+def live_metrics(monkeypatch):
+    """모듈 전역 registry를 켜고 테스트마다 비움"""
+    monkeypatch.setattr(metrics, "enabled", True)
+    metrics.clear()
+    yield metrics
+    metrics.clear()
+
+
+def test_counters_from_many_threads_are_summed():
+    registry = MetricsRegistry(enabled=True)
+
+    def work():
+        for _ in range(1000):
+            registry.inc("questions_completed_total", exam="2023_1형")
+            registry.observe("question_latency_seconds", 0.3)
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    values, histograms = registry.collect()
+    assert values[("questions_completed_total", (("exam", "2023_1형"),))] == 8000
+    histogram = histograms[("question_latency_seconds", ())]
+    assert histogram[-1] == 8000
+    assert histogram[-2] == pytest.approx(2400)
+
+
+def test_shards_of_finished_threads_are_retired():
+    registry = MetricsRegistry(enabled=True)
+    for _ in range(3):
+        # 시험마다 새 스레드 풀을 만드는 상황
+        with ThreadPoolExecutor(4) as executor:
+            list(executor.map(lambda _: registry.inc("retries_total"), range(20)))
+
+    values, _ = registry.collect()
+    assert values[("retries_total", ())] == 60
+    assert registry._shards == []
+    registry.inc("retries_total")
+    assert len(registry._shards) == 1
+    assert registry.collect()[0][("retries_total", ())] == 61
+
+
+def test_disabled_registry_records_nothing():
+    registry = MetricsRegistry(enabled=False)
+    registry.inc("retries_total")
+    registry.observe("api_request_latency_seconds", 1.0)
+    assert registry.collect() == ({}, {})
+
+
+def test_prometheus_exposition_format():
+    registry = MetricsRegistry(enabled=True, buckets=(0.5, 1.0))
+    registry.inc("questions_completed_total", 4, exam='a"b')
+    registry.inc("questions_correct_total", 3, exam='a"b')
+    registry.inc("api_requests_started_total", 3)
+    registry.inc("api_requests_finished_total", 2)
+    for value in (0.2, 0.7, 3.0):
+        registry.observe("api_request_latency_seconds", value)
+
+    text = registry.prometheus()
+    lines = text.splitlines()
+    assert "# TYPE cpa_eval_questions_completed_total counter" in lines
+    assert 'cpa_eval_questions_completed_total{exam="a\\"b"} 4' in lines
+    assert 'cpa_eval_api_request_latency_seconds_bucket{le="0.5"} 1' in lines
+    assert 'cpa_eval_api_request_latency_seconds_bucket{le="1.0"} 2' in lines
+    assert 'cpa_eval_api_request_latency_seconds_bucket{le="+Inf"} 3' in lines
+    assert "cpa_eval_api_request_latency_seconds_sum 3.9" in lines
+    assert "cpa_eval_api_request_latency_seconds_count 3" in lines
+    assert "cpa_eval_in_flight_requests 1" in lines
+    assert 'cpa_eval_exam_accuracy{exam="a\\"b"} 0.75' in lines
+
+
+def test_snapshot_reports_accuracy_quantiles_and_rates():
+    registry = MetricsRegistry(enabled=True, buckets=(1.0, 2.0, 4.0))
+    registry.inc("questions_completed_total", 2, exam="2023_1형")
+    registry.inc("questions_correct_total", 1, exam="2023_1형")
+    registry.inc("questions_failed_total", exam="2022_1형")
+    registry.inc("tokens_total", 300, kind="prompt")
+    registry.inc("tokens_total", 100, kind="completion")
+    for value in [0.5] * 50 + [3.0] * 50:
+        registry.observe("question_latency_seconds", value)
+
+    snapshot = registry.snapshot()
+    assert snapshot["exams"]["2023_1형"]["accuracy"] == 0.5
+    assert snapshot["exams"]["2022_1형"] == {
+        "completed": 0.0,
+        "correct": 0.0,
+        "failed": 1.0,
+        "accuracy": 0.0,
+    }
+    latency = snapshot["latency"]["question_latency_seconds"]
+    assert latency["p50"] == pytest.approx(1.0)
+    assert 2.0 < latency["p99"] <= 4.0
+    assert snapshot["tokens"] == 400
+    assert snapshot["tokens_per_second"] > 0
+
+
+def test_exporter_serves_endpoints_and_writes_snapshot(tmp_path):
+    registry = MetricsRegistry(enabled=True)
+    registry.inc("retries_total", 2)
+    snapshot_path = tmp_path / "metrics.json"
+    with MetricsExporter(
+        registry, "127.0.0.1", 0, snapshot_path, snapshot_interval=60
+    ) as exporter:
+        host, port = exporter.address
+        with urllib.request.urlopen(f"http://{host}:{port}/metrics") as response:
+            assert response.headers["Content-Type"].startswith("text/plain")
+            assert "cpa_eval_retries_total 2" in response.read().decode()
+        with urllib.request.urlopen(f"http://{host}:{port}/metrics.json") as response:
+            assert json.loads(response.read())["retries"] == 2
+
+    # 종료할 때 마지막 스냅샷을 기록
+    assert json.loads(snapshot_path.read_text(encoding="utf-8"))["retries"] == 2
+
+
+def test_processor_records_per_exam_counters(live_metrics, tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "output_dir", tmp_path)
+    data_loader = MagicMock(spec=DataLoader)
+    data_loader.load_questions.return_value = [
+        Question(
+            id=f"Q{num}",
+            question="질문",
+            options=["1", "2", "3", "4", "5"],
+            correct_answer="1",
+        )
+        for num in range(1, 4)
+    ]
+    openai_client = MagicMock(spec=OpenAIClient)
+    openai_client.get_response.side_effect = [
+        MagicMock(selected_answer="1", reasoning=["a"] * 5, cascade=None),
+        MagicMock(selected_answer="2", reasoning=["a"] * 5, cascade=None),
+        RuntimeError("boom"),
+    ]
+    Processor(data_loader, openai_client, max_concurrency=1).process_exam("2023_1형")
+
+    exam = live_metrics.snapshot()["exams"]["2023_1형"]
+    assert exam == {"completed": 2.0, "correct": 1.0, "failed": 1.0, "accuracy": 0.5}
+    assert live_metrics.snapshot()["latency"]["question_latency_seconds"]["count"] == 2
+
+
+def test_client_records_request_latency_and_tokens(live_metrics):
+    client = OpenAIClient(model_name="gpt-4o", client=OpenAI(api_key="test-key"))
+    response = Mock()
+    response.usage = CompletionUsage(
+        prompt_tokens=120,
+        completion_tokens=30,
+        total_tokens=150,
+        prompt_tokens_details={"cached_tokens": 64},
+    )
+
+    assert client._send(lambda: response) is response
+    with pytest.raises(RuntimeError):
+        client._send(Mock(side_effect=RuntimeError("boom")))
+
+    snapshot = live_metrics.snapshot()
+    assert snapshot["api_requests"] == 2
+    assert snapshot["api_errors"] == 1
+    assert snapshot["in_flight_requests"] == 0
+    assert snapshot["latency"]["api_request_latency_seconds"]["count"] == 2
+    values, _ = live_metrics.collect()
+    assert values[("tokens_total", (("kind", "prompt"),))] == 120
+    assert values[("tokens_total", (("kind", "completion"),))] == 30
+    # 캐시된 토큰은 prompt 토큰의 일부이므로 합계에 두 번 들어가지 않음
+    assert values[("cached_prompt_tokens_total", ())] == 64
+    assert snapshot["tokens"] == 150
+    assert snapshot["cached_prompt_tokens"] == 64
+
+
+class _FlakyHandler(BaseHTTPRequestHandler):
+    """첫 요청은 500, 이후에는 정상 응답"""
+
+    calls = 0
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("content-length", 0)))
+        type(self).calls += 1
+        if type(self).calls == 1:
+            self.send_response(500)
+            self.send_header("content-length", "0")
+            self.end_headers()
+            return
+        body = json.dumps(
+            {
+                "id": "test",
+                "object": "chat.completion",
+                "created": 0,
+                "model": "test",
+                "choices": [
+                    {
+                        "index": 0,
+                        "finish_reason": "stop",
+                        "message": {"role": "assistant", "content": "ok"},
+                    }
+                ],
+            }
+        ).encode()
+        self.send_response(200)
+        self.send_header("content-type", "application/json")
+        self.send_header("content-length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def test_sdk_retries_are_counted(live_metrics):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _FlakyHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        client = OpenAI(
+            api_key="test-key",
+            base_url=f"http://127.0.0.1:{server.server_address[1]}/v1",
+            max_retries=2,
+            http_client=build_http_client(ConnectionStats()),
+        )
+        client.chat.completions.create(
+            model="test", messages=[{"role": "user", "content": "hi"}]
+        )
+        client.close()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert live_metrics.snapshot()["retries"] == 1
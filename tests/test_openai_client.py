@@ -1,7 +1,11 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest.mock import Mock, patch
 
 import pytest
-from openai import APIError  # APIError import 수정
+from openai import APIError, OpenAI  # APIError import 수정
 from openai.types.chat import ChatCompletion
 from openai.types.chat.chat_completion import Choice, ChatCompletionMessage
 
@@ -31,12 +35,14 @@ def mock_openai_response():
 
 @pytest.fixture
 def client():
-    return OpenAIClient(model_name="gpt-4o")
+    return OpenAIClient(model_name="gpt-4o", client=OpenAI(api_key="test-key"))
 
 
 def test_successful_response(client, mock_openai_response):
     """정상적인 API 응답 처리 테스트"""
-    with patch("openai.beta.chat.completions.parse", return_value=mock_openai_response):
+    with patch.object(
+        client.client.beta.chat.completions, "parse", return_value=mock_openai_response
+    ):
         response = client.get_response(
             question="테스트 질문입니다.",
             options=["보기1", "보기2", "보기3", "보기4", "보기5"],
@@ -60,7 +66,9 @@ def test_model_refusal(client):
     mock_completion = Mock(spec=ChatCompletion)
     mock_completion.choices = [mock_choice]
 
-    with patch("openai.beta.chat.completions.parse", return_value=mock_completion):
+    with patch.object(
+        client.client.beta.chat.completions, "parse", return_value=mock_completion
+    ):
         with pytest.raises(ValueError, match="Model refused to answer"):
             client.get_response(
                 question="부적절한 질문",
@@ -81,7 +89,9 @@ def test_length_limit_exceeded(client):
     mock_completion = Mock(spec=ChatCompletion)
     mock_completion.choices = [mock_choice]
 
-    with patch("openai.beta.chat.completions.parse", return_value=mock_completion):
+    with patch.object(
+        client.client.beta.chat.completions, "parse", return_value=mock_completion
+    ):
         with pytest.raises(
             ValueError, match="Response was truncated due to length limit"
         ):
@@ -104,7 +114,9 @@ def test_content_filter(client):
     mock_completion = Mock(spec=ChatCompletion)
     mock_completion.choices = [mock_choice]
 
-    with patch("openai.beta.chat.completions.parse", return_value=mock_completion):
+    with patch.object(
+        client.client.beta.chat.completions, "parse", return_value=mock_completion
+    ):
         with pytest.raises(
             ValueError, match="Response was filtered due to content policy"
         ):
@@ -126,8 +138,9 @@ def test_api_error(client):
         "error": {"message": "API 에러", "type": "api_error", "code": "error_code"}
     }
 
-    with patch(
-        "openai.beta.chat.completions.parse",
+    with patch.object(
+        client.client.beta.chat.completions,
+        "parse",
         side_effect=APIError(message="API 에러", request=mock_request, body=mock_body),
     ):
         with pytest.raises(ValueError, match="Error during OpenAI API call"):
@@ -141,7 +154,9 @@ def test_with_additional_data(client, mock_openai_response):
     """추가 데이터가 있는 경우 테스트"""
     additional_data = {"context": "추가 컨텍스트", "metadata": {"key": "value"}}
 
-    with patch("openai.beta.chat.completions.parse", return_value=mock_openai_response):
+    with patch.object(
+        client.client.beta.chat.completions, "parse", return_value=mock_openai_response
+    ):
         response = client.get_response(
             question="테스트 질문",
             options=["보기1", "보기2", "보기3", "보기4", "보기5"],
@@ -151,3 +166,58 @@ def test_with_additional_data(client, mock_openai_response):
         assert isinstance(response, GPTResponse)
         assert response.selected_answer == "1"
         assert len(response.reasoning) == 5
+
+
+class _StreamingHandler(BaseHTTPRequestHandler):
+    """답 번호까지만 바로 보내고 나머지는 늦게 보내는 SSE 서버"""
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("content-length", 0)))
+        self.send_response(200)
+        self.send_header("content-type", "text/event-stream")
+        self.end_headers()
+        deltas = [('{"selected', 0), ('_answer":"', 0), ('3"', 0), ("}", 3)]
+        for delta, delay in deltas:
+            time.sleep(delay)
+            chunk = {
+                "id": "test",
+                "object": "chat.completion.chunk",
+                "created": 0,
+                "model": "test",
+                "choices": [{"index": 0, "delta": {"content": delta}}],
+            }
+            try:
+                self.wfile.write(f"data: {json.dumps(chunk)}\n\n".encode())
+                self.wfile.flush()
+            except OSError:
+                return
+        self.wfile.write(b"data: [DONE]\n\n")
+
+    def log_message(self, *args):
+        pass
+
+
+def test_answer_only_stream_returns_as_soon_as_answer_is_parsed():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StreamingHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    client = OpenAIClient(
+        model_name="gpt-4o",
+        client=OpenAI(
+            api_key="test-key",
+            base_url=f"http://127.0.0.1:{server.server_address[1]}/v1",
+        ),
+        answer_only=True,
+    )
+
+    start = time.perf_counter()
+    response = client.get_response(
+        question="테스트 질문",
+        options=["보기1", "보기2", "보기3", "보기4", "보기5"],
+    )
+    elapsed = time.perf_counter() - start
+    server.shutdown()
+    server.server_close()
+
+    assert response.selected_answer == "3"
+    assert response.reasoning == []
+    assert elapsed < 2
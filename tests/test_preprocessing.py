@@ -0,0 +1,36 @@
+import random
+
+import pytest
+
+from Retrival.preprocessing import RULES_BY_NAME, StreamingCleaner
+
+# 규칙들이 반응하는 문자 위주로 만든 텍스트 (페이지 바닥글, 하이픈 줄바꿈, 공백, 빈 줄)
+_PIECES = ["- 12 -", "- 3 -", "-", " ", "  ", "\t", "\n", "\n\n\n", "a", "B", "가", "1"]
+
+
+def _random_texts(count: int = 200):
+    rng = random.Random(0)
+    texts = ["", "- 1 -", "account-\ning", "a \t  b", "\n\n\n\n", "x\n \n\t\n\ny"]
+    for _ in range(count):
+        texts.append("".join(rng.choice(_PIECES) for _ in range(rng.randint(0, 40))))
+    return texts
+
+
+@pytest.mark.parametrize("chunk_size", range(1, 8))
+@pytest.mark.parametrize("name", sorted(RULES_BY_NAME))
+def test_streaming_rule_matches_whole_text_sub(name, chunk_size):
+    rule = RULES_BY_NAME[name]
+    cleaner = StreamingCleaner([rule], chunk_size=chunk_size)
+    for text in _random_texts():
+        assert cleaner.clean_text(text) == rule.pattern.sub(rule.expand, text), text
+
+
+@pytest.mark.parametrize("chunk_size", range(1, 8))
+def test_streaming_pipeline_matches_sequential_sub(chunk_size):
+    rules = list(RULES_BY_NAME.values())
+    cleaner = StreamingCleaner(rules, chunk_size=chunk_size)
+    for text in _random_texts():
+        expected = text
+        for rule in rules:
+            expected = rule.pattern.sub(rule.expand, expected)
+        assert cleaner.clean_text(text) == expected, text
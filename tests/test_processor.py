@@ -1,5 +1,9 @@
+import tempfile
+import time
 import unittest
-from unittest.mock import MagicMock
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+from src.config import settings
 from src.processor import Processor
 from src.models import ComparisonResult, Question
 from src.data_loader import DataLoader
@@ -9,6 +13,12 @@ from src.openai_client import OpenAIClient
 class TestProcessor(unittest.TestCase):
     def setUp(self):
         """Setup before each test"""
+        # debug 파일이 실제 output/debug가 아닌 임시 디렉터리에 쓰이도록
+        output_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(output_dir.cleanup)
+        output_patch = patch.object(settings, "output_dir", Path(output_dir.name))
+        output_patch.start()
+        self.addCleanup(output_patch.stop)
         self.mock_data_loader = MagicMock(spec=DataLoader)
         self.mock_openai_client = MagicMock(spec=OpenAIClient)
         self.processor = Processor(self.mock_data_loader, self.mock_openai_client)
@@ -47,6 +57,36 @@ class TestProcessor(unittest.TestCase):
         results = self.processor.process_exam("empty_exam")
         self.assertEqual(results, [])
 
+    def test_process_exam_concurrent_keeps_question_order(self):
+        """Results stay in question order when questions run concurrently"""
+        questions = [
+            Question(
+                id=f"Q{num}",
+                question=f"Question {num}",
+                options=["1", "2", "3", "4", "5"],
+                correct_answer="1",
+            )
+            for num in range(8)
+        ]
+        self.mock_data_loader.load_questions.return_value = questions
+
+        def slow_response(question, options):
+            # 앞 번호일수록 늦게 끝나도록
+            time.sleep(0.01 * (8 - int(question.split()[-1])))
+            return MagicMock(selected_answer="1", reasoning=["r"] * 5)
+
+        self.mock_openai_client.get_response.side_effect = slow_response
+        processor = Processor(
+            self.mock_data_loader, self.mock_openai_client, max_concurrency=4
+        )
+
+        result = processor.process_exam("2023_1형")
+        self.assertEqual(
+            [r.question_id for r in result.questions_results],
+            [q.id for q in questions],
+        )
+        self.assertEqual(result.correct_answers, 8)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,123 @@
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from src.models import ExamResult, QuestionResult
+from src.result_table import ResultTable
+
+
+def _question_result(num: int) -> QuestionResult:
+    start = datetime(2024, 5, 1, 9, 0, 0, 123456) + timedelta(seconds=num)
+    return QuestionResult(
+        question_id=f"Q{num}",
+        start_time=start,
+        end_time=start + timedelta(seconds=1.5),
+        execution_time=0.5 + num,
+        selected_answer=str(num % 5 + 1),
+        is_correct=num % 3 == 0,
+        reasoning=[f"보기 {i} 설명" for i in range(1, 5)] + [f"문제 {num} 고유 설명"],
+    )
+
+
+def _exam_result(name: str, count: int) -> ExamResult:
+    questions_results = [_question_result(num) for num in range(count)]
+    correct = sum(r.is_correct for r in questions_results)
+    return ExamResult(
+        exam_name=name,
+        start_time=questions_results[0].start_time,
+        end_time=questions_results[-1].end_time,
+        execution_time=10.0,
+        questions_results=questions_results,
+        total_questions=count,
+        correct_answers=correct,
+        accuracy=correct / count,
+    )
+
+
+@pytest.mark.parametrize("spill", [False, True])
+def test_rows_round_trip(tmp_path, spill):
+    table = ResultTable(tmp_path / "reasoning.jsonl" if spill else None)
+    exam = _exam_result("2023_1형", 7)
+    table.add_exam(exam)
+
+    assert len(table) == 7
+    assert list(table) == exam.questions_results
+    assert list(table.exam_view("2023_1형")) == exam.questions_results
+    assert len(table.exam_view("missing")) == 0
+
+
+def test_compact_exam_result_is_a_view(tmp_path):
+    table = ResultTable()
+    table.compact(_exam_result("a", 3))
+    compacted = table.compact(_exam_result("b", 4))
+
+    assert compacted.exam_name == "b"
+    assert len(compacted.questions_results) == 4
+    assert compacted.questions_results[0] == _question_result(0)
+    assert [r.question_id for r in compacted.questions_results[1:3]] == ["Q1", "Q2"]
+
+
+def test_summary_matches_exam_results():
+    table = ResultTable()
+    exams = [_exam_result("a", 10), _exam_result("b", 3)]
+    for exam in exams:
+        table.add_exam(exam)
+
+    summary = table.summary().set_index("Exam Name")
+    for exam in exams:
+        times = [r.execution_time for r in exam.questions_results]
+        row = summary.loc[exam.exam_name]
+        assert row["Total Questions"] == exam.total_questions
+        assert row["Correct Answers"] == exam.correct_answers
+        assert row["Accuracy"] == pytest.approx(exam.accuracy)
+        assert row["Average Time per Question (s)"] == pytest.approx(np.mean(times))
+        assert row["p50 Time (s)"] == sorted(times)[(len(times) - 1) // 2]
+
+
+def test_summary_counts_failed_questions(tmp_path):
+    """실패한 문제는 행이 없지만 문제 수와 정확도에는 포함되어야 함"""
+    exam = _exam_result("a", 6)
+    exam.questions_results = exam.questions_results[:4]
+    exam.total_questions = 6
+    exam.accuracy = exam.correct_answers / 6
+    table = ResultTable()
+    table.add_exam(exam)
+
+    row = table.summary().set_index("Exam Name").loc["a"]
+    assert row["Total Questions"] == 6
+    assert row["Accuracy"] == pytest.approx(exam.accuracy)
+    assert row["Average Time per Question (s)"] == pytest.approx(2.0)
+
+    table.save(tmp_path / "results.npz")
+    loaded = ResultTable.load(tmp_path / "results.npz")
+    assert loaded.summary()["Total Questions"].tolist() == [6]
+
+
+def test_spilled_reasoning_reuses_one_file_handle(tmp_path, monkeypatch):
+    table = ResultTable(tmp_path / "reasoning.jsonl")
+    table.add_exam(_exam_result("a", 5))
+    opened = []
+    original_open = Path.open
+
+    def counting_open(self, mode="r", *args, **kwargs):
+        opened.append(mode)
+        return original_open(self, mode, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "open", counting_open)
+    assert list(table) == _exam_result("a", 5).questions_results
+    assert opened == ["rb"]
+    table.close()
+
+
+def test_save_and_load(tmp_path):
+    table = ResultTable(tmp_path / "reasoning.jsonl")
+    table.add_exam(_exam_result("a", 5))
+    table.save(tmp_path / "results.npz")
+    table.close()
+
+    loaded = ResultTable.load(tmp_path / "results.npz")
+    assert list(loaded) == _exam_result("a", 5).questions_results
+    assert loaded.to_frame()["exam"].tolist() == ["a"] * 5
+    loaded.close()
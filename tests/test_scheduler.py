@@ -0,0 +1,139 @@
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.data_loader import DataLoader
+from src.models import Question
+from src.openai_client import OpenAIClient
+from src.processor import Processor
+from src.scheduler import (
+    ExamJob,
+    LatencyModel,
+    QuestionScheduler,
+    prompt_tokens,
+    question_key,
+)
+
+
+def _question(question_id: str, length: int) -> Question:
+    return Question(
+        id=question_id,
+        question="가" * length,
+        options=["1", "2", "3", "4", "5"],
+        correct_answer="1",
+    )
+
+
+def test_latency_model_fits_prompt_length():
+    model = LatencyModel()
+    for tokens, seconds in [(100, 1.0), (200, 2.0), (300, 3.0)]:
+        model.observe(f"seen-{tokens}", tokens, seconds)
+
+    assert model._predict_tokens(400) == pytest.approx(4.0)
+    # 같은 문제의 과거 시간이 있으면 그 값을 우선
+    model.observe(question_key(_question("Q1", 10)), 100, 9.0)
+    assert model.predict(_question("Q1", 10)) == pytest.approx(9.0)
+
+
+def test_history_does_not_leak_between_exams_with_same_ids():
+    """시험마다 반복되는 Q1 id가 다른 시험의 처리 시간을 물려받지 않아야 함"""
+    model = LatencyModel()
+    model.observe_question(_question("Q1", 10), 1.01)
+    model.observe_question(_question("Q2", 20), 1.02)
+    jobs = [
+        ExamJob("a", [_question("Q1", 10), _question("Q2", 20)]),
+        ExamJob("b", [_question("Q1", 3000), _question("Q2", 20)]),
+    ]
+    plan = QuestionScheduler(model).plan(jobs)
+    first = jobs[plan[0].job_index].questions[plan[0].question_index]
+    assert (jobs[plan[0].job_index].exam_name, len(first.question)) == ("b", 3000)
+
+
+def test_load_history_matches_runtime_keys_and_tokens(tmp_path):
+    question = Question(
+        id="Q1",
+        question="다음 자료를 이용하여 계산하시오.",
+        options=["1", "2", "3", "4", "5"],
+        correct_answer="1",
+        data={"table": [["계정", "금액"], ["매출액", 1000]]},
+    )
+    debug_file = tmp_path / "2023_1형_debug.jsonl"
+    debug_file.write_text(
+        json.dumps(
+            {
+                "question_id": "Q1",
+                "question_text": question.question,
+                "options": question.options,
+                "data": question.data,
+                "execution_time": 7.5,
+            },
+            ensure_ascii=False,
+        )
+        + "\n",
+        encoding="utf-8",
+    )
+    model = LatencyModel()
+    assert model.load_history([debug_file]) == 1
+    assert model.predict(question) == pytest.approx(7.5)
+    assert model._sums[1] == prompt_tokens(question)
+
+
+def test_order_sends_longest_questions_first():
+    questions = [_question("short", 10), _question("long", 2000), _question("mid", 300)]
+    order = QuestionScheduler().order(questions)
+    assert [questions[i].id for i in order] == ["long", "mid", "short"]
+
+
+def test_plan_respects_priority_then_deadline():
+    jobs = [
+        ExamJob("low", [_question("low-long", 2000)], priority=0),
+        ExamJob("late", [_question("late", 10)], priority=1, deadline=100),
+        ExamJob("soon", [_question("soon", 10)], priority=1, deadline=10),
+    ]
+    plan = QuestionScheduler().plan(jobs)
+    assert [jobs[d.job_index].exam_name for d in plan] == ["soon", "late", "low"]
+
+
+def test_longest_first_shortens_makespan():
+    model = LatencyModel()
+    durations = [1, 1, 1, 1, 1, 1, 6]
+    questions = [_question(f"Q{i}", 10 + i) for i in range(len(durations))]
+    for question, seconds in zip(questions, durations):
+        model.observe(question_key(question), 10, seconds)
+    scheduler = QuestionScheduler(model)
+
+    file_order = sorted(
+        scheduler.plan([ExamJob("exam", questions)]), key=lambda d: d.question_index
+    )
+    makespan_file_order, _ = scheduler.estimate_completion(file_order, slots=2)
+    makespan_lpt, _ = scheduler.estimate_completion(
+        scheduler.plan([ExamJob("exam", questions)]), slots=2
+    )
+    assert makespan_file_order == 9
+    assert makespan_lpt == 6
+
+
+def test_process_exams_returns_results_in_question_order(tmp_path):
+    openai_client = MagicMock(spec=OpenAIClient)
+    openai_client.get_response.return_value = MagicMock(
+        selected_answer="1", reasoning=["r"] * 5
+    )
+    processor = Processor(
+        MagicMock(spec=DataLoader),
+        openai_client,
+        max_concurrency=3,
+        scheduler=QuestionScheduler(),
+    )
+    processor.debug_dir = tmp_path
+    jobs = [
+        ExamJob("a", [_question(f"a{i}", 10 * i) for i in range(5)]),
+        ExamJob("b", [_question(f"b{i}", 10 * i) for i in range(3)], priority=1),
+    ]
+
+    results = processor.process_exams(jobs)
+    assert [r.exam_name for r in results] == ["a", "b"]
+    assert [q.question_id for q in results[0].questions_results] == [
+        f"a{i}" for i in range(5)
+    ]
+    assert results[1].correct_answers == 3
@@ -0,0 +1,66 @@
+import importlib
+import json
+import sys
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from src import serialization
+from src.models import Question
+
+
+def _question(number: int) -> dict:
+    return {
+        "id": f"exam_{number}",
+        "question": f"{number}번 문제의 옳은 설명은?",
+        "options": ["가", "나", "다", "라", "마"],
+        "correct_answer": "1",
+    }
+
+
+def test_dumps_handles_datetime_models_and_numpy():
+    question = Question(**_question(1))
+    data = serialization.loads(
+        serialization.dumps(
+            {
+                "timestamp": datetime(2024, 1, 1, 9, 30),
+                "question": question,
+                "scores": np.array([1, 2]),
+            }
+        )
+    )
+    assert data["timestamp"] == "2024-01-01T09:30:00"
+    assert data["question"] == question.model_dump(mode="json")
+    assert data["scores"] == [1, 2]
+
+
+def test_load_question_list(tmp_path):
+    path = tmp_path / "questions.json"
+    path.write_text(
+        json.dumps([_question(n) for n in range(1, 4)], ensure_ascii=False),
+        encoding="utf-8",
+    )
+    questions = serialization.load_question_list(path)
+    assert [question.id for question in questions] == ["exam_1", "exam_2", "exam_3"]
+
+
+def test_stdlib_fallback_matches_orjson(monkeypatch, tmp_path):
+    entry = {"timestamp": datetime(2024, 1, 1), "text": "한국어", 1: "키"}
+    expected = serialization.loads(serialization.dumps(entry))
+
+    monkeypatch.setitem(sys.modules, "orjson", None)
+    fallback = importlib.reload(serialization)
+    try:
+        assert fallback.orjson is None
+        assert fallback.loads(fallback.dumps(entry)) == expected
+        assert fallback.dumps_line(entry).endswith(b"\n")
+
+        path = tmp_path / "question.json"
+        path.write_text(json.dumps(_question(2), ensure_ascii=False), encoding="utf-8")
+        assert fallback.load_question(path).id == "exam_2"
+        with pytest.raises(ValueError):
+            fallback.loads(b"{broken")
+    finally:
+        monkeypatch.undo()
+        importlib.reload(serialization)
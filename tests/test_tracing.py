@@ -0,0 +1,42 @@
+import json
+import time
+
+from src.tracing import Tracer
+
+
+def test_disabled_tracer_records_nothing():
+    tracer = Tracer(enabled=False)
+    with tracer.span("noop") as s:
+        s.set(result="ignored")
+    assert tracer.events() == []
+
+
+def test_nested_spans_export_chrome_trace(tmp_path):
+    tracer = Tracer(enabled=True)
+    with tracer.span("question", question_id="Q1"):
+        with tracer.span("api_call"):
+            time.sleep(0.001)
+
+    events = {event["name"]: event for event in tracer.events()}
+    outer, inner = events["question"], events["api_call"]
+    assert outer["ph"] == "X" and inner["ph"] == "X"
+    assert outer["args"] == {"question_id": "Q1"}
+    # 안쪽 span이 바깥 span의 시간 구간 안에 포함되어야 함
+    assert outer["ts"] <= inner["ts"]
+    assert inner["ts"] + inner["dur"] <= outer["ts"] + outer["dur"]
+
+    path = tracer.export_chrome_trace(tmp_path / "trace.json")
+    with path.open(encoding="utf-8") as f:
+        assert len(json.load(f)["traceEvents"]) == 2
+
+
+def test_span_records_error_and_summary():
+    tracer = Tracer(enabled=True)
+    try:
+        with tracer.span("parse_response"):
+            raise ValueError("bad")
+    except ValueError:
+        pass
+
+    assert tracer.events()[0]["args"]["error"] == "ValueError"
+    assert tracer.summary()["parse_response"]["count"] == 1
@@ -0,0 +1,138 @@
+import json
+import os
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.config import settings
+from src.data_loader import DataLoader
+from src.openai_client import OpenAIClient
+from src.processor import Processor
+from src.visualizer import Visualizer
+from src.watcher import DataWatcher, IncrementalEvaluator
+
+
+def _write_question(data_dir, exam, num, answer="1", text=None):
+    path = data_dir / exam / f"{num}.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        json.dumps(
+            {
+                "id": f"{exam}_{num}",
+                "question": text or f"{num}번 문제",
+                "options": ["가", "나", "다", "라", "마"],
+                "correct_answer": answer,
+            },
+            ensure_ascii=False,
+        ),
+        encoding="utf-8",
+    )
+    # settle_time 검사를 통과하도록 수정 시각을 과거로
+    past = time.time() - 10 + num * 0.001
+    os.utime(path, (past, past))
+    return path
+
+
+@pytest.fixture
+def evaluator(tmp_path, monkeypatch):
+    # debug 파일이 실제 output/debug가 아닌 임시 디렉터리에 쓰이도록
+    monkeypatch.setattr(settings, "output_dir", tmp_path / "output")
+    data_dir = tmp_path / "data"
+    for num in range(1, 4):
+        _write_question(data_dir, "2023_1형", num)
+
+    openai_client = MagicMock(spec=OpenAIClient)
+    openai_client.get_response.return_value = MagicMock(
+        selected_answer="1", reasoning=["a"] * 5, cascade=None
+    )
+    processor = Processor(MagicMock(spec=DataLoader), openai_client)
+    visualizer = MagicMock(spec=Visualizer)
+    visualizer.output_dir = tmp_path / "output"
+    return IncrementalEvaluator(
+        processor,
+        DataWatcher(data_dir),
+        visualizer,
+        state_path=tmp_path / "watch_state.json",
+    )
+
+
+def test_single_edit_costs_one_api_call(evaluator):
+    assert evaluator.run_once() == ["2023_1형"]
+    assert evaluator.api_calls == 3
+    assert evaluator.exam_result("2023_1형").accuracy == 1.0
+
+    # 내용이 같은 재저장은 무시
+    _write_question(evaluator.watcher.data_dir, "2023_1형", 1)
+    assert evaluator.run_once() == []
+
+    _write_question(evaluator.watcher.data_dir, "2023_1형", 2, answer="3")
+    assert evaluator.run_once() == ["2023_1형"]
+    assert evaluator.api_calls == 4
+
+    result = evaluator.exam_result("2023_1형")
+    assert [r.question_id for r in result.questions_results] == [
+        "2023_1형_1",
+        "2023_1형_2",
+        "2023_1형_3",
+    ]
+    assert result.correct_answers == 2
+    evaluator.visualizer.generate_corrections_table.assert_called()
+
+
+def test_deleted_file_updates_aggregates(evaluator):
+    evaluator.run_once()
+    (evaluator.watcher.data_dir / "2023_1형" / "3.json").unlink()
+
+    assert evaluator.run_once() == ["2023_1형"]
+    assert evaluator.exam_result("2023_1형").total_questions == 2
+    assert evaluator.api_calls == 3
+
+
+def test_invalid_file_keeps_previous_result_until_fixed(evaluator):
+    evaluator.run_once()
+    path = evaluator.watcher.data_dir / "2023_1형" / "1.json"
+    path.write_text("{broken", encoding="utf-8")
+    os.utime(path, (time.time() - 5, time.time() - 5))
+
+    assert evaluator.run_once() == []
+    assert evaluator.run_once() == []  # 다시 저장될 때까지 재시도하지 않음
+    assert evaluator.exam_result("2023_1형").total_questions == 3
+
+    _write_question(evaluator.watcher.data_dir, "2023_1형", 1, answer="2")
+    assert evaluator.run_once() == ["2023_1형"]
+    assert evaluator.exam_result("2023_1형").correct_answers == 2
+
+
+def test_failing_question_stops_retrying_until_modified(evaluator):
+    evaluator.run_once()
+    evaluator.processor.openai_client.get_response.side_effect = ValueError(
+        "Model refused to answer"
+    )
+    _write_question(evaluator.watcher.data_dir, "2023_1형", 2, answer="3")
+
+    for _ in range(10):
+        assert evaluator.run_once() == []
+    # 처음 3번(max_retries)만 호출하고 이후 scan에서는 API를 호출하지 않음
+    assert evaluator.api_calls == 3 + 3
+    assert evaluator.exam_result("2023_1형").correct_answers == 3
+
+    # 파일이 다시 수정되면 다시 시도
+    evaluator.processor.openai_client.get_response.side_effect = None
+    _write_question(evaluator.watcher.data_dir, "2023_1형", 2, answer="4")
+    assert evaluator.run_once() == ["2023_1형"]
+    assert evaluator.api_calls == 3 + 3 + 1
+
+
+def test_state_survives_restart(evaluator):
+    evaluator.run_once()
+    _write_question(evaluator.watcher.data_dir, "2023_1형", 4)
+
+    restarted = IncrementalEvaluator(
+        evaluator.processor,
+        DataWatcher(evaluator.watcher.data_dir),
+        state_path=evaluator.state_path,
+    )
+    assert restarted.run_once() == ["2023_1형"]
+    assert restarted.api_calls == 1
+    assert restarted.exam_result("2023_1형").total_questions == 4
@@ -0,0 +1,235 @@
+import json
+import multiprocessing
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.config import settings
+from src.data_loader import DataLoader
+from src.models import ExamResult, Question, QuestionResult
+from src.openai_client import OpenAIClient
+from src.processor import ProcessingCancelled, Processor
+from src.work_queue import Coordinator, WorkQueue, Worker
+
+
+class FakeProcessor:
+    """문제 번호가 짝수면 정답으로 처리하는 가짜 Processor"""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.calls = []
+
+    def process_exam(self, exam_name, start_num, end_num, run_label=None, cancel=None):
+        self.calls.append(run_label)
+        if cancel is not None and cancel.wait(self.delay):
+            raise ProcessingCancelled(run_label)
+        if cancel is None:
+            time.sleep(self.delay)
+        now = datetime.now()
+        questions_results = [
+            QuestionResult(
+                question_id=f"{exam_name}_{num}",
+                start_time=now,
+                end_time=now,
+                execution_time=0.0,
+                selected_answer="1",
+                is_correct=num % 2 == 0,
+                reasoning=[],
+            )
+            for num in range(start_num, end_num + 1)
+        ]
+        correct_answers = sum(result.is_correct for result in questions_results)
+        return ExamResult(
+            exam_name=exam_name,
+            start_time=now,
+            end_time=now,
+            execution_time=0.0,
+            questions_results=questions_results,
+            total_questions=len(questions_results),
+            correct_answers=correct_answers,
+            accuracy=correct_answers / len(questions_results),
+        )
+
+
+def _make_data_dir(tmp_path, exams):
+    data_dir = tmp_path / "data"
+    for exam_name, count in exams.items():
+        exam_dir = data_dir / exam_name
+        exam_dir.mkdir(parents=True)
+        for num in range(1, count + 1):
+            (exam_dir / f"{num}.json").write_text(json.dumps({}), encoding="utf-8")
+    return data_dir
+
+
+def _run_worker(db_path, worker_id):
+    work_queue = WorkQueue(db_path, lease_timeout=5)
+    Worker(work_queue, FakeProcessor(delay=0.05), worker_id=worker_id).run()
+
+
+def test_coordinator_shards_and_merges_with_worker_processes(tmp_path):
+    data_dir = _make_data_dir(tmp_path, {"exam_a": 25, "exam_b": 7})
+    work_queue = WorkQueue(tmp_path / "queue.db", lease_timeout=5)
+    coordinator = Coordinator(work_queue, DataLoader(data_dir))
+
+    assert coordinator.submit(shard_size=5) == 5 + 2
+    # 같은 unit을 다시 넣어도 중복되지 않음
+    assert coordinator.submit(shard_size=5) == 0
+
+    workers = [
+        multiprocessing.Process(target=_run_worker, args=(work_queue.db_path, f"w{i}"))
+        for i in range(3)
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join(timeout=30)
+        assert worker.exitcode == 0
+
+    assert coordinator.wait(poll_interval=0.1, timeout=5)
+    results = {result.exam_name: result for result in coordinator.merge_results()}
+
+    assert results["exam_a"].total_questions == 25
+    assert results["exam_a"].correct_answers == 12
+    assert [r.question_id for r in results["exam_a"].questions_results] == [
+        f"exam_a_{num}" for num in range(1, 26)
+    ]
+    assert results["exam_b"].total_questions == 7
+    assert results["exam_b"].correct_answers == 3
+
+
+def test_expired_lease_is_taken_over(tmp_path):
+    work_queue = WorkQueue(tmp_path / "queue.db", lease_timeout=0.2)
+    work_queue.add_units([("exam", 1, 5)])
+
+    stale = work_queue.lease("stale")
+    assert work_queue.lease("other") is None
+
+    time.sleep(0.3)
+    processor = FakeProcessor()
+    assert Worker(work_queue, processor, worker_id="other").run() == 1
+    assert processor.calls == ["exam_1-5"]
+
+    # 만료된 worker의 늦은 결과와 heartbeat는 거부됨
+    assert not work_queue.heartbeat(stale.id, "stale")
+    assert not work_queue.complete(stale.id, "stale", "{}")
+    assert work_queue.counts()["done"] == 1
+
+
+def test_heartbeat_keeps_lease_alive(tmp_path):
+    work_queue = WorkQueue(tmp_path / "queue.db", lease_timeout=0.3)
+    work_queue.add_units([("exam", 1, 5)])
+    worker = Worker(
+        work_queue, FakeProcessor(delay=0.8), worker_id="slow", heartbeat_interval=0.05
+    )
+
+    unit = work_queue.lease("slow")
+    assert worker.process_unit(unit)
+    assert work_queue.counts()["done"] == 1
+
+
+def test_failed_units_are_retried_up_to_max_attempts(tmp_path):
+    work_queue = WorkQueue(tmp_path / "queue.db", max_attempts=2)
+    work_queue.add_units([("exam", 1, 5)])
+
+    for _ in range(2):
+        unit = work_queue.lease("w")
+        assert work_queue.fail(unit.id, "w", "boom")
+
+    assert work_queue.lease("w") is None
+    assert work_queue.counts()["failed"] == 1
+    assert work_queue.is_finished()
+
+
+def test_rerun_does_not_reuse_previous_results(tmp_path):
+    data_dir = _make_data_dir(tmp_path, {"exam": 10})
+    work_queue = WorkQueue(tmp_path / "queue.db")
+    first = Coordinator(work_queue, DataLoader(data_dir))
+    first.submit(shard_size=5)
+    Worker(work_queue, FakeProcessor(), worker_id="w").run()
+    assert first.merge_results()[0].total_questions == 10
+
+    # 같은 DB를 다시 쓰는 새 실행은 이전 실행의 done unit을 재사용하지 않음
+    second = Coordinator(work_queue, DataLoader(data_dir))
+    assert second.submit(shard_size=5) == 2
+    assert second.merge_results() == []
+    assert not work_queue.is_finished(second.run_id)
+    assert work_queue.is_finished(first.run_id)
+
+
+def test_overlapping_shards_are_rejected(tmp_path):
+    data_dir = _make_data_dir(tmp_path, {"exam": 10})
+    work_queue = WorkQueue(tmp_path / "queue.db")
+    coordinator = Coordinator(work_queue, DataLoader(data_dir), run_id="run")
+    coordinator.submit(shard_size=5)
+
+    # 같은 실행을 다른 shard 크기로 이어가면 범위가 겹쳐 두 번 집계됨
+    with pytest.raises(ValueError, match="overlaps"):
+        Coordinator(work_queue, DataLoader(data_dir), run_id="run").submit(shard_size=4)
+    assert work_queue.counts("run")["pending"] == 2
+    # 같은 shard 크기로 재개하는 것은 허용
+    assert coordinator.submit(shard_size=5) == 0
+
+
+def test_old_schema_is_migrated(tmp_path):
+    db_path = tmp_path / "queue.db"
+    conn = sqlite3.connect(db_path)
+    conn.execute(
+        "CREATE TABLE units (id INTEGER PRIMARY KEY AUTOINCREMENT,"
+        " exam_name TEXT NOT NULL, start_num INTEGER NOT NULL,"
+        " end_num INTEGER NOT NULL, status TEXT NOT NULL DEFAULT 'pending',"
+        " worker_id TEXT, lease_expires REAL, attempts INTEGER NOT NULL DEFAULT 0,"
+        " result TEXT, error TEXT, UNIQUE (exam_name, start_num, end_num))"
+    )
+    conn.execute("INSERT INTO units (exam_name, start_num, end_num) VALUES ('e', 1, 5)")
+    conn.commit()
+    conn.close()
+
+    work_queue = WorkQueue(db_path)
+    assert work_queue.counts("")["pending"] == 1
+    assert work_queue.add_units([("e", 1, 5)], run_id="new") == 1
+
+
+def test_lost_lease_aborts_unit(tmp_path):
+    work_queue = WorkQueue(tmp_path / "queue.db", lease_timeout=5)
+    work_queue.add_units([("exam", 1, 5)])
+    worker = Worker(
+        work_queue, FakeProcessor(delay=10), worker_id="w", heartbeat_interval=0.05
+    )
+    unit = work_queue.lease("w")
+
+    outcome = []
+    thread = threading.Thread(target=lambda: outcome.append(worker.process_unit(unit)))
+    start = time.monotonic()
+    thread.start()
+    # 다른 worker가 unit을 이어받은 상황
+    with sqlite3.connect(work_queue.db_path) as conn:
+        conn.execute("UPDATE units SET worker_id = 'other' WHERE id = ?", (unit.id,))
+    thread.join(timeout=5)
+
+    assert outcome == [False]
+    assert time.monotonic() - start < 5
+
+
+def test_processor_skips_api_calls_once_cancelled(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "output_dir", tmp_path)
+    data_loader = MagicMock(spec=DataLoader)
+    data_loader.load_questions.return_value = [
+        Question(
+            id=f"Q{num}",
+            question="질문",
+            options=["1", "2", "3", "4", "5"],
+            correct_answer="1",
+        )
+        for num in range(1, 4)
+    ]
+    openai_client = MagicMock(spec=OpenAIClient)
+    cancel = threading.Event()
+    cancel.set()
+
+    with pytest.raises(ProcessingCancelled):
+        Processor(data_loader, openai_client).process_exam("exam", cancel=cancel)
+    openai_client.get_response.assert_not_called()